@@ -0,0 +1,47 @@
+import sys
+
+import pyperf
+
+
+from watch.builtins import (
+    Container, InstanceOf, Just, Mapping, Predicate, SubclassOf
+)
+from watch import WatchMe
+
+
+# a schema of a reasonable size, shared by all the classes created below
+record = Mapping(
+    InstanceOf(str),
+    InstanceOf(int, float) & ~Just(0) | Container(InstanceOf(str)) |
+    Mapping(InstanceOf(str), Container(InstanceOf(int) > 0))
+)
+
+
+def bench_small_class():
+    class Small(WatchMe):
+        name = InstanceOf(str)
+        size = InstanceOf(int) > 0
+
+
+def bench_large_schema():
+    class Large(WatchMe):
+        first = record
+        second = record
+        third = Container(record)
+        kind = SubclassOf(Exception) | Predicate(callable)
+
+
+def bench_thousand_classes():
+    for _ in range(1000):
+        class Generated(WatchMe):
+            value = record
+
+
+runner = pyperf.Runner()
+runner.bench_func("class creation: small class", bench_small_class)
+runner.bench_func("class creation: large schema", bench_large_schema)
+runner.bench_func("class creation: thousand classes", bench_thousand_classes)
+
+# import time is measured as a whole interpreter run, compare with the pivot
+runner.bench_command("import: watch", [sys.executable, "-c", "import watch"])
+runner.bench_command("import: no watch at all", [sys.executable, "-c", "pass"])
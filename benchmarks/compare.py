@@ -0,0 +1,75 @@
+"""Compares two result files of benchmarks/run.py and flags regressions.
+
+    python benchmarks/compare.py benchmarks/baselines/baseline.json \\
+        benchmarks/results.json --threshold 0.1
+
+Exits with 1 when any benchmark got slower by more than the threshold.
+"""
+
+import argparse
+import sys
+
+import pyperf
+
+
+def load(path):
+    return {
+        benchmark.get_name(): benchmark.median()
+        for benchmark in pyperf.BenchmarkSuite.load(path)
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return "%.2f %s" % (seconds / scale, unit)
+    return "%.0f ns" % (seconds / 1e-9)
+
+
+def compare(baseline, current, threshold):
+    """Yields (name, baseline, current, change, verdict) of benchmarks
+    found in both results, change is relative to the baseline.
+    """
+    for name in sorted(baseline.keys() & current.keys()):
+        change = current[name] / baseline[name] - 1
+        verdict = ""
+        if change > threshold:
+            verdict = "REGRESSION"
+        elif change < -threshold:
+            verdict = "faster"
+        yield name, baseline[name], current[name], change, verdict
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline", help="results to compare against")
+    parser.add_argument("current", help="fresh results")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="relative slowdown to flag, 0.1 means 10%% (default)"
+    )
+    arguments = parser.parse_args(argv)
+
+    baseline = load(arguments.baseline)
+    current = load(arguments.current)
+    regressions = 0
+    width = max(map(len, baseline.keys() | current.keys()), default=0)
+    for name, before, after, change, verdict in compare(
+        baseline, current, arguments.threshold
+    ):
+        regressions += verdict == "REGRESSION"
+        print("%-*s  %10s -> %10s  %+6.1f%%  %s" % (
+            width, name, format_time(before), format_time(after),
+            100 * change, verdict
+        ))
+    for name in sorted(baseline.keys() - current.keys()):
+        print("%-*s  missing in %s" % (width, name, arguments.current))
+    for name in sorted(current.keys() - baseline.keys()):
+        print("%-*s  new" % (width, name))
+
+    print("%d regressions" % regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import pyperf
+
+
+from watch.builtins import Container, InstanceOf
+from watch import WatchMe
+
+
+class Point(WatchMe):
+    x = InstanceOf(int)
+    y = InstanceOf(int)
+    tags = Container(InstanceOf(str))
+
+
+class InitPoint(WatchMe, init=True):
+    x = InstanceOf(int)
+    y = InstanceOf(int)
+    tags = Container(InstanceOf(str))
+
+
+class SlotsInitPoint(WatchMe, init=True, slots=True):
+    x = InstanceOf(int)
+    y = InstanceOf(int)
+    tags = Container(InstanceOf(str))
+
+
+class PlainPoint:
+
+    def __init__(self, x, y, tags):
+        self.x = x
+        self.y = y
+        self.tags = tags
+
+
+tags = ["a", "b"]
+
+
+def bench_setattrs():
+    point = Point()
+    point.x = 1
+    point.y = 2
+    point.tags = tags
+
+
+def bench_update():
+    Point().update(x=1, y=2, tags=tags)
+
+
+def bench_init(point_type):
+    point_type(1, 2, tags)
+
+
+def bench_failure():
+    try:
+        InitPoint(1, 2, [1])
+    except AttributeError:
+        pass
+
+
+runner = pyperf.Runner()
+runner.bench_func("construction: setattrs", bench_setattrs)
+runner.bench_func("construction: update", bench_update)
+runner.bench_func("construction: init", bench_init, InitPoint)
+runner.bench_func("construction: slots init", bench_init, SlotsInitPoint)
+runner.bench_func("construction: no watch at all", bench_init, PlainPoint)
+runner.bench_func("construction: failure", bench_failure)
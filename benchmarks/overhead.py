@@ -1,4 +1,4 @@
-import perf
+import pyperf
 
 
 from watch.builtins import InstanceOf, Container
@@ -9,16 +9,22 @@ class MyClass(WatchMe):
     value = Container(InstanceOf(str) >> InstanceOf(int))
 
 
+class MyClassNativeReads(WatchMe, native_reads=True):
+    value = Container(InstanceOf(str) >> InstanceOf(int))
+
+
 class MyClassNoWatch:
     pass
 
 
 controlled_instance = MyClass()
+native_instance = MyClassNativeReads()
 simple_instance = MyClassNoWatch()
 
 
 value = [{'a': 1, 'b': 2, 'c': 3, 'd': 4}]
 controlled_instance.value = value
+native_instance.value = value
 simple_instance.value = value
 
 
@@ -26,6 +32,14 @@ def bench_get():
     controlled_instance.value
 
 
+def bench_get_native():
+    native_instance.value
+
+
+def bench_set_native():
+    native_instance.value = value
+
+
 def bench_set():
     controlled_instance.value = value
 
@@ -38,7 +52,7 @@ def pivot_bench_get():
     simple_instance.value
 
 
-runner = perf.Runner()
+runner = pyperf.Runner()
 
 
 # Check with validation enabled
@@ -49,6 +63,9 @@ runner.bench_func("get: validation enabled", bench_get)
 WatchMe.keep_eye_on_me = False
 runner.bench_func("get: validation disabled", bench_get)
 
+# Check with native reads
+runner.bench_func("get: native reads", bench_get_native)
+
 # Check with validation disabled
 runner.bench_func("get: no watch at all", pivot_bench_get)
 
@@ -56,6 +73,9 @@ runner.bench_func("get: no watch at all", pivot_bench_get)
 WatchMe.keep_eye_on_me = True
 runner.bench_func("set: validation enabled", bench_set)
 
+# Check with native reads
+runner.bench_func("set: native reads", bench_set_native)
+
 # Check with validation disabled
 WatchMe.keep_eye_on_me = False
 runner.bench_func("set: validation disabled", bench_set)
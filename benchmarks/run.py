@@ -0,0 +1,58 @@
+"""Runs the whole benchmark suite and saves results as a single pyperf file.
+
+    python benchmarks/run.py               # benchmarks/results.json
+    python benchmarks/run.py --save NAME   # benchmarks/baselines/NAME.json
+    python benchmarks/run.py --fast        # extra args go to pyperf
+
+Compare two files with benchmarks/compare.py.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS = (
+    "validators.py", "scaling.py", "instances.py", "class_creation.py",
+    "overhead.py",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--save", metavar="NAME",
+        help="save results as benchmarks/baselines/NAME.json"
+    )
+    parser.add_argument(
+        "--output", default=os.path.join(HERE, "results.json"),
+        help="where to save results, unless --save is given"
+    )
+    arguments, pyperf_arguments = parser.parse_known_args()
+
+    output = arguments.output
+    if arguments.save:
+        output = os.path.join(HERE, "baselines", arguments.save + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    if os.path.exists(output):
+        # pyperf appends to existing files, that is not what we want
+        os.remove(output)
+
+    # benchmarks import watch from this very checkout
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.dirname(HERE), environment.get("PYTHONPATH")])
+    )
+    for script in SCRIPTS:
+        subprocess.run(
+            [sys.executable, os.path.join(HERE, script), "--append", output,
+             "--inherit-environ", "PYTHONPATH"] + pyperf_arguments,
+            env=environment, check=True
+        )
+    print("results are saved to %s" % output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import pyperf
+
+
+from watch.builtins import Container, HasAttr, InstanceOf, Just, Or
+from watch import WatchMe
+
+
+class Holder(WatchMe):
+    pass
+
+
+def bench_set(instance, name, value):
+    setattr(instance, name, value)
+
+
+def nested(depth):
+    validator, value = InstanceOf(int), 1
+    for _ in range(depth):
+        validator, value = Container(validator), [value]
+    return validator, value
+
+
+runner = pyperf.Runner()
+instance = Holder()
+cases = []
+
+for power in range(7):
+    size = 10 ** power
+    cases.append((
+        "container size: %d" % size,
+        Container(InstanceOf(int)), list(range(size))
+    ))
+
+for depth in (1, 2, 4, 8, 16):
+    validator, value = nested(depth)
+    cases.append(("nesting depth: %d" % depth, validator, value))
+
+for fan_out in (1, 4, 16, 64):
+    # HasAttr nodes are not merged by the optimizer, unlike InstanceOf
+    validator = Or(*(HasAttr("attribute_%d" % number) for number in range(
+        fan_out
+    )))
+    cases.append(("or fan-out: %d" % fan_out, validator | InstanceOf(int), 1))
+
+for power in range(7):
+    size = 10 ** power
+    cases.append(("just size: %d" % size, Just(*range(size)), size - 1))
+    cases.append((
+        "just compact size: %d" % size, Just(*range(size), compact=True),
+        size - 1
+    ))
+
+for number, (name, validator, value) in enumerate(cases):
+    field_name = "field_%d" % number
+    setattr(Holder, field_name, validator)
+    runner.bench_func(name, bench_set, instance, field_name, value)
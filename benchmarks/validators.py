@@ -0,0 +1,75 @@
+import pyperf
+
+
+from watch.builtins import (
+    Cached, Container, Deferred, GtEqThen, GtThen, HasAttr, InstanceOf, Just,
+    LtEqThen, LtThen, Mapping, Not, Nothing, Parallel, Predicate, Sampled,
+    SubclassOf, Whatever, Xor
+)
+from watch import WatchMe
+
+
+# validator -> (valid value, invalid value), None means there is no such
+# value for the validator
+VALIDATORS = {
+    "Predicate": (Predicate(callable), (len, 1)),
+    "Whatever": (Whatever, (1, None)),
+    "Nothing": (Nothing, (None, 1)),
+    "InstanceOf": (InstanceOf(int, float), (1, "1")),
+    "SubclassOf": (SubclassOf(Exception), (KeyError, int)),
+    "Not": (Not(InstanceOf(str)), (1, "1")),
+    "GtThen": (GtThen(0), (1, 0)),
+    "GtEqThen": (GtEqThen(0), (0, -1)),
+    "LtThen": (LtThen(0), (-1, 0)),
+    "LtEqThen": (LtEqThen(0), (0, 1)),
+    "HasAttr": (HasAttr("real"), (1, "1")),
+    "Container": (Container(InstanceOf(int)), ([1, 2, 3], [1, 2, "3"])),
+    "Mapping": (
+        Mapping(InstanceOf(str), InstanceOf(int)), ({"a": 1}, {"a": "1"})
+    ),
+    "Or": (InstanceOf(int) | HasAttr("keys"), ({}, "1")),
+    "And": (InstanceOf(int) & GtThen(0), (1, -1)),
+    "Xor": (Xor(InstanceOf(int), GtThen(0)), (-1, 1)),
+    "Just": (Just(*range(100)), (50, 500)),
+    "Cached": (
+        Cached(Container(InstanceOf(str))), (("a", "b"), ("a", 1))
+    ),
+    "Sampled": (
+        Sampled(Container(InstanceOf(int)), head=10, sample=10),
+        (list(range(1000)), ["0"] + list(range(999)))
+    ),
+    # values are queued and checked in the background, failures are dropped
+    "Deferred": (
+        Deferred(InstanceOf(int), on_failure=lambda *args: None), (1, None)
+    ),
+    "Parallel": (
+        Parallel(Container(InstanceOf(int))), ([1, 2, 3], [1, 2, "3"])
+    ),
+}
+
+
+class Holder(WatchMe):
+    pass
+
+
+def bench_set(instance, name, value):
+    setattr(instance, name, value)
+
+
+def bench_failure(instance, name, value):
+    try:
+        setattr(instance, name, value)
+    except AttributeError:
+        pass
+
+
+runner = pyperf.Runner()
+instance = Holder()
+for name, (validator, (valid, invalid)) in VALIDATORS.items():
+    setattr(Holder, name, validator)
+    if valid is not None:
+        runner.bench_func("set: %s" % name, bench_set, instance, name, valid)
+    if invalid is not None:
+        runner.bench_func(
+            "set failure: %s" % name, bench_failure, instance, name, invalid
+        )
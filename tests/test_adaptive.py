@@ -0,0 +1,96 @@
+import copy
+import threading
+
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import And, GtThen, HasAttr, InstanceOf, LtThen, Or
+
+
+def test_or_puts_the_most_likely_branch_first():
+    validator = Or(
+        InstanceOf(str), InstanceOf(bytes), HasAttr("keys"), InstanceOf(int),
+        adaptive=True, period=10
+    )
+    for number in range(30):
+        assert validator._check(number)
+    assert validator._check("text")
+    assert not validator._check(1.5)
+
+    statistics = validator.statistics()
+    assert statistics["order"][0] == 3
+    assert statistics["reorders"] == 3
+
+
+def test_and_puts_the_most_likely_failure_first():
+    validator = And(
+        HasAttr("real"), GtThen(0), LtThen(10), adaptive=True, period=10
+    )
+    for _ in range(10):
+        assert not validator._check(100)
+    assert validator.statistics()["order"] == [2, 0, 1]
+    # the verdicts stay the same whatever the order is
+    assert validator._check(5)
+    assert not validator._check(-1)
+
+
+def test_order_follows_the_traffic():
+    validator = Or(InstanceOf(str), InstanceOf(int), adaptive=True, period=10)
+    for _ in range(20):
+        validator._check(1)
+    assert validator.statistics()["order"] == [1, 0]
+    for _ in range(40):
+        validator._check("1")
+    assert validator.statistics()["order"] == [0, 1]
+
+
+def test_adaptive_nodes_are_kept_whole():
+    adaptive = Or(InstanceOf(str), InstanceOf(int), adaptive=True)
+    combined = adaptive | InstanceOf(bytes)
+    assert combined.combined_from[0] is adaptive
+    assert not combined.adaptive
+
+    assert adaptive != Or(InstanceOf(str), InstanceOf(int), adaptive=True)
+    assert Or(InstanceOf(str)).statistics() is None
+
+
+def test_fields_rank_on_their_own():
+    validator = Or(InstanceOf(str), InstanceOf(int), adaptive=True, period=1)
+
+    class Record(WatchMe):
+        first = validator
+        second = validator
+
+    record = Record()
+    record.first = 1
+    record.first = 2
+    assert Record.first.statistics()["order"] == [1, 0]
+    assert Record.second.statistics()["order"] == [0, 1]
+    with py.test.raises(AttributeError):
+        record.second = 1.5
+
+    clone = copy.deepcopy(Record.first)
+    assert clone.statistics()["order"] == [0, 1]
+
+
+def test_threads():
+    validator = Or(
+        InstanceOf(str), InstanceOf(bytes), InstanceOf(int),
+        adaptive=True, period=7
+    )
+    failures = []
+
+    def check():
+        for number in range(2000):
+            value = number if number % 3 else str(number)
+            if not validator._check(value) or validator._check(1.5):
+                failures.append(value)
+
+    threads = [threading.Thread(target=check) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert failures == []
+    assert validator.statistics()["order"][0] == 2
@@ -2,7 +2,9 @@ import pytest
 
 
 from watch import WatchMe
-from watch.builtins import Container, Predicate, Mapping, Or, And, InstanceOf
+from watch.builtins import (
+    Cached, Container, Predicate, Mapping, Or, And, InstanceOf, Sampled
+)
 
 
 def test_attr_simple():
@@ -258,3 +260,62 @@ def test_desctiptor_field_names():
     assert A.foo.field_name == "foo"
     assert B.bar.field_name == "bar"
 
+
+def test_validator_trees_are_shared():
+    schema = Mapping(InstanceOf(str), Container(InstanceOf(int)))
+
+    class A(WatchMe):
+        foo = schema
+
+    class B(WatchMe):
+        bar = schema
+        baz = schema
+
+    # only the top node is copied to carry the binding
+    assert A.foo is not schema and B.bar is not B.baz
+    assert A.foo.keys is schema.keys
+    assert B.baz.values is schema.values
+    assert (A.foo.field_name, B.bar.field_name) == ("foo", "bar")
+
+    instance = B()
+    instance.baz = {"a": [1, 2]}
+    with pytest.raises(AttributeError):
+        instance.bar = {"a": ["b"]}
+
+
+def test_fields_do_not_inherit_state_of_used_validators():
+    sampled = Sampled(InstanceOf(int), every=2)
+    cached = Cached(Container(InstanceOf(int)))
+    adaptive = Or(InstanceOf(str), InstanceOf(int), adaptive=True)
+    # compiled and hashed before being bound
+    sampled._check(1)
+    cached._check((1,))
+    adaptive._check(1)
+    hash(cached)
+
+    class A(WatchMe):
+        foo = sampled
+        bar = cached
+        baz = adaptive
+
+    class B(WatchMe):
+        bar = cached
+        baz = adaptive
+
+    a, b = A(), B()
+    for number in range(10):
+        a.foo = number
+    assert A.foo.statistics()["checks"] == 10
+    assert sampled.statistics()["checks"] == 1
+
+    value = (1,)
+    a.bar = value
+    assert A.bar.cache_info().misses == 1
+    assert B.bar.cache_info().misses == 0
+    b.bar = value
+    assert B.bar.cache_info().misses == 1
+    assert A.bar != B.bar and hash(A.bar) != hash(cached)
+
+    a.baz = 1
+    assert sum(A.baz.statistics()["hits"]) == 1
+    assert sum(B.baz.statistics()["hits"]) == 0
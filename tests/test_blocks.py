@@ -0,0 +1,122 @@
+from array import array
+from itertools import product
+
+
+import py.test
+
+
+import watch
+from watch.blocks import as_block
+from watch.builtins import (
+    Container, InstanceOf, Just, Not, GtThen, LtThen, Predicate
+)
+
+
+ITEMS = [
+    InstanceOf(int),
+    InstanceOf(float),
+    InstanceOf(str),
+    ~InstanceOf(str),
+    InstanceOf(int) > 0,
+    (InstanceOf(int) >= 0) <= 255,
+    (InstanceOf(float) > 0) < 100,
+    GtThen(-1) & LtThen(10),
+    Just(*range(10)),
+    Just(*range(10), compact=True),
+    InstanceOf(str) | (InstanceOf(int) < 256),
+    Not(Just(5)),
+    Predicate(lambda value: value != 7),
+]
+
+
+BLOCKS = [
+    range(10),
+    range(0),
+    range(100, 0, -3),
+    range(-5, 5),
+    b"hello",
+    bytearray(b"\x00\x01\x02"),
+    b"",
+    "hello",
+    array("i", [1, 2, 3]),
+    array("i"),
+    array("d", [1.0, 2.5, 99.0]),
+    array("d", [1.0, float("nan")]),
+    memoryview(b"\x05\x06"),
+    memoryview(array("q", [-1, 0, 1])),
+    memoryview(array("d", [0.5, 1.5])),
+]
+
+
+@py.test.mark.parametrize("items,value", list(product(ITEMS, BLOCKS)))
+def test_blocks_agree_with_iteration(items, value):
+    validator = Container(items)
+    compiled = watch.compile(validator)
+    try:
+        expected = validator.predicate(list(value))
+    except TypeError:
+        # e.g. comparing strings to ints
+        with py.test.raises(TypeError):
+            validator.predicate(value)
+        with py.test.raises(TypeError):
+            compiled(value)
+    else:
+        assert validator.predicate(value) == expected
+        assert bool(compiled(value)) == expected
+
+
+def test_range_is_checked_without_iteration():
+    huge = range(10 ** 18)
+    assert Container(InstanceOf(int) >= 0).predicate(huge)
+    assert not Container((InstanceOf(int) >= 0) < 100).predicate(huge)
+    assert not Container(Just(1, 2, 3)).predicate(huge)
+
+
+def test_not_a_block():
+    assert as_block([1, 2, 3]) is None
+    assert as_block(memoryview(b"abcd").cast("B", shape=[2, 2])) is None
+
+
+def test_numpy_arrays():
+    numpy = py.test.importorskip("numpy")
+
+    floats = numpy.linspace(1, 10, 1000)
+    assert Container(InstanceOf(float) > 0).predicate(floats)
+    assert not Container(InstanceOf(float) > 1).predicate(floats)
+
+    floats[10] = numpy.nan
+    assert not Container(InstanceOf(float) > 0).predicate(floats)
+
+    # iterating over int64 array gives numpy.int64, which is not int
+    ints = numpy.arange(10)
+    assert not Container(InstanceOf(int)).predicate(ints)
+    assert Container(InstanceOf(numpy.integer) >= 0).predicate(ints)
+    assert Container(Just(*range(10))).predicate(ints)
+    assert not Container(Just(*range(9))).predicate(ints)
+
+    for validator in (
+        Container(InstanceOf(float) > 0),
+        Container(Just(*range(10))),
+    ):
+        for value in (floats, ints):
+            assert (
+                bool(watch.compile(validator)(value)) ==
+                validator.predicate(list(value))
+            )
+
+
+class EvenMeta(type):
+    def __instancecheck__(cls, value):
+        return isinstance(value, int) and not value % 2
+
+
+class Even(metaclass=EvenMeta):
+    pass
+
+
+def test_blocks_of_types_checking_values_themselves():
+    assert Container(InstanceOf(Even)).predicate(range(0, 10, 2))
+    assert not Container(InstanceOf(Even)).predicate(range(0, 10))
+    assert Container(InstanceOf(Even))._check(range(0, 10, 2))
+    assert not Container(~InstanceOf(Even)).predicate(range(0, 10, 2))
+    assert Container(~InstanceOf(Even)).predicate(range(1, 10, 2))
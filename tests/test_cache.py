@@ -0,0 +1,119 @@
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import Cached, Container, InstanceOf, Predicate
+from watch.cache import is_deeply_immutable
+
+
+def counting(validator):
+    calls = []
+
+    def predicate(value):
+        calls.append(value)
+        return validator.predicate(value)
+
+    return Predicate(predicate), calls
+
+
+def test_immutable_values_are_checked_once():
+    inner, calls = counting(
+        Container(InstanceOf(str) | Container(InstanceOf(str)))
+    )
+
+    class Config(WatchMe):
+        names = Cached(inner)
+
+    config = Config()
+    names = ("a", "b", ("c",))
+    for _ in range(10):
+        config.names = names
+    assert len(calls) == 1
+    assert Config.names.cache_info().hits == 9
+    assert Config.names.cache_info().misses == 1
+
+    # failures are cached as well
+    bad = ("a", 1)
+    for _ in range(3):
+        with py.test.raises(AttributeError):
+            config.names = bad
+    assert len(calls) == 2
+
+
+def test_mutable_values_are_not_cached():
+    inner, calls = counting(
+        Container(InstanceOf(str) | Container(InstanceOf(str)))
+    )
+    validator = Cached(inner)
+
+    names = ["a", "b"]
+    assert validator.predicate(names)
+    names.append(1)
+    assert not validator.predicate(names)
+    assert validator.predicate(("a", ["b"]))
+    assert validator.predicate(("a", ["b"]))
+    assert len(calls) == 4
+    assert validator.cache_info().currsize == 0
+
+
+def test_lru_eviction():
+    inner, calls = counting(InstanceOf(tuple))
+    validator = Cached(inner, maxsize=2)
+    first, second, third = (1,), (2,), (3,)
+
+    for value in (first, second, first, third):
+        validator.predicate(value)
+
+    # second was the least recently used one
+    assert validator.cache_info().currsize == 2
+    validator.predicate(first)
+    validator.predicate(second)
+    assert calls == [first, second, third, second]
+
+
+def test_each_class_gets_own_cache():
+
+    class A(WatchMe):
+        foo = Cached(InstanceOf(tuple))
+
+    class B(WatchMe):
+        foo = A.foo
+
+    A().foo = ()
+    assert A.foo.cache_info().currsize == 1
+    assert B.foo.cache_info().currsize == 0
+
+
+def test_proxies_and_streams_of_the_inner_validator():
+
+    class A(WatchMe):
+        items = Cached(Container(InstanceOf(int), proxy=True))
+        stream = Cached(Container(InstanceOf(int), lazy=True))
+
+    a = A()
+    a.items = [1]
+    a.items.append(2)
+    with py.test.raises(AttributeError):
+        a.items.append("x")
+    assert a.items == [1, 2]
+
+    a.stream = iter([1, "two"])
+    assert next(a.stream) == 1
+    with py.test.raises(AttributeError):
+        next(a.stream)
+
+
+@py.test.mark.parametrize(
+    "value,expected",
+    [
+        (1, True),
+        ("hello", True),
+        ((1, ("a", frozenset([b"b", None]))), True),
+        ([], False),
+        ((1, [2]), False),
+        (frozenset([(1, 2)]), True),
+        (object(), False),
+    ]
+)
+def test_is_deeply_immutable(value, expected):
+    assert is_deeply_immutable(value) == expected
@@ -0,0 +1,141 @@
+import io
+import json
+
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import Container, GtThen, InstanceOf
+from watch.cli import main, read_chunks
+
+
+class Row(WatchMe):
+    id = InstanceOf(int)
+    name = InstanceOf(str)
+    tags = Container(InstanceOf(str), container=list)
+
+
+class StrictRow(WatchMe, init=True):
+    id = InstanceOf(int)
+    name = InstanceOf(str)
+
+
+class Positive(WatchMe):
+    id = GtThen(0)
+
+
+def write_lines(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return str(path)
+
+
+def run(*argv):
+    output = io.StringIO()
+    code = main(list(argv), output)
+    return code, output.getvalue().splitlines()
+
+
+@py.test.mark.parametrize("workers", ["1", "2"])
+@py.test.mark.parametrize("block_size", ["16", "4096"])
+def test_failing_lines_are_reported(tmp_path, workers, block_size):
+    rows = [{"id": number, "name": "n", "tags": ["a"]} for number in range(50)]
+    rows[3]["id"] = "three"
+    rows[40]["tags"] = ["a", 1]
+    path = write_lines(tmp_path / "data.jsonl", rows)
+
+    code, lines = run(
+        "validate", "test_cli:Row", path,
+        "--workers", workers, "--block-size", block_size
+    )
+    assert code == 1
+    assert lines[:2] == [
+        "%s:4: field 'id' does not accept 'three'" % path,
+        "%s:41: field 'tags' does not accept ['a', 1]" % path,
+    ]
+    assert lines[2].startswith("50 rows, 2 failures")
+
+
+def test_valid_file(tmp_path):
+    rows = [{"id": number, "name": "n", "extra": None} for number in range(5)]
+    path = write_lines(tmp_path / "data.jsonl", rows)
+    code, lines = run("validate", "test_cli:Row", path, "--workers", "1")
+    assert code == 0
+    assert lines[0].startswith("5 rows, 0 failures")
+
+
+def test_bad_rows_and_missing_fields(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": 1}\n\n[1, 2]\n{"id": 2, "name": "x"}\n{oops\n')
+    code, lines = run(
+        "validate", "test_cli:StrictRow", str(path), "--workers", "1"
+    )
+    assert code == 1
+    assert [line.split(":", 1)[1] for line in lines[:3]] == [
+        "1: field 'name' is missing",
+        "3: can not parse the row: not an object",
+        "5: can not parse the row: Expecting property name enclosed in "
+        "double quotes: line 1 column 2 (char 1)",
+    ]
+
+
+def test_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text('id,name\n1,foo\nx,"a,b"\n3,4\n')
+    code, lines = run("validate", "test_cli:Row", str(path), "--workers", "1")
+    assert lines[:2] == [
+        "%s:3: field 'id' does not accept 'x'" % path,
+        "%s:4: field 'name' does not accept 4" % path,
+    ]
+    assert lines[2].startswith("3 rows, 2 failures")
+
+
+def test_checks_that_raise_are_reported(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id\n1\nabc\n-1\n")
+    code, lines = run(
+        "validate", "test_cli:Positive", str(path), "--workers", "1"
+    )
+    assert code == 1
+    assert lines[:2] == [
+        "%s:3: field 'id' fails on 'abc' with TypeError: '>' not supported "
+        "between instances of 'str' and 'int'" % path,
+        "%s:4: field 'id' does not accept -1" % path,
+    ]
+    assert lines[2].startswith("3 rows, 2 failures")
+
+
+def test_bench_only_reports_throughput(tmp_path):
+    rows = [{"id": "bad"}] * 10
+    path = write_lines(tmp_path / "data.jsonl", rows)
+    code, lines = run(
+        "validate", "test_cli:Row", path, "--workers", "1", "--bench"
+    )
+    assert code == 0
+    assert len(lines) == 1
+    assert lines[0].endswith("rows/s")
+
+
+def test_max_failures(tmp_path):
+    rows = [{"id": "bad"}] * 10
+    path = write_lines(tmp_path / "data.jsonl", rows)
+    code, lines = run(
+        "validate", "test_cli:Row", path, "--workers", "1",
+        "--max-failures", "3"
+    )
+    assert len(lines) == 4
+    assert lines[-1].startswith("10 rows, 10 failures")
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text("")
+    code, lines = run("validate", "test_cli:Row", str(path))
+    assert code == 0
+    assert lines[0].startswith("0 rows, 0 failures")
+
+
+def test_read_chunks_keeps_lines_whole():
+    stream = io.BytesIO(b"first\nsecond line\nthird")
+    chunks = list(read_chunks(stream, 4))
+    assert b"".join(chunks) == b"first\nsecond line\nthird"
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
@@ -0,0 +1,42 @@
+import py.test
+
+
+import watch
+from watch.builtins import Container, InstanceOf, Predicate
+
+
+from test_validators import CASES, MAGIC_CASES, cases
+
+
+@py.test.mark.parametrize(
+    "validator,value_to_test,expected_result", cases(CASES, MAGIC_CASES)
+)
+def test_compiled_matches_predicate(validator, value_to_test, expected_result):
+    assert bool(watch.compile(validator())(value_to_test)) == expected_result
+
+
+def test_unknown_nodes_are_called_as_is():
+    calls = []
+
+    def remember(value):
+        calls.append(value)
+        return True
+
+    check = watch.compile(Container(Predicate(remember)))
+    assert check([1, 2, 3])
+    assert calls == [1, 2, 3]
+
+
+def test_descriptor_uses_compiled_check():
+
+    class MyClass(watch.WatchMe):
+        foo = Container(InstanceOf(str) >> InstanceOf(int))
+
+    instance = MyClass()
+    instance.foo = [{"a": 1}]
+
+    # the tree gets compiled on the first assignment
+    assert hasattr(MyClass.foo._check, "__source__")
+
+    with py.test.raises(AttributeError):
+        instance.foo = [{"a": "b"}]
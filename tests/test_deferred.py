@@ -0,0 +1,115 @@
+import logging
+import threading
+
+import py.test
+
+
+import watch
+from watch import WatchMe
+from watch.builtins import Container, Deferred, InstanceOf, Predicate
+from watch.deferred import Worker
+
+
+def test_values_are_stored_right_away_and_checked_later():
+    failures = []
+
+    def on_failure(instance, field_name, value):
+        failures.append((instance, field_name, value))
+
+    class Telemetry(WatchMe):
+        latency = Deferred(InstanceOf(float), on_failure=on_failure)
+
+    telemetry = Telemetry()
+    telemetry.latency = 0.5
+    telemetry.latency = "slow"
+    # nothing raised, the value is there
+    assert telemetry.latency == "slow"
+
+    assert watch.flush(timeout=5)
+    assert failures == [(telemetry, "latency", "slow")]
+
+
+def test_failures_are_logged_by_default(caplog):
+    class Telemetry(WatchMe):
+        samples = Deferred(Container(InstanceOf(int)))
+
+    telemetry = Telemetry()
+    with caplog.at_level(logging.ERROR, logger="watch"):
+        telemetry.samples = [1, 2, "three"]
+        assert watch.flush(timeout=5)
+    assert "samples" in caplog.text
+
+
+def test_disabled_instances_are_not_checked():
+    failures = []
+
+    class Telemetry(WatchMe):
+        latency = Deferred(
+            InstanceOf(float), on_failure=lambda *args: failures.append(args)
+        )
+
+    telemetry = Telemetry()
+    telemetry.keep_eye_on_me = False
+    telemetry.latency = "slow"
+    assert watch.flush(timeout=5)
+    assert failures == []
+
+
+def test_broken_handler_does_not_kill_the_worker():
+    def on_failure(instance, field_name, value):
+        raise RuntimeError("oops")
+
+    class Telemetry(WatchMe):
+        latency = Deferred(InstanceOf(float), on_failure=on_failure)
+
+    telemetry = Telemetry()
+    telemetry.latency = "slow"
+    telemetry.latency = "slower"
+    assert watch.flush(timeout=5)
+    assert watch.deferred.worker.thread.is_alive()
+
+
+def test_backpressure_and_metrics():
+    worker = Worker(maxsize=2, batch_size=1)
+    release = threading.Event()
+    validator = Deferred(Predicate(lambda value: release.wait() or True))
+    validator.field_name = "value"
+
+    class Instance:
+        pass
+
+    # the first item is taken by the worker and blocks there
+    worker.submit(validator, Instance(), 1)
+    worker.submit(validator, Instance(), 2)
+    worker.submit(validator, Instance(), 3)
+    assert not worker.flush(timeout=0.05)
+    assert worker.metrics()["depth"] <= 2
+
+    # the queue is full, so the next submit has to wait
+    submitted = threading.Event()
+    threading.Thread(
+        target=lambda: (worker.submit(validator, Instance(), 4),
+                        submitted.set()),
+        daemon=True,
+    ).start()
+    assert not submitted.wait(0.05)
+
+    release.set()
+    assert submitted.wait(5)
+    assert worker.flush(timeout=5)
+    metrics = worker.metrics()
+    assert metrics["depth"] == 0
+    assert metrics["checked"] == 4
+    assert metrics["failures"] == 0
+    assert metrics["max_lag"] > 0
+
+
+def test_direct_predicate_is_synchronous():
+    validator = Deferred(InstanceOf(int))
+    assert validator.predicate(1)
+    assert not validator.predicate("one")
+
+
+def test_on_failure_must_be_callable():
+    with py.test.raises(AttributeError):
+        Deferred(InstanceOf(int), on_failure=42)
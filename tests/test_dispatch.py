@@ -0,0 +1,127 @@
+import abc
+from collections.abc import Mapping as MappingABC
+
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import (
+    And, Container, GtThen, InstanceOf, Just, Mapping, Or, Predicate,
+    SubclassOf, Whatever
+)
+from watch.dispatch import guard
+
+
+class Tagged(abc.ABC):
+    def __iter__(self):
+        return iter(())
+
+
+class Plain:
+    def __iter__(self):
+        return iter(())
+
+
+calls = []
+
+
+def counted(value):
+    calls.append(value)
+    return True
+
+
+def union():
+    return Or(
+        InstanceOf(int) & GtThen(0),
+        Container(InstanceOf(str), container=list),
+        Container(InstanceOf(int), container=tuple),
+        InstanceOf(str) >> Whatever,
+        And(InstanceOf(bytes), Predicate(counted)),
+        SubclassOf(Exception),
+        Container(container=Tagged),
+        Just(1.5),
+    )
+
+
+class Record(WatchMe):
+    value = union()
+
+
+@py.test.mark.parametrize("value", [
+    1, -1, ["a"], [1], ("a",), (1,), {"a": 1}, {1: 1}, b"", KeyError, int,
+    1.5, 2.5, None, Tagged(), object(),
+])
+def test_same_verdicts_as_plain_or(value):
+    validator = union()
+    assert bool(validator._check(value)) == bool(validator.predicate(value))
+
+
+def test_guards():
+    assert guard(InstanceOf(int, str)) == (int, str)
+    assert guard(InstanceOf(int) & GtThen(0)) == (int,)
+    assert guard(Mapping(InstanceOf(str))) == (MappingABC,)
+    assert guard(InstanceOf(int) | Container(container=list)) == (int, list)
+    assert guard(InstanceOf(int) | Just(1.5)) is None
+    assert guard(GtThen(0)) is None
+
+
+def test_only_branches_of_the_type_are_tried():
+    calls.clear()
+    record = Record()
+    record.value = 1
+    record.value = ["a"]
+    with py.test.raises(AttributeError):
+        record.value = "text"
+    assert calls == []
+    record.value = b"bytes"
+    assert calls == [b"bytes"]
+
+
+def test_abc_registered_later():
+    record = Record()
+    with py.test.raises(AttributeError):
+        record.value = Plain()
+    Tagged.register(Plain)
+    record.value = Plain()
+
+
+def test_objects_faking_their_class():
+    class Fake:
+        @property
+        def __class__(self):
+            return int
+
+    fake = Fake()
+    assert isinstance(fake, int)
+    validator = Or(
+        InstanceOf(int), Container(container=list),
+        Container(container=tuple), Container(container=set),
+        Mapping(), SubclassOf(Exception),
+    )
+    assert validator._check(fake)
+
+
+class EvenMeta(type):
+    def __instancecheck__(cls, value):
+        return isinstance(value, int) and not value % 2
+
+
+class Even(metaclass=EvenMeta):
+    pass
+
+
+def test_types_checking_values_themselves_are_not_dispatched_on():
+    assert guard(InstanceOf(Even)) is None
+    assert guard(InstanceOf(Even) & GtThen(0)) is None
+    validator = Or(
+        InstanceOf(Even), Container(InstanceOf(str), container=list),
+        Container(container=tuple), Container(container=set),
+        Mapping(), SubclassOf(Exception), InstanceOf(bytes),
+    )
+    assert validator._check(4)
+    assert not validator._check(3)
+
+    class Holder(WatchMe):
+        value = validator
+
+    Holder().value = 4
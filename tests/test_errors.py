@@ -0,0 +1,123 @@
+import pickle
+
+import py.test
+
+
+import watch
+from watch import ValidationError, WatchMe
+from watch.builtins import (
+    Cached, Container, InstanceOf, Just, Mapping, Predicate
+)
+
+
+class Report(WatchMe):
+    rows = Container(Mapping(InstanceOf(str), InstanceOf(int)))
+    count = InstanceOf(int) & Predicate(lambda value: value > 0)
+    tags = Cached(Container(InstanceOf(str), container=tuple))
+
+
+class Point(WatchMe):
+    x = InstanceOf(int)
+
+
+def test_error_carries_everything():
+    report = Report()
+    rows = [{"count": 1}] * 1023 + [{"count": "many"}]
+    with py.test.raises(ValidationError) as error:
+        report.rows = rows
+    assert isinstance(error.value, AttributeError)
+    assert error.value.instance is report
+    assert error.value.field_name == "rows"
+    assert error.value.value is rows
+    assert error.value.validator is Report.rows
+    assert error.value.path == (1023, "count")
+    assert error.value.part == "many"
+
+
+def test_message_is_short_and_points_at_the_failure():
+    report = Report()
+    with py.test.raises(ValidationError) as error:
+        report.rows = [{"count": 1}] * 10 ** 6 + [{"count": "many"}]
+    message = str(error.value)
+    assert len(message) < 300
+    assert message.endswith(
+        "Failed at rows[1000000]['count'], which is 'many'."
+    )
+
+
+def test_failing_keys_and_wrappers():
+    report = Report()
+    with py.test.raises(ValidationError) as error:
+        report.rows = [{1: 1}]
+    assert (error.value.path, error.value.part) == ((0, 1), 1)
+
+    with py.test.raises(ValidationError) as error:
+        report.tags = ("a", "b", 3)
+    assert (error.value.path, error.value.part) == ((2,), 3)
+
+
+def test_values_failing_as_a_whole_have_no_path():
+    report = Report()
+    with py.test.raises(ValidationError) as error:
+        report.count = -1
+    assert error.value.path == ()
+    assert error.value.part == -1
+    assert str(error.value).endswith("to be -1.")
+
+    with py.test.raises(ValidationError) as error:
+        report.rows = 42
+    assert error.value.path == ()
+
+
+def test_path_is_only_located_when_asked_for():
+    located = []
+
+    class Tracked(Container):
+        def locate_failure(self, value):
+            located.append(value)
+            return super().locate_failure(value)
+
+    class Holder(WatchMe):
+        items = Tracked(InstanceOf(int))
+
+    holder = Holder()
+    with py.test.raises(ValidationError) as error:
+        holder.items = [1, "2"]
+    assert located == []
+    assert error.value.path == (1,)
+    str(error.value)
+    assert located == [[1, "2"]]
+
+
+def test_custom_messages_and_pickling():
+    class Custom(WatchMe):
+        value = InstanceOf(int)
+
+        def generate_error_message(self, field_name, value):
+            return "bad %s" % field_name
+
+    with py.test.raises(ValidationError) as error:
+        Custom().value = "x"
+    assert str(error.value) == "bad value"
+
+    with py.test.raises(ValidationError) as error:
+        Point().x = "x"
+    copied = pickle.loads(pickle.dumps(error.value))
+    assert (copied.field_name, copied.value) == ("x", "x")
+
+
+def test_message_is_in_args_and_repr():
+    with py.test.raises(ValidationError) as error:
+        Point().x = "x"
+    message = str(error.value)
+    assert message.startswith("watch: Failed to set attribute")
+    assert error.value.args == (message,)
+    assert repr(error.value) == "ValidationError(%r)" % message
+    assert "%r" % error.value == repr(error.value)
+
+
+def test_bad_validator_arguments():
+    with py.test.raises(ValidationError) as error:
+        Just()
+    assert error.value.field_name == "test_against"
+    assert watch.ValidationError is ValidationError
@@ -0,0 +1,78 @@
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import InstanceOf, Container
+from watch.proxies import WatchedList
+
+
+class Point(WatchMe, init=True):
+    x = InstanceOf(int)
+    y = InstanceOf(int)
+
+
+class Point3D(Point):
+    z = InstanceOf(int)
+
+
+class Tagged(WatchMe, init=True, slots=True):
+    name = InstanceOf(str)
+    tags = Container(InstanceOf(str), proxy=True)
+
+
+class Custom(WatchMe, init=True):
+    x = InstanceOf(int)
+
+    def __init__(self):
+        self.x = 42
+
+
+def test_generated_init():
+    point = Point(1, y=2)
+    assert (point.x, point.y) == (1, 2)
+
+    point = Point3D(1, 2, 3)
+    assert (point.x, point.y, point.z) == (1, 2, 3)
+
+    with py.test.raises(TypeError):
+        Point(1)
+
+
+def test_init_is_all_or_nothing():
+    committed = []
+
+    class Logged(Point):
+        def complain(self, field_name, value):
+            committed.append(dict(self.__dict__))
+
+    Logged(1, "hello")
+    assert committed == [{}]
+
+    with py.test.raises(AttributeError):
+        Point("hello", 2)
+
+
+def test_init_with_slots_and_proxies():
+    tagged = Tagged("hello", ["a"])
+    assert type(tagged.tags) is WatchedList
+
+    with py.test.raises(AttributeError):
+        tagged.tags.append(1)
+
+
+def test_own_init_is_kept():
+    assert Custom().x == 42
+
+
+def test_update():
+    point = Point(1, 2)
+    point.update(x=10, y=20, label="hello")
+    assert (point.x, point.y, point.label) == (10, 20, "hello")
+
+    with py.test.raises(AttributeError):
+        point.update(x=100, y="hello")
+    assert (point.x, point.y) == (10, 20)
+
+    point.keep_eye_on_me = False
+    point.update(y="hello")
+    assert point.y == "hello"
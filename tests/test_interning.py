@@ -0,0 +1,97 @@
+import copy
+import gc
+import pickle
+import weakref
+
+import py.test
+
+
+import watch
+from watch import WatchMe
+from watch.builtins import (
+    Cached, Container, InstanceOf, Just, Mapping, Predicate, Sampled
+)
+from watch.interning import TABLE
+
+
+def test_structural_equality():
+    schema = InstanceOf(str) >> InstanceOf(int)
+    assert schema == InstanceOf(str) >> InstanceOf(int)
+    assert InstanceOf(int) | Just(1, 2) == InstanceOf(int) | Just(1, 2)
+    assert Just(1, 2, compact=True) == Just(2, 1, compact=True)
+    assert InstanceOf(int) != InstanceOf(str)
+    assert InstanceOf(int) | Just(1) != InstanceOf(int) & Just(1)
+    assert Container(InstanceOf(int)) != Container(InstanceOf(int), lazy=True)
+    assert InstanceOf(int) != int
+
+    schemas = {Container(InstanceOf(str)), Container(InstanceOf(str))}
+    assert len(schemas) == 1
+
+
+def test_unhashable_and_stateful_validators_are_only_equal_to_themselves():
+    unhashable = Just([1])
+    assert unhashable == unhashable
+    assert unhashable != Just([1])
+
+    cached = Cached(InstanceOf(int))
+    assert cached == cached
+    assert cached != Cached(InstanceOf(int))
+    assert Sampled(InstanceOf(int)) != Sampled(InstanceOf(int))
+
+
+def test_validators_are_immutable():
+    validator = Container(InstanceOf(int))
+    with py.test.raises(AttributeError):
+        validator.items = InstanceOf(str)
+    with py.test.raises(AttributeError):
+        copy.deepcopy(validator).items = InstanceOf(str)
+    with py.test.raises(AttributeError):
+        pickle.loads(pickle.dumps(validator)).items = InstanceOf(str)
+    assert validator.items == InstanceOf(int)
+
+    union = InstanceOf(int) | Just(1)
+    hash(union)
+    with py.test.raises(AttributeError):
+        union.combined_from.append(Just(2))
+    assert union == InstanceOf(int) | Just(1)
+
+
+def test_fields_are_equal_to_their_validators():
+    class Slotted(WatchMe, slots=True):
+        value = InstanceOf(int)
+
+    class Plain(WatchMe):
+        value = InstanceOf(int)
+
+    assert Slotted.value == Plain.value == InstanceOf(int)
+
+
+def test_intern():
+    first = Container(InstanceOf(str) >> InstanceOf(int))
+    second = Container(InstanceOf(str) >> InstanceOf(int))
+    assert watch.intern(first) is first
+    assert watch.intern(second) is first
+
+    third = Mapping(
+        InstanceOf(str), Container(InstanceOf(str) >> InstanceOf(int))
+    )
+    assert watch.intern(third).values is first
+    assert watch.intern(InstanceOf(str)) is first.items.keys
+
+
+def test_interned_validators_are_dropped_when_unused():
+    schema = watch.intern(Container(InstanceOf(bytes) >> InstanceOf(float)))
+    pair = weakref.ref(schema.items)
+    size = len(TABLE)
+    del schema
+    gc.collect()
+    assert pair() is None
+    assert len(TABLE) == size - 4
+
+
+def test_equal_trees_share_compiled_code():
+    is_positive = Predicate(lambda value: value > 0)
+    first = Container(InstanceOf(int) & is_positive)
+    second = Container(InstanceOf(int) & is_positive)
+    assert first._compiled() is second._compiled()
+    assert first._compiled() is not Container(InstanceOf(int))._compiled()
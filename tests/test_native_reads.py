@@ -0,0 +1,128 @@
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import InstanceOf, Container
+
+
+class Record(WatchMe, native_reads=True):
+    name = InstanceOf(str)
+    tags = Container(InstanceOf(str), proxy=True)
+
+
+class Child(Record):
+    age = InstanceOf(int)
+
+
+class Slotted(WatchMe, native_reads=True, slots=True):
+    name = InstanceOf(str)
+
+
+class Mixin:
+
+    def __setattr__(self, attr, value):
+        super().__setattr__("checkpoint", attr)
+        super().__setattr__(attr, value)
+
+
+def test_values_are_plain_attributes():
+    record = Record()
+    record.name = "hello"
+    assert record.__dict__["name"] == "hello"
+    assert "name" not in Record.__dict__
+    assert set(Record.__watched__) == {"name", "tags"}
+
+    with py.test.raises(AttributeError):
+        record.name = 10
+    assert record.name == "hello"
+
+    # the rest of the attributes are not affected at all
+    record.other = 10
+    assert record.other == 10
+
+
+def test_field_features_are_kept():
+    record = Record()
+    record.tags = ["a"]
+    with py.test.raises(AttributeError):
+        record.tags.append(1)
+
+    record.keep_eye_on_me = False
+    record.name = 10
+    assert record.name == 10
+
+
+def test_inheritance():
+    child = Child()
+    child.name = "hello"
+    child.age = 10
+    assert child.__dict__ == {"name": "hello", "age": 10}
+
+    with py.test.raises(AttributeError):
+        child.name = 10
+
+    with py.test.raises(AttributeError):
+        child.age = "hello"
+
+
+def test_slots():
+    slotted = Slotted()
+    slotted.name = "hello"
+    assert slotted.name == "hello"
+    assert not hasattr(slotted, "__dict__")
+
+    with py.test.raises(AttributeError):
+        slotted.name = 10
+
+
+@py.test.mark.parametrize("bases", [(Mixin, WatchMe), (WatchMe, Mixin)])
+def test_mixin_cooperation(bases):
+    watched_type = type(bases[0])(
+        "_", bases, {"foo": InstanceOf(int)}, native_reads=True
+    )
+    instance = watched_type()
+    instance.foo = 10
+    assert instance.foo == 10
+    assert instance.checkpoint == "foo"
+
+    with py.test.raises(AttributeError):
+        instance.foo = "hello"
+
+
+def test_mixins_see_writes_to_inherited_fields():
+    writes = []
+
+    class Logging:
+
+        def __setattr__(self, attr, value):
+            writes.append(attr)
+            super().__setattr__(attr, value)
+
+    class Derived(Logging, Child):
+        score = InstanceOf(int)
+
+    derived = Derived()
+    derived.name = "hello"
+    derived.age = 10
+    derived.score = 1
+    derived.other = None
+    assert writes == ["name", "age", "score", "other"]
+    assert derived.__dict__ == {
+        "name": "hello", "age": 10, "score": 1, "other": None
+    }
+
+    with py.test.raises(AttributeError):
+        derived.name = 10
+    with py.test.raises(AttributeError):
+        derived.score = "hello"
+    assert writes == ["name", "age", "score", "other"]
+
+
+def test_own_setattr_is_not_allowed():
+    with py.test.raises(TypeError):
+
+        class Broken(WatchMe, native_reads=True):
+            foo = InstanceOf(int)
+
+            def __setattr__(self, name, value):
+                pass
@@ -0,0 +1,142 @@
+import py.test
+
+
+import watch
+from watch.builtins import (
+    Or, And, Xor, Not, Just, InstanceOf, Container, Whatever, Nothing,
+    Predicate, GtThen, GtEqThen, LtThen, LtEqThen, Interval, IntervalSet
+)
+
+
+from test_validators import CASES, MAGIC_CASES, cases
+
+
+@py.test.mark.parametrize(
+    "validator,value_to_test,expected_result", cases(CASES, MAGIC_CASES)
+)
+def test_optimized_matches_predicate(
+    validator, value_to_test, expected_result
+):
+    optimized = watch.optimize(validator())
+    assert bool(optimized.predicate(value_to_test)) == expected_result
+
+
+def test_operators_build_flat_nodes():
+    validator = InstanceOf(int) | InstanceOf(str) | Container(InstanceOf(int))
+    assert type(validator) is Or
+    assert len(validator.combined_from) == 3
+
+    validator = (InstanceOf(int) > 10) < 20
+    assert type(validator) is And
+    assert len(validator.combined_from) == 3
+
+
+def test_instance_of_and_just_are_merged():
+    optimized = watch.optimize(
+        InstanceOf(int) | Just(1) | InstanceOf(str) | Just("a")
+    )
+    assert type(optimized) is Or
+    types, values = optimized.combined_from
+    assert types.types == (int, str)
+    assert tuple(values.test_against) == (1, "a")
+
+
+def test_whatever_and_nothing_are_folded():
+    assert watch.optimize(InstanceOf(int) | Whatever) is Whatever
+    assert watch.optimize(InstanceOf(int) & Nothing) is Nothing
+    assert watch.optimize(Or(Nothing, Nothing)) is Nothing
+    assert type(watch.optimize(InstanceOf(int) & Whatever)) is InstanceOf
+    assert watch.optimize(~Whatever) is Nothing
+
+
+def test_double_negation_and_duplicates():
+    positive = Predicate(lambda value: value > 0)
+    assert watch.optimize(Not(Not(positive))) is positive
+
+    optimized = watch.optimize(
+        And(Container(InstanceOf(int)), Container(InstanceOf(int)), positive)
+    )
+    assert len(optimized.combined_from) == 2
+
+
+def test_xor_keeps_raw_results():
+    # predicate results are xored as is, not as bools
+    raw = Predicate(lambda value: value)
+    validator = Xor(Or(raw), Not(Not(raw)))
+    optimized = watch.optimize(validator)
+    for value in (0, 1, 2, 3):
+        assert optimized.predicate(value) == validator.predicate(value)
+
+
+def test_comparator_chains_become_intervals():
+    validator = (InstanceOf(int) > 0) < 100
+    optimized = watch.optimize(validator)
+    types, interval = optimized.combined_from
+    assert type(interval) is Interval
+    assert (interval.lower, interval.upper) == (0, 100)
+    assert not interval.lower_closed and not interval.upper_closed
+
+    narrowed = watch.optimize(
+        And(GtEqThen(0), GtThen(0), LtEqThen(10), LtThen(20))
+    )
+    assert narrowed == Interval(0, 10, lower_closed=False, upper_closed=True)
+
+    # nans and non numbers are left alone
+    for validator in (GtThen(float("nan")) & LtThen(1), GtThen("a") < "b"):
+        optimized = watch.optimize(validator)
+        assert [type(child) for child in optimized.combined_from] == [
+            GtThen, LtThen
+        ]
+
+
+def test_unions_of_intervals():
+    allowed = Or(*(
+        InstanceOf(int) & (GtEqThen(10 * step) & LtThen(10 * step + 5))
+        for step in range(200)
+    ))
+    optimized = watch.optimize(allowed)
+    assert type(optimized) is And
+    types, intervals = optimized.combined_from
+    assert types == InstanceOf(int)
+    assert type(intervals) is IntervalSet
+    assert len(intervals.intervals) == 200
+    for value in (-1, 0, 4, 5, 9, 10, 1994, 1995, 2000, 4.5, "a"):
+        assert bool(allowed._check(value)) == bool(allowed.predicate(value))
+
+    touching = watch.optimize(
+        Interval(0, 5) | Interval(5, 10) | (LtEqThen(-5) | GtThen(100))
+    )
+    assert [
+        (interval.lower, interval.upper) for interval in touching.intervals
+    ] == [(None, -5), (0, 10), (100, None)]
+
+
+@py.test.mark.parametrize("value", [
+    -10, -5, -4.5, 0, 1, 5, 5.5, 10, 11, 19, 20, 21, 100, float("inf"),
+    float("nan"),
+])
+def test_interval_sets_match_plain_unions(value):
+    union = Or(
+        LtEqThen(-5), GtThen(0) & LtEqThen(5), GtEqThen(5) & LtThen(10),
+        GtThen(10) & LtThen(20), GtEqThen(100), GtEqThen(3) & LtThen(4),
+    )
+    assert type(watch.optimize(union)) is IntervalSet
+    assert union._check(value) == bool(union.predicate(value))
+
+
+def test_unions_covering_everything_still_compare():
+    union = LtThen(5) | GtEqThen(5)
+    assert type(watch.optimize(union)) is Or
+    assert union._check(1) and union._check(5.5)
+    assert not union._check(float("nan"))
+    for value in (None, "abc", object()):
+        with py.test.raises(TypeError):
+            union._check(value)
+
+    class Record(watch.WatchMe):
+        x = union
+
+    with py.test.raises(AttributeError):
+        Record().x = float("nan")
+    with py.test.raises(TypeError):
+        Record().x = None
@@ -0,0 +1,96 @@
+import pickle
+
+import py.test
+
+
+from watch import WatchMe
+from watch import parallel
+from watch.builtins import (
+    Container, InstanceOf, Mapping, Nothing, Parallel, Predicate, Just
+)
+
+
+def teardown_module(module):
+    parallel.shutdown()
+
+
+def is_even(value):
+    return isinstance(value, int) and value % 2 == 0
+
+
+@py.test.mark.parametrize("validator", [
+    InstanceOf(int) | Just("a", "b"),
+    Container(Mapping(InstanceOf(str), InstanceOf(int)), container=list),
+    Predicate(is_even) & ~Just(42),
+    Container(),
+    Mapping(InstanceOf(str)) | Container(Nothing),
+])
+def test_validators_are_picklable(validator):
+    values = [2, "a", "c", [{"a": 1}], [{1: 1}], 42, 3]
+    expected = [validator.predicate(value) for value in values]
+    # compiled check is dropped on the way and compiled again
+    validator._check(values[0])
+    clone = pickle.loads(pickle.dumps(validator))
+    assert [clone._check(value) for value in values] == expected
+
+
+def test_chunks_are_checked_in_processes():
+    class Batch(WatchMe):
+        rows = Parallel(
+            Container(Mapping(InstanceOf(str), InstanceOf(int))),
+            threshold=10, chunk_size=7, workers=2,
+        )
+
+    batch = Batch()
+    rows = [{"id": number} for number in range(100)]
+    batch.rows = rows
+    assert batch.rows is rows
+
+    rows[-1] = {"id": "oops"}
+    with py.test.raises(AttributeError):
+        batch.rows = rows
+    with py.test.raises(AttributeError):
+        batch.rows = 42
+
+
+def test_default_items_are_picklable():
+    class Batch(WatchMe):
+        rows = Parallel(
+            Container(Mapping(InstanceOf(str))), threshold=10, workers=2
+        )
+
+    batch = Batch()
+    batch.rows = [{"id": number} for number in range(100)]
+    with py.test.raises(AttributeError):
+        batch.rows = [{"id": 1}] * 50 + [{1: "id"}]
+
+
+def test_mapping():
+    validator = Parallel(
+        Mapping(InstanceOf(int), Predicate(is_even)),
+        threshold=10, chunk_size=4, workers=2,
+    )
+    value = {number: number * 2 for number in range(50)}
+    assert validator.predicate(value)
+    value[25] = 51
+    assert not validator.predicate(value)
+
+
+def test_early_failure():
+    validator = Parallel(
+        Container(Predicate(is_even)), threshold=10, chunk_size=10, workers=2
+    )
+    value = [1] + [2] * 10000
+    assert not validator.predicate(value)
+
+
+def test_small_values_are_checked_in_process(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("pool should not be used")
+
+    monkeypatch.setattr(parallel, "run", no_pool)
+    validator = Parallel(Container(InstanceOf(int)), threshold=100)
+    assert validator.predicate(list(range(99)))
+    assert not validator.predicate(list(range(98)) + ["oops"])
+    # blocks are fast enough as they are
+    assert validator.predicate(range(1000))
@@ -0,0 +1,128 @@
+import json
+
+import py.test
+
+
+import watch
+from watch import WatchMe, profiler
+from watch.builtins import (
+    Container, InstanceOf, Just, Mapping, Or, Sampled
+)
+from watch.core import PredicateController
+
+
+class Record(WatchMe):
+    tags = Container(InstanceOf(str))
+    counts = Mapping(InstanceOf(str), InstanceOf(int) | Just(None))
+
+
+class Quiet(WatchMe):
+    value = InstanceOf(int)
+
+    def complain(self, field_name, value):
+        pass
+
+
+@py.test.fixture
+def profiling():
+    profiler.reset()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.reset()
+
+
+def test_fields_and_nodes_are_counted(profiling):
+    record = Record()
+    for size in range(10):
+        record.tags = ["a"] * size
+    record.counts = {"a": 1, "b": None}
+    with py.test.raises(AttributeError):
+        record.tags = ["a", 1]
+
+    stats = watch.stats()
+    tags = stats["fields"]["Record.tags"]
+    assert (tags["calls"], tags["passed"], tags["failed"]) == (11, 10, 1)
+    assert tags["total"] >= tags["p50"] > 0
+
+    container = stats["nodes"]["Record.tags: Container"]
+    assert container["calls"] == 11
+    assert container["sizes"] == {"mean": 47 / 11, "max": 9}
+    items = stats["nodes"]["Record.tags: Container > InstanceOf"]
+    assert (items["calls"], items["failed"]) == (47, 1)
+
+    assert stats["nodes"]["Record.counts: Mapping > Or > Just"]["calls"] == 1
+
+
+def test_nested_and_update_checks_are_timed():
+    class Nested(WatchMe):
+        numbers = Sampled(Container(InstanceOf(int)), head=2)
+        either = Or(InstanceOf(str), InstanceOf(int), adaptive=True)
+
+    nested = Nested()
+    # compiled before profiling starts
+    nested.numbers = [1, 2, 3]
+    nested.either = 1
+
+    profiler.reset()
+    profiler.enable()
+    try:
+        nested.numbers = [1, 2]
+        nested.either = 2
+        nested.update(numbers=[3], either="a")
+        nodes = watch.stats()["nodes"]
+    finally:
+        profiler.disable()
+        profiler.reset()
+
+    numbers = "%s.numbers: Sampled > Container > InstanceOf"
+    either = "%s.either: Or > InstanceOf"
+    assert nodes[numbers % Nested.__qualname__]["calls"] == 3
+    assert nodes[either % Nested.__qualname__]["calls"] == 3
+    assert not [key for key in nodes if key.startswith("-:")]
+
+    # checks are compiled again, with no timing whatsoever
+    nested.either = 3
+    nested.numbers = [4]
+    assert watch.stats()["nodes"] == {}
+
+
+def test_failures_are_counted_when_complain_does_not_raise(profiling):
+    quiet = Quiet()
+    quiet.value = "oops"
+    quiet.value = 1
+    field = watch.stats()["fields"]["Quiet.value"]
+    assert (field["passed"], field["failed"]) == (1, 1)
+
+
+def test_reports(profiling):
+    Record().tags = ["a"]
+    text = profiler.report()
+    assert "Record.tags: Container > InstanceOf" in text
+    assert json.loads(profiler.report("json")) == watch.stats()
+    with py.test.raises(ValueError):
+        profiler.report("xml")
+
+
+def test_disable_puts_everything_back():
+    originals = (
+        PredicateController.__set__, PredicateController._compiled,
+        Container.__set__, Container.predicate, InstanceOf.predicate,
+    )
+    profiler.enable()
+    assert profiler.enabled()
+    assert Container.predicate is not originals[3]
+    profiler.disable()
+    assert not profiler.enabled()
+    assert originals == (
+        PredicateController.__set__, PredicateController._compiled,
+        Container.__set__, Container.predicate, InstanceOf.predicate,
+    )
+
+    record = Record()
+    record.tags = ["a"]
+    # nothing is recorded, and the fields are compiled again
+    assert "Record.tags" not in watch.stats()["fields"]
+    assert "_check" in Record.tags.__dict__
@@ -0,0 +1,175 @@
+import copy
+import pickle
+
+
+import py.test
+
+
+from watch import ValidationError, WatchMe
+from watch.builtins import Container, Mapping, InstanceOf
+from watch.proxies import WatchedList, WatchedSet, WatchedDict
+
+
+class Record(WatchMe):
+    numbers = Container(InstanceOf(int), container=list, proxy=True)
+    tags = Container(InstanceOf(str), proxy=True)
+    counts = Mapping(InstanceOf(str), InstanceOf(int), proxy=True)
+    plain = Container(InstanceOf(int))
+
+
+def test_values_get_wrapped():
+    record = Record()
+    numbers = [1, 2, 3]
+    record.numbers = numbers
+    record.tags = {"a", "b"}
+    record.counts = {"a": 1}
+    record.plain = numbers
+
+    assert type(record.numbers) is WatchedList
+    assert type(record.tags) is WatchedSet
+    assert type(record.counts) is WatchedDict
+    assert record.plain is numbers
+    assert record.numbers == numbers
+
+    # reassigning the very same proxy does not copy it
+    proxy = record.numbers
+    record.numbers = proxy
+    assert record.numbers is proxy
+
+    # but assigning it to some other instance does
+    other = Record()
+    other.numbers = proxy
+    assert other.numbers is not proxy
+
+
+def test_list_mutations():
+    record = Record()
+    record.numbers = [1, 2, 3]
+
+    record.numbers.append(4)
+    record.numbers.extend(iter([5, 6]))
+    record.numbers.insert(0, 0)
+    record.numbers[0] = 10
+    record.numbers[1:3] = [20, 30]
+    record.numbers += [7]
+    assert record.numbers == [10, 20, 30, 3, 4, 5, 6, 7]
+
+    for mutate in (
+        lambda numbers: numbers.append("hello"),
+        lambda numbers: numbers.extend([1, "hello"]),
+        lambda numbers: numbers.insert(0, "hello"),
+        lambda numbers: numbers.__setitem__(0, "hello"),
+        lambda numbers: numbers.__setitem__(slice(0, 1), [1, "hello"]),
+        lambda numbers: numbers.__iadd__(["hello"]),
+    ):
+        with py.test.raises(AttributeError):
+            mutate(record.numbers)
+
+    # failed mutations leave the list intact
+    assert record.numbers == [10, 20, 30, 3, 4, 5, 6, 7]
+
+
+def test_set_mutations():
+    record = Record()
+    record.tags = {"a"}
+    record.tags.add("b")
+    record.tags.update(["c"], ("d",))
+    record.tags |= {"e"}
+    record.tags ^= {"a", "f"}
+    assert record.tags == {"b", "c", "d", "e", "f"}
+
+    with py.test.raises(AttributeError):
+        record.tags.add(1)
+
+    with py.test.raises(AttributeError):
+        record.tags.update(["g", 1])
+
+    with py.test.raises(AttributeError):
+        record.tags |= {1}
+
+    assert record.tags == {"b", "c", "d", "e", "f"}
+
+
+def test_dict_mutations():
+    record = Record()
+    record.counts = {"a": 1}
+    record.counts["b"] = 2
+    record.counts.update({"c": 3}, d=4)
+    assert record.counts.setdefault("e", 5) == 5
+    assert record.counts.setdefault("a", 100) == 1
+    record.counts |= {"f": 6}
+    assert record.counts == {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6}
+
+    for mutate in (
+        lambda counts: counts.__setitem__(1, 1),
+        lambda counts: counts.__setitem__("x", "y"),
+        lambda counts: counts.update(x="y"),
+        lambda counts: counts.setdefault("x"),
+    ):
+        with py.test.raises(AttributeError):
+            mutate(record.counts)
+
+    assert "x" not in record.counts
+
+
+def test_disabled_validation_is_respected():
+    record = Record()
+    record.numbers = [1]
+    record.keep_eye_on_me = False
+    record.numbers.append("hello")
+    assert record.numbers == [1, "hello"]
+
+
+def test_copies_are_plain_containers():
+    record = Record()
+    record.numbers = [1, 2]
+    assert type(record.numbers[:]) is list
+    assert type(copy.copy(record.numbers)) is list
+    assert type(copy.deepcopy(record.numbers)) is list
+    assert pickle.loads(pickle.dumps(record.numbers)) == [1, 2]
+
+
+def test_errors_point_at_the_rejected_item():
+    class Nested(WatchMe):
+        rows = Container(Container(InstanceOf(int)), proxy=True)
+        names = Container(InstanceOf(str), proxy=True)
+        counts = Mapping(
+            InstanceOf(str), Container(InstanceOf(int)), proxy=True
+        )
+
+    nested = Nested()
+    nested.rows, nested.names, nested.counts = [[1], [2]], {"a"}, {}
+
+    with py.test.raises(ValidationError) as error:
+        nested.rows.append("ab")
+    assert (error.value.path, error.value.part) == ((2, 0), "a")
+    assert "Failed at rows[2][0], which is 'a'." in str(error.value)
+
+    with py.test.raises(ValidationError) as error:
+        nested.rows.extend([[3], [4, "x"]])
+    assert (error.value.path, error.value.part) == ((3, 1), "x")
+    assert "Failed at rows[3][1], which is 'x'." in str(error.value)
+
+    with py.test.raises(ValidationError) as error:
+        nested.rows.insert(-10, ["y"])
+    assert error.value.path == (0, 0)
+
+    with py.test.raises(ValidationError) as error:
+        nested.rows[-1] = [5, 6, "z"]
+    assert error.value.path == (1, 2)
+
+    # the position of set items and slices is not known
+    with py.test.raises(ValidationError) as error:
+        nested.rows[:1] = [["w"]]
+    assert error.value.path == ()
+    with py.test.raises(ValidationError) as error:
+        nested.names.add(1)
+    assert (error.value.path, error.value.part) == ((), 1)
+
+    with py.test.raises(ValidationError) as error:
+        nested.counts["k"] = [1, "v"]
+    assert error.value.path == ("k", 1)
+    with py.test.raises(ValidationError) as error:
+        nested.counts.update({1: [1]})
+    assert (error.value.path, error.value.part) == ((), 1)
+    assert nested.rows == [[1], [2]]
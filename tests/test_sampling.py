@@ -0,0 +1,227 @@
+import copy
+
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import (
+    Container, InstanceOf, Mapping, Predicate, Sampled
+)
+from watch.sampling import Sampler
+
+
+def counting(validator):
+    calls = []
+
+    def predicate(value):
+        calls.append(value)
+        return validator.predicate(value)
+
+    return Predicate(predicate), calls
+
+
+def test_head_and_sample_bound_the_number_of_checks():
+    items, calls = counting(InstanceOf(int))
+
+    class Data(WatchMe):
+        values = Sampled(Container(items), head=10, sample=5, seed=1)
+
+    data = Data()
+    data.values = list(range(10000))
+    assert len(calls) == 15
+    assert calls[:10] == list(range(10))
+    assert all(value >= 10 for value in calls[10:])
+
+    stats = Data.values.statistics()
+    assert stats["policy"] == {"head": 10, "sample": 5, "every": 1, "seed": 1}
+    assert stats["checks"] == 1
+    assert stats["partial"] == 1
+
+
+def test_small_containers_are_checked_completely():
+    items, calls = counting(InstanceOf(int))
+
+    class Data(WatchMe):
+        values = Sampled(Container(items), head=10, sample=5)
+
+    data = Data()
+    data.values = list(range(15))
+    assert len(calls) == 15
+    assert Data.values.statistics()["partial"] == 0
+    with py.test.raises(AttributeError):
+        data.values = [1, 2, "three"]
+    with py.test.raises(AttributeError):
+        data.values = 42
+
+
+def test_failures_in_the_head_are_always_caught():
+    class Data(WatchMe):
+        values = Sampled(Container(InstanceOf(int)), head=3)
+
+    data = Data()
+    with py.test.raises(AttributeError):
+        data.values = [1, "two"] + list(range(1000))
+    # tail is not checked at all
+    data.values = list(range(1000)) + ["oops"]
+    assert Data.values.statistics()["failures"] == 1
+
+
+def test_samples_are_reproducible():
+    def sampled_items(seed):
+        items, calls = counting(InstanceOf(int))
+        validator = Sampled(Container(items), sample=20, seed=seed)
+        for _ in range(3):
+            assert validator.predicate(list(range(1000)))
+        return calls
+
+    assert sampled_items(7) == sampled_items(7)
+    assert sampled_items(7) != sampled_items(8)
+
+
+def test_sets_and_iterators():
+    items, calls = counting(InstanceOf(int))
+    validator = Sampled(Container(items), head=2, sample=3)
+    assert validator.predicate(set(range(100)))
+    assert len(calls) == 5
+
+    del calls[:]
+    # iterators have no length, so they are checked completely
+    assert validator.predicate(iter(range(100)))
+    assert calls == list(range(100))
+
+
+def test_lazy_streams_lose_nothing():
+    class Data(WatchMe):
+        values = Sampled(Container(InstanceOf(int), lazy=True), head=3)
+
+    data = Data()
+    data.values = iter(range(10))
+    assert list(data.values) == list(range(10))
+    data.values = iter([1, 2, "three"])
+    with py.test.raises(AttributeError):
+        list(data.values)
+
+
+def test_mapping():
+    keys, calls = counting(InstanceOf(str))
+    validator = Sampled(Mapping(keys, InstanceOf(int)), head=1, sample=2)
+    value = {str(number): number for number in range(100)}
+    assert validator.predicate(value)
+    assert len(calls) == 3
+    assert calls[0] == "0"
+
+    value["0"] = "zero"
+    assert not validator.predicate(value)
+
+
+def test_nothing_gets_copied():
+    class Array:
+        # indexable, but not a Sequence, like numpy arrays
+        def __init__(self, size):
+            self.size = size
+            self.reads = []
+
+        def __len__(self):
+            return self.size
+
+        def __getitem__(self, position):
+            if position >= self.size:
+                raise IndexError(position)
+            self.reads.append(position)
+            return position
+
+    array = Array(10 ** 6)
+    rows = Sampler(head=2, sample=3, seed=1).rows(array, False)
+    assert rows == array.reads
+    assert rows[:2] == [0, 1]
+    assert len(rows) == 5
+
+    class Keys(dict):
+        def __iter__(self):
+            # keys are walked lazily, up to the last picked one
+            for key in super().__iter__():
+                walked.append(key)
+                yield key
+
+    walked = []
+    value = Keys((number, -number) for number in range(1000))
+    rows = Sampler(head=1, sample=3, seed=2).rows(value, True)
+    assert rows[0] == (0, 0)
+    assert all(value == -key for key, value in rows)
+    assert walked[-1] == max(key for key, _ in rows)
+
+
+def test_every():
+    checked, calls = counting(InstanceOf(int))
+
+    class Counter(WatchMe):
+        value = Sampled(checked, every=3)
+
+    counter = Counter()
+    for number in range(8):
+        counter.value = number
+    assert calls == [0, 3, 6]
+
+    # the next one is skipped, which is the whole point
+    counter.value = "nine"
+    assert counter.value == "nine"
+    stats = Counter.value.statistics()
+    assert stats["checks"] == 9
+    assert stats["skipped"] == 6
+
+
+def test_proxies():
+    class Data(WatchMe):
+        values = Sampled(Container(InstanceOf(int), proxy=True), head=10)
+
+    data = Data()
+    data.values = list(range(100))
+    data.values.append(100)
+    with py.test.raises(AttributeError):
+        data.values.append("oops")
+
+
+def test_copies_start_from_scratch():
+    validator = Sampled(InstanceOf(int), every=2, seed=3)
+    validator.predicate(1)
+    validator.predicate(2)
+    duplicate = copy.deepcopy(validator)
+    assert duplicate.statistics()["checks"] == 0
+    assert duplicate.statistics()["policy"]["seed"] == 3
+
+
+@py.test.mark.parametrize("kwargs", [
+    {"head": -1}, {"sample": "many"}, {"every": 0}
+])
+def test_bad_policy(kwargs):
+    with py.test.raises(AttributeError):
+        Sampled(InstanceOf(int), **kwargs)
+
+
+def test_each_field_has_its_own_statistics():
+    policy = Sampled(InstanceOf(int), every=2)
+
+    class First(WatchMe):
+        value = policy
+
+    class Second(WatchMe):
+        value = policy
+
+    First().value = 1
+    assert First.value.statistics()["checks"] == 1
+    assert Second.value.statistics()["checks"] == 0
+
+
+def test_proxies_of_shared_subtrees_know_their_fields():
+    policy = Sampled(Container(InstanceOf(int), proxy=True), head=10)
+
+    class Data(WatchMe):
+        first = policy
+        second = policy
+
+    data = Data()
+    data.first = [1]
+    data.second = [2]
+    with py.test.raises(AttributeError) as error:
+        data.first.append("oops")
+    assert "'first'" in str(error.value)
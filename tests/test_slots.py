@@ -0,0 +1,92 @@
+import sys
+
+
+import py.test
+
+
+from watch import WatchMe
+from watch.builtins import InstanceOf, Container
+
+
+class Point(WatchMe, slots=True):
+    x = InstanceOf(int)
+    y = InstanceOf(int)
+
+
+class Point3D(Point):
+    z = InstanceOf(int)
+
+
+class PlainPoint(WatchMe):
+    x = InstanceOf(int)
+    y = InstanceOf(int)
+
+
+def test_values_live_in_slots():
+    point = Point()
+    point.x = 1
+    point.y = 2
+    assert (point.x, point.y) == (1, 2)
+    assert not hasattr(point, "__dict__")
+
+    plain = PlainPoint()
+    plain.x = 1
+    plain.y = 2
+    assert (
+        sys.getsizeof(point) <
+        sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+    )
+
+
+def test_validation():
+    point = Point()
+    with py.test.raises(AttributeError):
+        point.x = "hello"
+
+    # unset slot behaves just like a missing attribute
+    with py.test.raises(AttributeError):
+        point.x
+
+    Point.keep_eye_on_me = False
+    try:
+        point.x = "hello"
+        assert point.x == "hello"
+    finally:
+        Point.keep_eye_on_me = True
+
+
+def test_slots_are_inherited():
+    point = Point3D()
+    point.x = 1
+    point.z = 3
+    assert (point.x, point.z) == (1, 3)
+    assert not hasattr(point, "__dict__")
+
+    with py.test.raises(AttributeError):
+        point.z = "hello"
+
+
+def test_declared_slots_are_kept():
+
+    class Named(WatchMe, slots=True):
+        __slots__ = ("name",)
+        value = Container(InstanceOf(int))
+
+    named = Named()
+    named.name = "hello"
+    named.value = [1]
+    assert (named.name, named.value) == ("hello", [1])
+
+
+def test_fields_could_be_reused():
+
+    class Other(WatchMe):
+        x = Point.x
+
+    other = Other()
+    other.x = 10
+    assert other.x == 10
+    assert other.__dict__ == {"x": 10}
+
+    with py.test.raises(AttributeError):
+        other.x = "hello"
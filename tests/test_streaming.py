@@ -0,0 +1,111 @@
+import types
+
+import py.test
+
+
+from watch import ValidationError, WatchMe
+from watch.builtins import Container, InstanceOf
+from watch.proxies import WatchedIterator
+
+
+class Pipeline(WatchMe):
+    records = Container(InstanceOf(int), lazy=True)
+
+
+def test_iterators_are_not_consumed_on_assignment():
+    pulled = []
+
+    def numbers():
+        for number in range(5):
+            pulled.append(number)
+            yield number
+
+    pipeline = Pipeline()
+    pipeline.records = numbers()
+    assert pulled == []
+    assert type(pipeline.records) is WatchedIterator
+    assert list(pipeline.records) == [0, 1, 2, 3, 4]
+
+
+def test_bad_item_raises_when_pulled():
+    pipeline = Pipeline()
+    pipeline.records = iter([1, 2, "three", 4])
+    records = pipeline.records
+    assert next(records) == 1
+    assert next(records) == 2
+    with py.test.raises(ValidationError) as error:
+        next(records)
+    assert (error.value.path, error.value.part) == ((), "three")
+    # the stream goes on past the bad item
+    assert next(records) == 4
+
+
+def test_complain_that_does_not_raise_skips_bad_items():
+    complaints = []
+
+    class Quiet(WatchMe):
+        records = Container(InstanceOf(int), lazy=True)
+
+        def complain(self, field_name, value):
+            complaints.append((field_name, value))
+
+    quiet = Quiet()
+    quiet.records = (item for item in [1, "two", 3])
+    assert list(quiet.records) == [1, 3]
+    assert complaints == [("records", "two")]
+
+
+def test_disabled_instances_let_everything_through():
+    pipeline = Pipeline()
+    pipeline.records = iter([1, "two"])
+    pipeline.keep_eye_on_me = False
+    assert list(pipeline.records) == [1, "two"]
+
+
+def test_other_iterables_are_checked_right_away():
+    pipeline = Pipeline()
+    pipeline.records = [1, 2, 3]
+    assert pipeline.records == [1, 2, 3]
+    with py.test.raises(AttributeError):
+        pipeline.records = [1, "two"]
+    with py.test.raises(AttributeError):
+        pipeline.records = 42
+
+
+def test_constructor_and_update():
+    class Stream(WatchMe, init=True):
+        records = Container(InstanceOf(int), lazy=True)
+
+    pulled = []
+    stream = Stream(pulled.append(item) or item for item in [1, "two"])
+    assert pulled == []
+    with py.test.raises(AttributeError):
+        list(stream.records)
+
+    stream.update(records=iter([3]))
+    assert list(stream.records) == [3]
+
+
+def test_nested_in_or():
+    class Either(WatchMe):
+        records = Container(InstanceOf(int), lazy=True) | InstanceOf(str)
+
+    either = Either()
+    either.records = "text"
+    # Or is not lazy on its own, so iterators are let through unwrapped
+    either.records = iter([1])
+    assert list(either.records) == [1]
+
+
+def test_raw_value_is_validated_before_it_is_wrapped():
+    class Generated(WatchMe):
+        records = Container(
+            InstanceOf(int), container=types.GeneratorType, lazy=True
+        )
+
+    generated = Generated()
+    generated.records = (number for number in [1, "two"])
+    assert type(generated.records) is WatchedIterator
+    assert next(generated.records) == 1
+    with py.test.raises(AttributeError):
+        generated.records = iter([1])
@@ -0,0 +1,130 @@
+import abc
+from collections import OrderedDict, deque
+from collections.abc import Hashable, Iterable
+import typing
+
+import py.test
+
+
+from watch import WatchMe, typecache
+from watch.builtins import Container, InstanceOf, Mapping, SubclassOf
+
+
+class Base(abc.ABC):
+    pass
+
+
+class Plain:
+    pass
+
+
+class Later:
+    pass
+
+
+def test_worth_caching():
+    assert typecache.worth_caching((int, str))
+    assert typecache.worth_caching((Iterable,))
+    assert not typecache.worth_caching((int,))
+
+    @typing.runtime_checkable
+    class Sized(typing.Protocol):
+        def __len__(self):
+            pass
+
+    assert not typecache.worth_caching((Sized, int))
+
+
+def test_verdicts_are_remembered_per_type():
+    cache = typecache.verdicts((int, str))
+    assert cache is typecache.verdicts((int, str))
+    assert cache.check(1) and cache.check("a")
+    assert not cache.check(1.5)
+    assert int in cache.accepted and str in cache.accepted
+    assert float in cache.rejected[1]
+    assert not cache.check(2.5)
+
+
+def test_negative_verdicts_follow_abc_registrations():
+    validator = InstanceOf(Base)
+    assert not validator._check(Plain())
+    assert not validator._check(Plain())
+    Base.register(Plain)
+    assert validator._check(Plain())
+
+    subclasses = SubclassOf(Base, int)
+    assert not subclasses._check(Later)
+    Base.register(Later)
+    assert subclasses._check(Later)
+
+
+def test_containers():
+    class Record(WatchMe):
+        rows = Container(Container(InstanceOf(int, float)))
+        counts = Container(Mapping(InstanceOf(str), InstanceOf(Hashable)))
+
+    record = Record()
+    record.rows = [[1, 2.5]] * 100
+    record.counts = [{"a": 1}] * 100
+    with py.test.raises(AttributeError):
+        record.rows = [[1]] * 100 + [1]
+    with py.test.raises(AttributeError):
+        record.counts = [{"a": 1}, {"b": []}]
+    assert list in typecache.verdicts((Iterable,)).accepted
+
+
+def test_objects_faking_their_class_are_not_cached():
+    class Fake:
+        @property
+        def __class__(self):
+            return int
+
+    validator = InstanceOf(int, str)
+    assert validator._check(Fake())
+    assert Fake not in typecache.verdicts((int, str)).accepted
+    assert not validator._check(object())
+
+
+def test_size_is_bounded(monkeypatch):
+    monkeypatch.setattr(typecache, "SIZE", 4)
+    cache = typecache.TypeVerdicts((Iterable,))
+    for number in range(10):
+        assert cache.check(type("Iterable%d" % number, (list,), {})())
+    assert len(cache.accepted) <= 4
+
+
+def test_homogeneous_containers():
+    ints = Container(InstanceOf(int))
+    assert ints._check(list(range(100)))
+    assert ints._check([True] * 100)
+    assert ints._check(deque(range(100)))
+    assert not ints._check(list(range(99)) + ["99"])
+    assert not ints._check(set(range(99)) | {None})
+
+    class Fake:
+        @property
+        def __class__(self):
+            return int
+
+    assert ints._check([Fake()] * 100)
+    assert not ints._check([object()] * 100)
+
+
+def test_homogeneous_mappings():
+    counts = Mapping(InstanceOf(str), InstanceOf(int))
+    rows = {str(number): number for number in range(100)}
+    assert counts._check(rows)
+    assert counts._check(OrderedDict(rows))
+    assert not counts._check(dict(rows, extra="1"))
+    assert not counts._check(dict(rows, **{"1": 1.5}))
+    assert not counts._check({**rows, 1: 1})
+
+    keys_only = Mapping(InstanceOf(str))
+    assert keys_only._check(dict.fromkeys(map(str, range(100))))
+    assert not keys_only._check(dict.fromkeys(range(100)))
+
+
+def test_all_of_types():
+    assert typecache.all_of_types([1, True, 2], int)
+    assert typecache.all_of_types([], (int, str))
+    assert not typecache.all_of_types([1, "2"], int)
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import py.test
 
 
@@ -55,3 +59,41 @@ def test_mixin_cooperation(type_to_check):
 
     assert instance.checkpoint
 
+
+def test_custom_validators_keep_their_own_names():
+    """Tests, that internal hooks do not clash with attributes of custom
+    validators.
+    """
+
+    class Even(watch.builtins.PredicateController):
+        check = "even"
+
+        def predicate(self, value):
+            return value % 2 == 0
+
+        def store(self, value):
+            raise AssertionError("should not be called")
+
+    class SomeClass(watch.WatchMe):
+        foo = Even()
+
+    instance = SomeClass()
+    instance.foo = 2
+    assert instance.foo == 2
+    with py.test.raises(AttributeError):
+        instance.foo = 3
+    assert SomeClass.foo.check == "even"
+
+
+def test_optional_features_are_imported_lazily():
+    """Tests, that importing watch does not pull in modules, which only
+    some optional features need.
+    """
+
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        "import sys, watch; print(sorted(set(sys.modules) & {"
+        "'concurrent.futures', 'inspect', 'json', 'logging', "
+        "'multiprocessing', 'queue'}))"
+    ], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert output.strip() == b"[]"
@@ -23,6 +23,43 @@ CASES = [
             ("hello", False),
         ]
     ),
+    # Just with a lot of values
+    (
+        Just(*range(0, 100000, 2)),
+        [
+            (0, True),
+            (99998, True),
+            (4.0, True),
+            (5, False),
+            ([4], False),
+        ]
+    ),
+    # Just with unhashable values
+    (
+        Just([1, 2], {"a": 1}, 3),
+        [
+            ([1, 2], True),
+            ({"a": 1}, True),
+            (3, True),
+            ([1], False),
+            (4, False),
+        ]
+    ),
+    # Just packed into sorted array
+    (
+        Just(*range(0, 100000, 2), compact=True),
+        [
+            (0, True),
+            (99998, True),
+            (4.0, True),
+            (True, False),
+            (5, False),
+            (-2, False),
+            (100000, False),
+            ("hello", False),
+            ([4], False),
+        ]
+    ),
     # Greater
     (
         GtThen(5),
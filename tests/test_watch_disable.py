@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+
+
 import py.test
 import watch
 
@@ -59,3 +64,122 @@ def test_toggle_scenario_for_instances():
 
     watch.WatchMe.keep_eye_on_me = True
 
+
+def test_disable_strips_descriptors():
+
+    class A(watch.WatchMe, init=True):
+        foo = watch.builtins.InstanceOf(int)
+
+    class B(A):
+        bar = watch.builtins.InstanceOf(int)
+
+    class C(watch.WatchMe):
+        foo = watch.builtins.InstanceOf(int)
+
+    b = B(1, 2)
+    watch.disable(A)
+    try:
+        assert "foo" not in vars(A)
+        assert "bar" not in vars(B)
+        b.foo = "hello"
+        b.bar = "world"
+        assert (b.foo, b.bar) == ("hello", "world")
+        assert B("hello", "world").foo == "hello"
+
+        # subclasses created in the meantime are disabled as well
+        class D(B):
+            baz = watch.builtins.InstanceOf(int)
+
+        D("a", "b", "c").baz = "d"
+
+        # unrelated classes are not affected
+        with py.test.raises(AttributeError):
+            C().foo = "hello"
+    finally:
+        watch.enable(A)
+
+    # values set while disabled are still there
+    assert (b.foo, b.bar) == ("hello", "world")
+    with py.test.raises(AttributeError):
+        b.foo = "hello"
+    with py.test.raises(AttributeError):
+        B("hello", 1)
+    with py.test.raises(AttributeError):
+        D(1, 2, 3).baz = "c"
+
+
+def test_disable_other_storages():
+
+    class Slotted(watch.WatchMe, slots=True):
+        foo = watch.builtins.InstanceOf(int)
+
+    class Native(watch.WatchMe, native_reads=True):
+        foo = watch.builtins.InstanceOf(int)
+
+    slotted, native = Slotted(), Native()
+    slotted.foo = native.foo = 1
+
+    watch.disable()
+    try:
+        assert type(vars(Slotted)["foo"]).__name__ == "member_descriptor"
+        assert "__setattr__" not in vars(Native)
+        slotted.foo = native.foo = "hello"
+        assert slotted.foo == native.foo == "hello"
+    finally:
+        watch.enable()
+
+    with py.test.raises(AttributeError):
+        slotted.foo = "hello"
+    with py.test.raises(AttributeError):
+        native.foo = "hello"
+    assert slotted.foo == native.foo == "hello"
+
+
+def test_disable_via_environment():
+    script = (
+        "import watch\n"
+        "class A(watch.WatchMe):\n"
+        "    foo = watch.builtins.InstanceOf(int)\n"
+        "a = A()\n"
+        "a.foo = 'hello'\n"
+        "assert 'foo' not in vars(A)\n"
+        "watch.enable()\n"
+        "try:\n"
+        "    a.foo = 'hello'\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise SystemExit(1)\n"
+    )
+    environment = dict(os.environ, WATCH_DISABLE="1")
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(watch.__file__))] +
+        environment.get("PYTHONPATH", "").split(os.pathsep)
+    )
+    subprocess.check_call([sys.executable, "-c", script], env=environment)
+
+
+def test_disabled_update_and_init_do_not_validate():
+
+    class Record(watch.WatchMe, init=True):
+        x = watch.builtins.InstanceOf(int)
+        y = watch.builtins.Container(
+            watch.builtins.InstanceOf(int), proxy=True
+        )
+
+    record = Record(1, [1])
+    watch.disable(Record)
+    try:
+        record.update(x="bad", y=["bad"])
+        assert (record.x, record.y) == ("bad", ["bad"])
+
+        fresh = Record("bad", [1])
+        # no proxies either, so mutations are not validated
+        assert type(fresh.y) is list
+        fresh.y.append("a")
+    finally:
+        watch.enable(Record)
+
+    with py.test.raises(AttributeError):
+        record.update(x="bad")
+    assert type(Record(1, [1]).y) is not list
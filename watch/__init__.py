@@ -1,3 +1,9 @@
-from .core import WatchMe, PredicateController
+from .core import (
+    WatchMe, PredicateController, ValidationError, disable, enable
+)
 from .builtins import Predicate
-
+from .optimizer import optimize
+from .compiler import compile
+from .interning import intern
+from .deferred import flush
+from .profiler import stats
@@ -0,0 +1,81 @@
+"""Branch ordering for adaptive Or and And nodes.
+
+Or stops at the first branch, that accepts the value, And stops at the first
+one, that rejects it, so the branch deciding most of the time is best tried
+first. A ranking counts which branch decided, and every 'period' decisions
+puts the branches in the order of their counts. The counts are halved then,
+so that the order keeps up with shifts in the traffic.
+
+Counts are bumped with no lock: an update lost to a race now and then does
+not matter for statistics. Reordering is done under a lock by whichever
+thread gets it first, while the order itself is a tuple swapped in one go,
+so checks never see a half made one.
+"""
+
+from threading import Lock
+
+
+class Ranking:
+    """Order of the branches along with the counts it is based on.
+    """
+
+    def __init__(self, branches, period=1000):
+        self.branches = tuple(branches)
+        self.period = period
+        self.order = None
+        self.hits = [0] * len(self.branches)
+        self.decisions = 0
+        self.reorders = 0
+        self.lock = Lock()
+
+    def __reduce__(self):
+        # copies start from scratch, locks are not copyable anyway
+        return type(self), (self.branches, self.period)
+
+    def ordered(self):
+        """Returns (index, check) pairs of the branches in the current order,
+        index is the position of the branch in the node.
+        """
+        order = self.order
+        if order is None:
+            order = self.order = tuple(
+                enumerate(branch._compiled() for branch in self.branches)
+            )
+        return order
+
+    def recompile(self):
+        """Takes checks of the branches anew, keeping their current order,
+        e.g. once the profiler is switched on or off.
+        """
+        order = self.order
+        if order is not None:
+            self.order = tuple(
+                (index, self.branches[index]._compiled())
+                for index, check in order
+            )
+
+    def decided(self, index):
+        self.hits[index] += 1
+        self.decisions += 1
+        if self.decisions >= self.period and self.lock.acquire(False):
+            try:
+                self.reorder()
+            finally:
+                self.lock.release()
+
+    def reorder(self):
+        hits = self.hits
+        # sorting is stable, so ties keep their current order
+        self.order = tuple(
+            sorted(self.ordered(), key=lambda pair: -hits[pair[0]])
+        )
+        self.hits = [count // 2 for count in hits]
+        self.decisions = 0
+        self.reorders += 1
+
+    def statistics(self):
+        return {
+            "order": [index for index, check in self.ordered()],
+            "hits": list(self.hits),
+            "reorders": self.reorders,
+        }
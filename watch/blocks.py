@@ -0,0 +1,170 @@
+"""Blocks of homogeneous items.
+
+Things like range, bytes, array.array, memoryview or numpy arrays know the
+type of their items in advance, so validators such as InstanceOf or GtThen
+could answer for the whole block at once instead of boxing and checking items
+one by one. See 'predicate_block' methods of the builtin validators.
+
+Numpy is never imported here: if the value is a numpy array, then numpy is
+already in sys.modules.
+"""
+
+import sys
+from array import array
+
+
+FORMAT_TYPES = dict(
+    [(code, int) for code in "bBhHiIlLqQnN"] +
+    [(code, float) for code in "efd"] +
+    [("?", bool), ("c", bytes), ("u", str), ("w", str)]
+)
+
+
+def numpy_module():
+    return sys.modules.get("numpy")
+
+
+class Block:
+    """Base block, all it knows is the type of items.
+    """
+
+    def __init__(self, value, item_type):
+        self.value = value
+        self.item_type = item_type
+
+    def __len__(self):
+        return len(self.value)
+
+    def bounds(self):
+        """Returns (min, max) pair of items, or None if that is expensive
+        to figure out.
+        """
+        return None
+
+    def distinct(self):
+        """Returns a sized collection of distinct items, or None if that is
+        expensive to figure out.
+        """
+        return None
+
+    def compare(self, operator, other):
+        """Tells whether operator(item, other) holds for every item, None
+        means there is no cheap way to tell.
+        """
+        if not len(self):
+            return True
+        bounds = self.bounds()
+        if bounds is None:
+            return None
+        # operators are monotonic, so checking the extremes is enough
+        low, high = bounds
+        return bool(operator(low, other) and operator(high, other))
+
+
+class RangeBlock(Block):
+
+    def __init__(self, value):
+        super().__init__(value, int)
+
+    def bounds(self):
+        first, last = self.value[0], self.value[-1]
+        return min(first, last), max(first, last)
+
+    def distinct(self):
+        return self.value
+
+
+class TextBlock(Block):
+    """Block of bytes or str, iterating over such a thing gives ints or
+    one char strings respectively.
+    """
+
+    def bounds(self):
+        return min(self.value), max(self.value)
+
+    def distinct(self):
+        return set(self.value)
+
+
+class BufferBlock(Block):
+    """One dimensional array.array or memoryview.
+    """
+
+    def bounds(self):
+        if self.item_type is not int:
+            return None
+        return min(self.value), max(self.value)
+
+    def distinct(self):
+        if self.item_type is not int:
+            return None
+        return set(self.value)
+
+    def compare(self, operator, other):
+        if self.item_type is float and numpy_module() is not None:
+            # min/max go nuts on nans, while numpy handles them right
+            vector = numpy_module().asarray(memoryview(self.value))
+            return NumpyBlock(vector, float).compare(operator, other)
+        return super().compare(operator, other)
+
+
+class NumpyBlock(Block):
+    """One dimensional numpy array of numbers.
+    """
+
+    def distinct(self):
+        return numpy_module().unique(self.value)
+
+    def compare(self, operator, other):
+        return bool(operator(self.value, other).all())
+
+
+def buffer_block(value):
+    if isinstance(value, memoryview):
+        if value.ndim != 1:
+            return None
+        code = value.format.lstrip("@=<>!")
+    else:
+        code = value.typecode
+    item_type = FORMAT_TYPES.get(code)
+    if item_type is None:
+        return None
+    return BufferBlock(value, item_type)
+
+
+def numpy_block(value):
+    numpy = numpy_module()
+    if numpy is None or not isinstance(value, numpy.ndarray):
+        return None
+    if value.ndim != 1 or value.dtype.kind not in "biuf":
+        return None
+    return NumpyBlock(value, value.dtype.type)
+
+
+def no_block(value):
+    return None
+
+
+FACTORIES = {
+    range: RangeBlock,
+    bytes: lambda value: TextBlock(value, int),
+    bytearray: lambda value: TextBlock(value, int),
+    str: lambda value: TextBlock(value, str),
+    array: buffer_block,
+    memoryview: buffer_block,
+    # the most common containers, that are definitely not blocks
+    list: no_block,
+    tuple: no_block,
+    set: no_block,
+    frozenset: no_block,
+    dict: no_block,
+}
+
+
+def as_block(value):
+    """Returns Block for the value or None, if value is not a block.
+    """
+    factory = FACTORIES.get(type(value))
+    if factory is None:
+        return numpy_block(value)
+    return factory(value)
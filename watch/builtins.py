@@ -1,21 +1,112 @@
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import abc
-from operator import xor
+import copy
+import operator
 from functools import reduce
+import reprlib
 
 
-from .core import PredicateController, WatchMe
+from .core import (
+    PredicateController, SetattrStorage, SlotStorage, WatchMe, validator_type
+)
+from .blocks import as_block
+from .cache import ResultCache
+from .sampling import Sampler
+from .typecache import type_based
+from .adaptive import Ranking
+from . import deferred
+from . import parallel
+from . import proxies
 
 
-class BaseControlledValidator(WatchMe, PredicateController):
+# attributes of validators, that are not a part of their structure, thus
+# could be set any time
+BOOKKEEPING = frozenset(
+    [
+        "__class__", "field_name", "_check", "frozen", "structure_key",
+        "keep_eye_on_me", "cache", "sampler", "ranking",
+    ] +
+    list(SlotStorage.bindings) + list(SetattrStorage.bindings)
+)
+
+
+def hashable(value):
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class ValidatorMeta(type(WatchMe)):
+    """Freezes validators once they are constructed.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        validator = super().__call__(*args, **kwargs)
+        validator.__dict__["frozen"] = True
+        return validator
+
+
+class BaseControlledValidator(
+    WatchMe, PredicateController, metaclass=ValidatorMeta
+):
+    """Validators are immutable, equal if they are built the same way, and
+    could be used as dict keys. Validators with a state of their own (like
+    caches) are only equal to themselves, set 'stateful' for those.
+    """
+
+    stateful = False
 
     def generate_error_message(self, field_name, value):
         return (
             "It is not allowed to initialize %s object with a value of %s." %
             (
-                type(self).__qualname__, value
+                type(self).__qualname__, reprlib.repr(value)
             )
         )
 
+    def __setattr__(self, name, value):
+        if self.__dict__.get("frozen") and name not in BOOKKEEPING:
+            raise AttributeError(
+                "%s object is immutable, can not set '%s'." %
+                (type(self).__qualname__, name)
+            )
+        super().__setattr__(name, value)
+
+    def structure(self):
+        """Returns hashable key, that is the same for structurally equal
+        validators. Validators holding unhashable values are only equal to
+        themselves.
+        """
+        key = self.__dict__.get("structure_key")
+        if key is not None:
+            return key
+        key = (id, id(self))
+        if not self.stateful:
+            state = tuple(sorted(
+                (name, hashable(value))
+                for name, value in self.__dict__.items()
+                if name not in BOOKKEEPING
+            ))
+            try:
+                hash(state)
+            except TypeError:
+                pass
+            else:
+                key = (validator_type(self), state)
+        self.__dict__["structure_key"] = key
+        return key
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, BaseControlledValidator):
+            return NotImplemented
+        return self.structure() == other.structure()
+
+    def __hash__(self):
+        return hash(self.structure())
+
 
 class Predicate(BaseControlledValidator):
     """Validation based on given 'predicate' function.
@@ -33,9 +124,23 @@ class Predicate(BaseControlledValidator):
     def __init__(self, predicate):
         self.predicate = predicate
 
+    def predicate_block(self, block):
+        if self.predicate is Whatever.predicate:
+            return True
+        return None
+
+
+def anything(item):
+    return True
+
 
-Whatever = Predicate(lambda item: True)
-Nothing = Predicate(lambda item: False)
+def nothing(item):
+    return False
+
+
+# plain functions rather than lambdas, so that these could be pickled
+Whatever = Predicate(anything)
+Nothing = Predicate(nothing)
 
 
 class InstanceOf(BaseControlledValidator):
@@ -49,6 +154,14 @@ class InstanceOf(BaseControlledValidator):
     def predicate(self, value):
         return isinstance(value, self.types)
 
+    def predicate_block(self, block):
+        if not len(block):
+            return True
+        if not type_based(self.types):
+            # the metaclass looks at the items themselves
+            return None
+        return issubclass(block.item_type, self.types)
+
     def __init__(self, *types):
         self.types = tuple(types)
 
@@ -78,41 +191,179 @@ class Not(BaseControlledValidator):
     def predicate(self, value):
         return not self.inner_checker.predicate(value)
 
+    def predicate_block(self, block):
+        # type checks are the only ones, that give the very same answer for
+        # every item of a block
+        if type(self.inner_checker) is InstanceOf:
+            if not len(block):
+                return True
+            verdict = self.inner_checker.predicate_block(block)
+            if verdict is None:
+                return None
+            return not verdict
+        return None
+
     def __init__(self, inner_checker):
         self.inner_checker = inner_checker
 
 
 class AgnosticComparator(BaseControlledValidator):
     value_to_check_agains = Not(InstanceOf(PredicateController))
+    operator = None
+
+    def predicate_block(self, block):
+        return block.compare(self.operator, self.value_to_check_against)
 
     def __init__(self, value_to_check_against):
         self.value_to_check_against = value_to_check_against
 
 
 class GtThen(AgnosticComparator):
+    operator = operator.gt
 
     def predicate(self, value):
         return value > self.value_to_check_against
 
 
 class GtEqThen(AgnosticComparator):
+    operator = operator.ge
 
     def predicate(self, value):
         return value >= self.value_to_check_against
 
 
 class LtThen(AgnosticComparator):
+    operator = operator.lt
 
     def predicate(self, value):
         return value < self.value_to_check_against
 
 
 class LtEqThen(AgnosticComparator):
+    operator = operator.le
 
     def predicate(self, value):
         return value <= self.value_to_check_against
 
 
+class Interval(BaseControlledValidator):
+    """Values between 'lower' and 'upper' bounds, None means there is no
+    such bound, e.g. Interval(0, 100) accepts 0 <= value < 100, the way
+    range does, use lower_closed and upper_closed to tell otherwise. The
+    optimizer turns chains of comparators, like (InstanceOf(int) > 0) < 100,
+    into intervals.
+    """
+
+    def predicate(self, value):
+        lower, upper = self.lower, self.upper
+        if lower is not None and not (
+            value >= lower if self.lower_closed else value > lower
+        ):
+            return False
+        return upper is None or (
+            value <= upper if self.upper_closed else value < upper
+        )
+
+    def predicate_block(self, block):
+        verdict = True
+        for comparison, bound in self.comparisons():
+            bound_verdict = block.compare(comparison, bound)
+            if bound_verdict is None:
+                verdict = None
+            elif not bound_verdict:
+                return False
+        return verdict
+
+    def comparisons(self):
+        """Returns (operator, bound) pairs, value has to satisfy.
+        """
+        pairs = []
+        if self.lower is not None:
+            pairs.append(
+                (operator.ge if self.lower_closed else operator.gt, self.lower)
+            )
+        if self.upper is not None:
+            pairs.append(
+                (operator.le if self.upper_closed else operator.lt, self.upper)
+            )
+        return pairs
+
+    def is_empty(self):
+        lower, upper = self.lower, self.upper
+        if lower is None or upper is None:
+            return False
+        return lower > upper or (
+            lower == upper and not (self.lower_closed and self.upper_closed)
+        )
+
+    def __init__(
+        self, lower=None, upper=None, lower_closed=True, upper_closed=False
+    ):
+        self.lower = lower
+        self.upper = upper
+        self.lower_closed = lower_closed
+        self.upper_closed = upper_closed
+
+
+def connected(first, second):
+    """Tells whether union of the intervals is an interval, the first one
+    does not start later than the second.
+    """
+    if first.upper is None or second.lower is None:
+        return True
+    return first.upper > second.lower or (
+        first.upper == second.lower and
+        (first.upper_closed or second.lower_closed)
+    )
+
+
+def joined(first, second):
+    upper, upper_closed = first.upper, first.upper_closed
+    if upper is not None:
+        if second.upper is None or second.upper > upper:
+            upper, upper_closed = second.upper, second.upper_closed
+        elif second.upper == upper:
+            upper_closed = upper_closed or second.upper_closed
+    return Interval(first.lower, upper, first.lower_closed, upper_closed)
+
+
+class IntervalSet(BaseControlledValidator):
+    """Union of intervals, e.g. IntervalSet(Interval(0, 10), Interval(20))
+    The intervals are merged into sorted disjoint ones, so the check is a
+    binary search, whatever the number of intervals is. Bounds have to be
+    comparable to each other.
+    """
+
+    def predicate(self, value):
+        intervals = self.intervals
+        if not intervals:
+            return False
+        return intervals[bisect_right(self.starts, value)].predicate(value)
+
+    def predicate_block(self, block):
+        for interval in self.intervals:
+            if interval.predicate_block(block):
+                return True
+        return None
+
+    def __init__(self, *intervals):
+        merged = []
+        for interval in sorted(
+            (interval for interval in intervals if not interval.is_empty()),
+            key=lambda interval: (
+                interval.lower is not None, interval.lower,
+                not interval.lower_closed,
+            )
+        ):
+            if merged and connected(merged[-1], interval):
+                merged[-1] = joined(merged[-1], interval)
+            else:
+                merged.append(interval)
+        self.intervals = tuple(merged)
+        # only the first interval could go all the way down
+        self.starts = tuple(interval.lower for interval in merged[1:])
+
+
 class HasAttr(BaseControlledValidator):
     """
     Checks that value has given attribute.
@@ -135,29 +386,86 @@ class Container(BaseControlledValidator):
 
     Warning: validation actually iterates over the container, thus in some
     cases (e.g. generators) validation may screw up your container.
+
+    Blocks of homogeneous items (range, bytes, array.array, memoryview,
+    numpy arrays) are checked as a whole, whenever items validator is able
+    to do so, see watch.blocks.
+
+    With proxy=True lists and sets assigned to the field get wrapped into
+    proxies, that validate new items on every mutation, see watch.proxies.
+
+    With lazy=True iterators (generators and such) are not consumed: the
+    field stores a wrapping iterator, that checks every item as it is pulled
+    out of it. Note, that lazy only makes sense for the field's validator
+    itself, nested lazy containers just let iterators through.
     """
 
     items = InstanceOf(PredicateController)
     container_type = SubclassOf(abc.Iterable)
 
     def predicate(self, value):
-        return (
+        if not isinstance(value, self.container_type):
+            return False
+        if self.lazy and isinstance(value, abc.Iterator):
+            # items get checked on their way out, see _adopt
+            return True
+        items = self.items
+        block = as_block(value)
+        if block is not None:
+            verdict = items.predicate_block(block)
+            if verdict is not None:
+                return verdict
+        return all(items.predicate(item) for item in value)
+
+    def locate_failure(self, value):
+        # iterators are not touched, they are probably consumed by now anyway
+        if (
             isinstance(value, self.container_type) and
-            all(self.items.predicate(item) for item in value)
-        )
+            not isinstance(value, abc.Iterator)
+        ):
+            check = self.items._compiled()
+            for index, item in enumerate(value):
+                if not check(item):
+                    path, part = self.items.locate_failure(item)
+                    return (index,) + path, part
+        return (), value
+
+    def __set__(self, passed_instance, value):
+        if self.proxy or self.lazy:
+            self._set_adopted(passed_instance, value)
+        else:
+            super().__set__(passed_instance, value)
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        field_name = field_name or self.field_name
+        if self.lazy and isinstance(value, abc.Iterator):
+            return proxies.WatchedIterator(
+                value, passed_instance, self, field_name
+            )
+        if self.proxy:
+            return proxies.watched(
+                value, passed_instance, self, field_name,
+                proxies.CONTAINER_PROXIES
+            )
+        return value
 
-    def __init__(self, items=None, container=None):
+    def __init__(self, items=None, container=None, proxy=False, lazy=False):
         """NOTE: strings and all kinds of mappings have the same Iterable
         interface, so choose wisely.
         """
         self.items = items is not None and items or Whatever
         self.container_type = container or abc.Iterable
+        self.proxy = proxy
+        self.lazy = lazy
 
 
 class Mapping(BaseControlledValidator):
     """
     Pretty much what you expect - maps keys to values, which are
     controlled by 'keys' and 'values' validators respectively.
+
+    With proxy=True dicts assigned to the field get wrapped into proxies,
+    that validate new items on every mutation, see watch.proxies.
     """
 
     keys = InstanceOf(PredicateController)
@@ -174,10 +482,37 @@ class Mapping(BaseControlledValidator):
             )
         )
 
-    def __init__(self, keys=None, values=None, container=None):
+    def locate_failure(self, value):
+        if isinstance(value, self.container_type):
+            keys, values = self.keys._compiled(), self.values._compiled()
+            for key, item in value.items():
+                if not keys(key):
+                    # the key itself is the failing part
+                    return (key,), key
+                if not values(item):
+                    path, part = self.values.locate_failure(item)
+                    return (key,) + path, part
+        return (), value
+
+    def __set__(self, passed_instance, value):
+        if self.proxy:
+            self._set_adopted(passed_instance, value)
+        else:
+            super().__set__(passed_instance, value)
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        if self.proxy:
+            return proxies.watched(
+                value, passed_instance, self, field_name or self.field_name,
+                proxies.MAPPING_PROXIES
+            )
+        return value
+
+    def __init__(self, keys=None, values=None, container=None, proxy=False):
         self.keys = keys or Whatever
         self.values = values or Whatever
         self.container_type = container or abc.Mapping
+        self.proxy = proxy
 
 
 class NAryConstructor(BaseControlledValidator):
@@ -197,46 +532,401 @@ class NAryConstructor(BaseControlledValidator):
         )
     )
 
+    adaptive = False
+
+    @property
+    def stateful(self):
+        # adaptive nodes keep statistics of their own
+        return self.adaptive
+
     def __init__(self, *combine_from):
-        self.combined_from = list(controller() for controller in combine_from)
+        self.combined_from = tuple(
+            controller() for controller in combine_from
+        )
 
 
-class Or(NAryConstructor):
+class AdaptiveConstructor(NAryConstructor):
+    """Base for And and Or, which could try their branches in the order of
+    how often each branch decides the outcome, e.g.
+    Or(InstanceOf(str), InstanceOf(bytes), InstanceOf(int), adaptive=True)
+    Passing adaptive=True declares, that the branches have no side effects
+    and do not rely on each other, thus the order they are tried in does not
+    matter. Mind guards like And(InstanceOf(int), GtThen(0)), where the
+    comparison fails with TypeError on strings when tried first. The order
+    is revised once every 'period' decisions, see watch.adaptive and
+    statistics().
+    """
+
+    def statistics(self):
+        if self.ranking is None:
+            return None
+        return self.ranking.statistics()
+
+    def _bound(self, field_name):
+        clone = super()._bound(field_name)
+        if clone.ranking is not None:
+            # every field ranks the branches on its own
+            clone.ranking = copy.copy(self.ranking)
+        return clone
+
+    def __init__(self, *combine_from, adaptive=False, period=1000):
+        super().__init__(*combine_from)
+        self.adaptive = adaptive
+        self.ranking = None
+        if adaptive:
+            self.ranking = Ranking(self.combined_from, period)
+
+
+class Or(AdaptiveConstructor):
 
     def predicate(self, value):
+        ranking = self.ranking
+        if ranking is not None:
+            for index, check in ranking.ordered():
+                if check(value):
+                    ranking.decided(index)
+                    return True
+            return False
         return any(checker.predicate(value) for checker in self.combined_from)
 
+    def predicate_block(self, block):
+        # every item matches the same branch is the only case we can tell
+        for checker in self.combined_from:
+            if checker.predicate_block(block):
+                return True
+        return None
 
-class And(NAryConstructor):
+
+class And(AdaptiveConstructor):
 
     def predicate(self, value):
+        ranking = self.ranking
+        if ranking is not None:
+            for index, check in ranking.ordered():
+                if not check(value):
+                    ranking.decided(index)
+                    return False
+            return True
         return all(checker.predicate(value) for checker in self.combined_from)
 
+    def locate_failure(self, value):
+        for checker in self.combined_from:
+            if not checker._check(value):
+                return checker.locate_failure(value)
+        return (), value
+
+    def predicate_block(self, block):
+        verdict = True
+        for checker in self.combined_from:
+            checker_verdict = checker.predicate_block(block)
+            if checker_verdict is None:
+                verdict = None
+            elif not checker_verdict:
+                return False
+        return verdict
+
 
 class Xor(NAryConstructor):
 
     def predicate(self, value):
         return reduce(
-            xor,
+            operator.xor,
             (checker.predicate(value) for checker in self.combined_from),
             False
         )
 
 
+class SortedArray:
+    """Compact sorted set of ints packed into array.array, membership test
+    is a binary search. Takes way less memory than a frozenset of ints.
+    """
+
+    def __init__(self, values):
+        self.values = array("q", sorted(set(values)))
+
+    def __contains__(self, value):
+        values = self.values
+        try:
+            position = bisect_left(values, value)
+        except TypeError:
+            # value is not comparable to ints, thus can not be equal to any
+            return False
+        return position < len(values) and values[position] == value
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __eq__(self, other):
+        if not isinstance(other, SortedArray):
+            return NotImplemented
+        return self.values == other.values
+
+    def __hash__(self):
+        return hash(tuple(self.values))
+
+
 class Just(BaseControlledValidator):
     """Just is an exact match validator, e.g. Just(10) is True only
     for the value of 10.  Accepts multiple init values at once, e.g.
     Just(1,2,3) is the same as Just(1) | Just(2) | Just(3)
+
+    Values are indexed with a frozenset, unless there is something
+    unhashable among them. Large enumerations of ints could be stored as
+    a sorted array instead by passing compact=True, which saves memory at
+    the cost of O(log n) lookups.
     """
 
     test_against = And(
-        Container(HasAttr("__eq__"), container=tuple),
+        Or(
+            Container(HasAttr("__eq__"), container=tuple),
+            InstanceOf(SortedArray),
+        ),
         Predicate(lambda value: len(value) > 0),
     )
 
     def predicate(self, value):
+        index = self.index
+        if index is not None:
+            try:
+                return value in index
+            except TypeError:
+                # unhashable value, which still may be equal to one of ours
+                pass
         return value in self.test_against
 
-    def __init__(self, *values):
+    def predicate_block(self, block):
+        distinct = block.distinct()
+        if distinct is None:
+            return None
+        if len(distinct) > len(self.test_against):
+            # pigeonhole, some of the items are definitely not ours
+            return False
+        return all(self.predicate(item) for item in distinct)
+
+    def __init__(self, *values, compact=False):
+        if compact and all(type(value) is int for value in values):
+            try:
+                self.test_against = SortedArray(values)
+                self.index = None
+                return
+            except OverflowError:
+                # does not fit into 64 bits, go with a regular index
+                pass
+
         self.test_against = tuple(values)
+        try:
+            self.index = frozenset(values)
+        except TypeError:
+            self.index = None
+
+
+class Cached(BaseControlledValidator):
+    """Remembers verdicts of the inner validator for deeply immutable values
+    (tuples, frozensets, strings, numbers and nestings of those), so that
+    assigning an already checked value again is a dict lookup, e.g.
+    Cached(Container(InstanceOf(str) >> InstanceOf(int)), maxsize=128)
+    Use cache_info() to see how well it goes.
+    """
+
+    stateful = True
+
+    inner_checker = InstanceOf(PredicateController)
+    maxsize = Predicate(lambda value: isinstance(value, int) and value > 0)
+
+    def predicate(self, value):
+        return self.cache.get(value, self.inner_checker._check)
+
+    def locate_failure(self, value):
+        return self.inner_checker.locate_failure(value)
+
+    def cache_info(self):
+        return self.cache.info()
+
+    def __set__(self, passed_instance, value):
+        self._set_adopted(passed_instance, value)
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        return self.inner_checker._adopt(
+            passed_instance, value, field_name or self.field_name
+        )
+
+    def _bound(self, field_name):
+        clone = super()._bound(field_name)
+        # every field has a cache of its own
+        clone.cache = ResultCache(self.maxsize)
+        return clone
+
+    def __init__(self, inner_checker, maxsize=1024):
+        self.inner_checker = inner_checker
+        self.maxsize = maxsize
+        self.cache = ResultCache(maxsize)
+
+
+class Sampled(BaseControlledValidator):
+    """Checks only a part of the work the inner validator would do, to keep
+    the cost of validation bounded for huge containers or hot fields, e.g.
+    Sampled(Container(InstanceOf(int)), head=100, sample=100, seed=42)
+    checks the first 100 items plus 100 random ones, while
+    Sampled(InstanceOf(int), every=10)
+    checks one out of ten assigned values. Random picks come from a
+    generator seeded with 'seed', so runs are reproducible. See statistics()
+    for the policy and the number of partial and skipped checks. Iterators
+    have no length to sample from, they go to the inner validator whole.
+    """
+
+    stateful = True
+
+    inner_checker = InstanceOf(PredicateController)
+    head = Predicate(
+        lambda value: value is None or isinstance(value, int) and value >= 0
+    )
+    sample = Predicate(lambda value: isinstance(value, int) and value >= 0)
+    every = Predicate(lambda value: isinstance(value, int) and value > 0)
+
+    def predicate(self, value):
+        sampler = self.sampler
+        if sampler.skip():
+            return True
+        verdict = self.predicate_sampled(value)
+        if not verdict:
+            sampler.failed()
+        return verdict
+
+    def predicate_sampled(self, value):
+        inner = self.inner_checker
+        inner_type = validator_type(inner)
+        if (
+            inner_type not in (Container, Mapping) or
+            not isinstance(value, inner.container_type)
+        ):
+            return inner._check(value)
+        rows = self.sampler.rows(value, inner_type is Mapping)
+        if rows is None:
+            return inner._check(value)
+        if inner_type is Mapping:
+            keys, values = inner.keys._compiled(), inner.values._compiled()
+            return all(keys(key) and values(item) for key, item in rows)
+        return all(map(inner.items._compiled(), rows))
+
+    def __set__(self, passed_instance, value):
+        self._set_adopted(passed_instance, value)
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        return self.inner_checker._adopt(
+            passed_instance, value, field_name or self.field_name
+        )
 
+    def locate_failure(self, value):
+        return self.inner_checker.locate_failure(value)
+
+    def statistics(self):
+        return self.sampler.statistics()
+
+    def _bound(self, field_name):
+        clone = super()._bound(field_name)
+        # every field has a sampler of its own, starting from scratch
+        clone.sampler = copy.copy(self.sampler)
+        return clone
+
+    def __init__(self, inner_checker, head=None, sample=0, every=1, seed=0):
+        self.inner_checker = inner_checker
+        self.head = head
+        self.sample = sample
+        self.every = every
+        self.sampler = Sampler(head, sample, every, seed)
+
+
+class Deferred(BaseControlledValidator):
+    """Stores values right away and checks them against the inner validator
+    later on, in a background thread, e.g.
+    Deferred(Container(InstanceOf(float)), on_failure=report)
+    Failures are passed to on_failure(instance, field_name, value), which
+    logs them by default. Use watch.flush() to wait for pending checks and
+    watch.deferred.metrics() to see how far behind the checks are.
+
+    Generated __init__ and update() still check deferred fields right away.
+    """
+
+    inner_checker = InstanceOf(PredicateController)
+    on_failure = Predicate(callable)
+
+    def predicate(self, value):
+        return self.inner_checker._check(value)
+
+    def __set__(self, passed_instance, value):
+        self._store(passed_instance, self._adopt(passed_instance, value))
+        if passed_instance.keep_eye_on_me:
+            # the value is checked as is, rather than its proxy
+            deferred.worker.submit(self, passed_instance, value)
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        return self.inner_checker._adopt(
+            passed_instance, value, field_name or self.field_name
+        )
+
+    def locate_failure(self, value):
+        return self.inner_checker.locate_failure(value)
+
+    def __init__(self, inner_checker, on_failure=deferred.log_failure):
+        self.inner_checker = inner_checker
+        self.on_failure = on_failure
+
+
+class Parallel(BaseControlledValidator):
+    """Checks items of huge containers in worker processes, chunk by chunk,
+    e.g. Parallel(Container(Mapping(InstanceOf(str), InstanceOf(int))))
+    Containers shorter than 'threshold' are checked right here, as well as
+    blocks (see watch.blocks), that are fast enough as they are. Item
+    validators get pickled, so Predicate must use module level functions.
+    """
+
+    inner_checker = InstanceOf(Container, Mapping)
+    threshold = Predicate(lambda value: isinstance(value, int) and value > 0)
+    chunk_size = Predicate(lambda value: isinstance(value, int) and value > 0)
+    workers = Predicate(
+        lambda value: value is None or isinstance(value, int) and value > 0
+    )
+
+    def predicate(self, value):
+        inner = self.inner_checker
+        if not isinstance(value, inner.container_type):
+            return False
+        if (
+            not isinstance(value, abc.Sized) or
+            len(value) < self.threshold or
+            as_block(value) is not None
+        ):
+            return inner._check(value)
+        if validator_type(inner) is Mapping:
+            return parallel.run(
+                parallel.check_rows, (inner.keys, inner.values),
+                parallel.chunked(value.items(), self.chunk_size),
+                self.workers,
+            )
+        return parallel.run(
+            parallel.check_items, (inner.items,),
+            parallel.chunked(value, self.chunk_size),
+            self.workers,
+        )
+
+    def __set__(self, passed_instance, value):
+        self._set_adopted(passed_instance, value)
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        return self.inner_checker._adopt(
+            passed_instance, value, field_name or self.field_name
+        )
+
+    def locate_failure(self, value):
+        return self.inner_checker.locate_failure(value)
+
+    def __init__(
+        self, inner_checker, threshold=100000, chunk_size=50000, workers=None
+    ):
+        self.inner_checker = inner_checker
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.workers = workers
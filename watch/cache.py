@@ -0,0 +1,81 @@
+"""Verdict cache for deeply immutable values.
+
+Tuples, frozensets, strings, numbers and any nesting of those can not change
+once created, so a verdict given for such a value holds for as long as the
+value lives. The cache keys verdicts on the identity of the value. Most of
+these types do not support weak references, so every entry keeps its value
+alive instead: the id of a cached value can not be reused by some other
+object until the entry gets evicted, which keeps the lookup by id safe.
+"""
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+ATOMS = frozenset([
+    type(None), type(Ellipsis), bool, int, float, complex, str, bytes, range
+])
+
+
+def is_deeply_immutable(value):
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type in ATOMS:
+            continue
+        if value_type is tuple or value_type is frozenset:
+            stack.extend(value)
+            continue
+        return False
+    return True
+
+
+class ResultCache:
+    """Bounded LRU mapping of value identities to verdicts.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self):
+        # copies start from scratch, locks are not copyable anyway
+        return type(self), (self.maxsize,)
+
+    def get(self, value, predicate):
+        """Returns cached verdict for the value, computing it with the
+        predicate on a miss.
+        """
+        key = id(value)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] is value:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        verdict = predicate(value)
+        if is_deeply_immutable(value):
+            with self.lock:
+                self.entries[key] = (value, verdict)
+                if len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return verdict
+
+    def info(self):
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self.entries)
+        )
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
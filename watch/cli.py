@@ -0,0 +1,302 @@
+"""Bulk validation of data files against WatchMe classes.
+
+    python -m watch validate module:Class data.jsonl
+    python -m watch validate module:Class data.csv --workers 8
+    python -m watch validate module:Class data.jsonl --bench
+
+Every row (a JSON object per line, or a CSV row under a header line) is
+checked against the validators of the class fields, without creating any
+instances. Keys that are not fields of the class are ignored, missing ones
+are only reported for classes with init=True. CSV cells are decoded as JSON
+literals where possible (so 42 is an int), the rest are kept as strings.
+Rows must not span several lines.
+
+The file is mmaped and cut into chunks of whole lines, workers map the same
+file and get nothing but offsets of their chunks, so memory stays flat no
+matter how big the file is. Standard input ('-') is read in blocks instead.
+"""
+
+import argparse
+import csv
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib import import_module
+import json
+import mmap
+import os
+import reprlib
+import sys
+import time
+
+
+BLOCK_SIZE = 1 << 22
+
+
+@lru_cache(maxsize=None)
+def load_class(target):
+    """Imports class given as 'package.module:Class'.
+    """
+    module_name, _, name = target.partition(":")
+    if not name:
+        raise ValueError("expected module:Class, got %r" % target)
+    found = import_module(module_name)
+    for part in name.split("."):
+        found = getattr(found, part)
+    return found
+
+
+@lru_cache(maxsize=None)
+def field_checks(target):
+    watched_type = load_class(target)
+    required = bool(getattr(watched_type, "__watch_init__", False))
+    checks = {
+        name: field._compiled()
+        for name, field in watched_type.__watched__.items()
+    }
+    return checks, required
+
+
+@lru_cache(maxsize=None)
+def mapped(path):
+    with open(path, "rb") as source:
+        return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def decode_cell(cell):
+    try:
+        return json.loads(cell)
+    except ValueError:
+        return cell
+
+
+def parse(line, header):
+    """Returns the row on the line as a dict, header is None for JSON lines.
+    """
+    if header is None:
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError("not an object")
+        return row
+    cells = next(csv.reader([line.decode()]))
+    if len(cells) != len(header):
+        raise ValueError(
+            "%d cells, while there are %d columns" % (len(cells), len(header))
+        )
+    return dict(zip(header, map(decode_cell, cells)))
+
+
+def row_failures(row, checks, required):
+    for name, check in checks.items():
+        if name not in row:
+            if required:
+                yield "field '%s' is missing" % name
+            continue
+        value = row[name]
+        try:
+            accepted = check(value)
+        except Exception as error:
+            # e.g. GtThen(0) on a csv cell, which is always a string
+            yield "field '%s' fails on %s with %s: %s" % (
+                name, reprlib.repr(value), type(error).__name__, error
+            )
+        else:
+            if not accepted:
+                yield "field '%s' does not accept %s" % (
+                    name, reprlib.repr(value)
+                )
+
+
+def check_chunk(target, header, chunk):
+    """Checks lines of the chunk. Returns number of lines, number of rows
+    and a list of (line number within the chunk, message) pairs.
+    """
+    checks, required = field_checks(target)
+    lines = chunk.split(b"\n")
+    if not lines[-1]:
+        lines.pop()
+    rows = 0
+    failures = []
+    for number, line in enumerate(lines):
+        if not line.strip():
+            continue
+        rows += 1
+        try:
+            row = parse(line, header)
+        except ValueError as error:
+            failures.append((number, "can not parse the row: %s" % error))
+            continue
+        for message in row_failures(row, checks, required):
+            failures.append((number, message))
+    return len(lines), rows, failures
+
+
+def check_span(target, header, path, start, end):
+    """Same as check_chunk for the chunk of the file between the offsets.
+    """
+    return check_chunk(target, header, mapped(path)[start:end])
+
+
+def mapped_chunks(source, offset, block_size):
+    """Cuts mmaped file into chunks of whole lines, yields (start, end)
+    offsets of the chunks.
+    """
+    size = len(source)
+    while offset < size:
+        end = source.find(b"\n", min(offset + block_size, size) - 1)
+        end = size if end == -1 else end + 1
+        yield offset, end
+        offset = end
+
+
+def read_chunks(source, block_size):
+    """Same as mapped_chunks for streams, yields chunks themselves.
+    """
+    tail = b""
+    while True:
+        block = source.read(block_size)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b"\n") + 1
+        if not cut:
+            tail = block
+            continue
+        tail = block[cut:]
+        yield block[:cut]
+    if tail:
+        yield tail
+
+
+def read_header(line):
+    return next(csv.reader([line.decode()]))
+
+
+def validate(target, path, csv_format=False, workers=None,
+             block_size=BLOCK_SIZE):
+    """Yields (rows, failures) results of the chunks in the file order,
+    failures are (line number, message) pairs.
+    """
+    if path == "-":
+        stream = sys.stdin.buffer
+        header = read_header(stream.readline()) if csv_format else None
+        results = checked_chunks(
+            target, header, read_chunks(stream, block_size), workers
+        )
+    elif not os.path.getsize(path):
+        # empty files can not be mmaped
+        return
+    else:
+        with open(path, "rb") as stream:
+            source = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        header = None
+        offset = 0
+        if csv_format:
+            offset = source.find(b"\n") + 1 or len(source)
+            header = read_header(source[:offset])
+        results = checked_chunks(
+            target, header, mapped_chunks(source, offset, block_size),
+            workers, path, source
+        )
+
+    lineno = 1 + (header is not None)
+    for lines, rows, failures in results:
+        yield rows, [
+            (lineno + number, message) for number, message in failures
+        ]
+        lineno += lines
+
+
+def checked_chunks(target, header, chunks, workers=None, path=None,
+                   source=None):
+    """Checks chunks, which are either bytes or (start, end) offsets into
+    the mmaped source, yields results of check_chunk in the same order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            if isinstance(chunk, tuple):
+                chunk = source[slice(*chunk)]
+            yield check_chunk(target, header, chunk)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        # just enough chunks are in flight to keep workers busy
+        window = deque()
+        for chunk in chunks:
+            if isinstance(chunk, tuple):
+                window.append(
+                    pool.submit(check_span, target, header, path, *chunk)
+                )
+            else:
+                window.append(pool.submit(check_chunk, target, header, chunk))
+            if len(window) >= 2 * workers:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def run_validate(arguments, output):
+    load_class(arguments.target)
+    csv_format = (
+        arguments.format == "csv" or
+        arguments.format is None and arguments.path.endswith(".csv")
+    )
+    started = time.perf_counter()
+    rows = failed = 0
+    for chunk_rows, failures in validate(
+        arguments.target, arguments.path, csv_format, arguments.workers,
+        arguments.block_size
+    ):
+        rows += chunk_rows
+        for lineno, message in failures:
+            if not arguments.bench and failed < arguments.max_failures:
+                output.write("%s:%d: %s\n" % (arguments.path, lineno, message))
+            failed += 1
+    elapsed = time.perf_counter() - started
+
+    output.write(
+        "%d rows, %d failures, %.2f s, %.0f rows/s\n" % (
+            rows, failed, elapsed, rows / elapsed if elapsed else 0
+        )
+    )
+    return 1 if failed and not arguments.bench else 0
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog="python -m watch")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    command = commands.add_parser(
+        "validate", help="validate rows of a data file against a class"
+    )
+    command.add_argument("target", help="class to check against, module:Class")
+    command.add_argument("path", help="JSON lines or CSV file, - for stdin")
+    command.add_argument(
+        "--format", choices=("jsonl", "csv"),
+        help="file format, figured out from the file extension by default"
+    )
+    command.add_argument(
+        "--workers", type=int, default=None,
+        help="number of worker processes, one means no pool at all"
+    )
+    command.add_argument(
+        "--block-size", type=int, default=BLOCK_SIZE,
+        help="size of chunks handed over to workers, in bytes"
+    )
+    command.add_argument(
+        "--max-failures", type=int, default=100,
+        help="number of failures to print, the rest are just counted"
+    )
+    command.add_argument(
+        "--bench", action="store_true",
+        help="only report the throughput, failures do not fail the run"
+    )
+    command.set_defaults(handler=run_validate)
+    return parser
+
+
+def main(argv=None, output=None):
+    arguments = make_parser().parse_args(argv)
+    return arguments.handler(arguments, output or sys.stdout)
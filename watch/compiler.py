@@ -0,0 +1,334 @@
+"""Validator compiler.
+
+Walking a validator tree node by node means a bound method call plus a couple
+of descriptor lookups for every hop, which is pretty much all the time spent
+when setting something like Container(InstanceOf(str) >> InstanceOf(int)).
+This module turns a tree of builtin validators into python source with all the
+checks inlined and plain loops for containers, then execs it into a single
+function. Anything it does not know about (Predicate, custom validators) is
+called via its 'predicate' as is, so are adaptive And and Or nodes. Wide
+unions dispatch on the type of the value, see watch.dispatch. The tree is run
+through the optimizer first.
+"""
+
+from collections import OrderedDict, abc
+from threading import Lock
+
+from . import builtins
+from .core import validator_type
+from .blocks import as_block
+from .dispatch import Dispatcher, dispatchable
+from .optimizer import optimize
+from . import typecache
+from .typecache import type_based, verdicts, worth_caching
+
+
+def blockable(node):
+    """Tells whether node is able to check a block of items at once, which
+    is worth trying before iterating over the container.
+    """
+    node_type = type(node)
+    if node_type in (builtins.InstanceOf, builtins.Just):
+        return True
+    if node_type in (
+        builtins.GtThen, builtins.GtEqThen, builtins.LtThen, builtins.LtEqThen,
+        builtins.Interval, builtins.IntervalSet,
+    ):
+        return True
+    if node_type is builtins.Not:
+        return type(node.inner_checker) is builtins.InstanceOf
+    if node_type in (builtins.And, builtins.Or):
+        return any(blockable(checker) for checker in node.combined_from)
+    return False
+
+
+class Compiler:
+    """Collects generated source along with the constants it refers to.
+    """
+
+    def __init__(self):
+        self.namespace = {}
+        self.constants = {}
+        self.helpers = []
+        self.handlers = {
+            builtins.InstanceOf: self.instance_of,
+            builtins.SubclassOf: self.subclass_of,
+            builtins.Not: self.negation,
+            builtins.GtThen: self.comparator(">"),
+            builtins.GtEqThen: self.comparator(">="),
+            builtins.LtThen: self.comparator("<"),
+            builtins.LtEqThen: self.comparator("<="),
+            builtins.Interval: self.interval,
+            builtins.HasAttr: self.has_attr,
+            builtins.Just: self.just,
+            builtins.Container: self.container,
+            builtins.Mapping: self.mapping,
+            builtins.Or: self.union,
+            builtins.And: self.n_ary(" and "),
+            builtins.Xor: self.xor,
+        }
+
+    def constant(self, value):
+        name = self.constants.get(id(value))
+        if name is None:
+            name = "_c%d" % len(self.constants)
+            self.constants[id(value)] = name
+            self.namespace[name] = value
+        return name
+
+    def helper(self, prefix, lines):
+        name = "_%s%d" % (prefix, len(self.helpers))
+        self.helpers.append(
+            "def %s(value):\n%s\n" % (
+                name, "\n".join("    " + line for line in lines)
+            )
+        )
+        return name
+
+    def expression(self, node, var):
+        """Returns python expression (as a string) that checks variable
+        'var' against the node.
+        """
+        if node.predicate is builtins.Whatever.predicate:
+            return "True"
+        if node.predicate is builtins.Nothing.predicate:
+            return "False"
+        handler = self.handlers.get(validator_type(node))
+        if handler is None:
+            # unknown node, or a user subclass that overrides predicate
+            return "%s(%s)" % (self.constant(node.predicate), var)
+        return handler(node, var)
+
+    def type_check(self, var, types):
+        """Returns isinstance check, that goes through the verdict cache of
+        the types, when it is worth it, see watch.typecache.
+        """
+        if not isinstance(types, tuple):
+            types = (types,)
+        if not worth_caching(types):
+            if len(types) == 1:
+                # isinstance is a bit faster with a type than with a tuple
+                types = types[0]
+            return "isinstance(%s, %s)" % (var, self.constant(types))
+        cache = verdicts(types)
+        return "(type(%s) in %s or %s(%s))" % (
+            var, self.constant(cache.accepted), self.constant(cache.check), var
+        )
+
+    def instance_of(self, node, var):
+        return self.type_check(var, node.types)
+
+    def subclass_of(self, node, var):
+        if worth_caching(node.types):
+            return "(isinstance(%s, type) and %s(%s))" % (
+                var, self.constant(verdicts(node.types, True).check), var
+            )
+        return "(isinstance(%s, type) and issubclass(%s, %s))" % (
+            var, var, self.constant(node.types)
+        )
+
+    def negation(self, node, var):
+        return "(not %s)" % self.expression(node.inner_checker, var)
+
+    def comparator(self, operator):
+        def handler(node, var):
+            return "(%s %s %s)" % (
+                var, operator, self.constant(node.value_to_check_against)
+            )
+        return handler
+
+    def interval(self, node, var):
+        # a single chained comparison, like 0 <= value < 100
+        parts = []
+        if node.lower is not None:
+            parts.append("%s %s" % (
+                self.constant(node.lower), "<=" if node.lower_closed else "<"
+            ))
+        parts.append(var)
+        if node.upper is not None:
+            parts.append("%s %s" % (
+                "<=" if node.upper_closed else "<", self.constant(node.upper)
+            ))
+        if len(parts) == 1:
+            return "True"
+        return "(%s)" % " ".join(parts)
+
+    def has_attr(self, node, var):
+        return "hasattr(%s, %s)" % (var, self.constant(node.attribute_name))
+
+    def just(self, node, var):
+        if node.index is None:
+            return "(%s in %s)" % (var, self.constant(node.test_against))
+        lines = [
+            "try:",
+            "    return value in %s" % self.constant(node.index),
+            "except TypeError:",
+            "    return value in %s" % self.constant(node.test_against),
+        ]
+        return "%s(%s)" % (self.helper("just", lines), var)
+
+    def homogeneous(self, node):
+        """Returns the types, that node checks the items against, if the
+        items could be checked by their distinct types, None otherwise.
+        """
+        if validator_type(node) is not builtins.InstanceOf:
+            return None
+        if not type_based(node.types):
+            return None
+        return node.types
+
+    def homogeneous_check(self, items, types):
+        return "%s(%s, %s)" % (
+            self.constant(typecache.all_of_types), items, self.constant(types)
+        )
+
+    def container(self, node, var):
+        lines = [
+            "if not %s:" % self.type_check("value", node.container_type),
+            "    return False",
+        ]
+        if node.lazy:
+            lines.extend([
+                "if isinstance(value, %s):" % self.constant(abc.Iterator),
+                "    return True",
+            ])
+        types = self.homogeneous(node.items)
+        if types is not None:
+            lines.extend([
+                "if type(value) in %s and len(value) >= %d and %s:" % (
+                    self.constant(typecache.HOMOGENEOUS_CONTAINERS),
+                    typecache.HOMOGENEOUS_SIZE,
+                    self.homogeneous_check("value", types),
+                ),
+                "    return True",
+            ])
+        if blockable(node.items):
+            lines.extend([
+                "block = %s(value)" % self.constant(as_block),
+                "if block is not None:",
+                "    verdict = %s(block)" % self.constant(
+                    node.items.predicate_block
+                ),
+                "    if verdict is not None:",
+                "        return verdict",
+            ])
+        items = self.expression(node.items, "item")
+        if items != "True":
+            lines.extend([
+                "for item in value:",
+                "    if not %s:" % items,
+                "        return False",
+            ])
+        lines.append("return True")
+        return "%s(%s)" % (self.helper("container", lines), var)
+
+    def mapping(self, node, var):
+        lines = [
+            "if not %s:" % self.type_check("value", node.container_type),
+            "    return False",
+        ]
+        keys = self.expression(node.keys, "key")
+        values = self.expression(node.values, "item")
+        sides = [
+            (check, self.homogeneous(side), items)
+            for check, side, items in (
+                (keys, node.keys, "value"),
+                (values, node.values, "value.values()"),
+            )
+            if check != "True"
+        ]
+        if sides and all(types is not None for check, types, items in sides):
+            lines.extend([
+                "if type(value) in %s and len(value) >= %d and %s:" % (
+                    self.constant(typecache.HOMOGENEOUS_MAPPINGS),
+                    typecache.HOMOGENEOUS_SIZE,
+                    " and ".join(
+                        self.homogeneous_check(items, types)
+                        for check, types, items in sides
+                    ),
+                ),
+                "    return True",
+            ])
+        if keys != "True" or values != "True":
+            lines.append("for key, item in value.items():")
+            for check in (keys, values):
+                if check != "True":
+                    lines.extend([
+                        "    if not %s:" % check,
+                        "        return False",
+                    ])
+        lines.append("return True")
+        return "%s(%s)" % (self.helper("mapping", lines), var)
+
+    def n_ary(self, joint):
+        def handler(node, var):
+            if node.adaptive:
+                # the order of the branches changes at runtime
+                return "%s(%s)" % (self.constant(node.predicate), var)
+            return "(%s)" % joint.join(
+                self.expression(checker, var)
+                for checker in node.combined_from
+            )
+        return handler
+
+    def union(self, node, var):
+        if node.adaptive or not dispatchable(node):
+            return self.n_ary(" or ")(node, var)
+        # wide union, only the branches that could accept the type are tried
+        dispatcher = Dispatcher(node.combined_from)
+        lines = [
+            "check = %s.get(type(value))" % self.constant(dispatcher.table),
+            "if check is None:",
+            "    check = %s(type(value))" % self.constant(dispatcher.resolve),
+            "return check(value) or %s(value)" % self.constant(
+                dispatcher.recheck
+            ),
+        ]
+        return "%s(%s)" % (self.helper("dispatch", lines), var)
+
+    def xor(self, node, var):
+        # Or and And nodes are evaluated via any/all, which always gives a
+        # bool, the rest of the nodes are xored with whatever they return
+        operands = []
+        for checker in node.combined_from:
+            operand = self.expression(checker, var)
+            if type(checker) in (builtins.Or, builtins.And):
+                operand = "bool(%s)" % operand
+            operands.append(operand)
+        return "(False ^ %s)" % " ^ ".join(operands)
+
+    def build(self, node):
+        body = self.expression(node, "value")
+        source = "".join(self.helpers) + (
+            "def check(value):\n    return %s\n" % body
+        )
+        exec(source, self.namespace)
+        check = self.namespace["check"]
+        check.__source__ = source
+        return check
+
+
+# compiled functions of recently compiled trees, keyed by the trees
+COMPILED = OrderedDict()
+COMPILED_SIZE = 1024
+LOCK = Lock()
+
+
+def compile(validator):
+    """Compiles validator tree into a function value -> True/False, which is
+    equivalent to validator.predicate. Structurally equal trees share the
+    compiled function.
+    """
+    if not isinstance(validator, builtins.BaseControlledValidator):
+        return Compiler().build(optimize(validator))
+    with LOCK:
+        check = COMPILED.get(validator)
+        if check is not None:
+            COMPILED.move_to_end(validator)
+            return check
+    check = Compiler().build(optimize(validator))
+    with LOCK:
+        COMPILED[validator] = check
+        if len(COMPILED) > COMPILED_SIZE:
+            COMPILED.popitem(last=False)
+    return check
@@ -1,4 +1,7 @@
 import copy
+import os
+import reprlib
+import threading
 
 
 # this should provide watch.builtins, which on its own
@@ -6,6 +9,12 @@ import copy
 import watch
 
 
+# attributes worked out for the very instance they are set on, copies work
+# them out on their own, e.g. the compiled check of a cached validator refers
+# to the cache of the original
+DERIVED = ("_check", "structure_key")
+
+
 class AttributeDescriptor:
     """This class expresses some common logic for every attribute descriptor,
     not biggy.
@@ -39,6 +48,35 @@ class AttributeDescriptor:
         passed_instance.__dict__[self.field_name] = value
         return None
 
+    def _bound(self, field_name):
+        """Returns copy of the descriptor bound to the field. Validator trees
+        never change once built, so the copy shares all of its subtrees with
+        the original, it is just the top node that gets copied.
+        """
+        clone = copy.copy(self)
+        for name in DERIVED:
+            clone.__dict__.pop(name, None)
+        if isinstance(clone, Storage):
+            # the copy is going to be bound to some other field, so it gets
+            # back to the regular storage
+            for name in clone.bindings:
+                del clone.__dict__[name]
+            clone.__class__ = validator_type(clone)
+        clone.field_name = field_name
+        return clone
+
+
+def operands(node_type, *nodes):
+    """Unpacks operands that are n-ary nodes of the same type, so that
+    a | b | c builds a single Or node instead of Or(Or(a, b), c). Adaptive
+    nodes are kept whole, along with their statistics.
+    """
+    for node in nodes:
+        if type(node) is node_type and not node.adaptive:
+            yield from node.combined_from
+        else:
+            yield node
+
 
 class PredicateController(AttributeDescriptor):
     """Base class for any validator type in 'watch'.
@@ -67,38 +105,429 @@ class PredicateController(AttributeDescriptor):
         return watch.builtins.Not(self)
 
     def __or__(self, other):
-        return watch.builtins.Or(self, other)
+        return watch.builtins.Or(*operands(watch.builtins.Or, self, other))
 
     def __and__(self, other):
-        return watch.builtins.And(self, other)
+        return watch.builtins.And(*operands(watch.builtins.And, self, other))
 
     def __xor__(self, other):
-        return watch.builtins.Xor(self, other)
+        return watch.builtins.Xor(*operands(watch.builtins.Xor, self, other))
+
+    def predicate_block(self, block):
+        """Tells whether every item of watch.blocks.Block satisfies the
+        predicate. None means that there is no cheap way to tell, so the
+        items have to be checked one by one.
+        """
+        return None
+
+    def _check(self, value):
+        """Same as predicate, but runs the compiled version of the whole
+        validator tree. The tree gets compiled on the very first call.
+        """
+        return self._compiled()(value)
+
+    def _compiled(self):
+        """Returns the compiled version of the tree, which then replaces
+        '_check' of this very instance. Use it instead of grabbing the bound
+        '_check' method, that would compile the tree on every call.
+        """
+        if not hasattr(watch, "compiler"):
+            # watch.builtins is still being set up, nothing to compile with
+            return self.predicate
+        if "_check" not in self.__dict__:
+            self._check = watch.compiler.compile(self)
+        return self._check
+
+    def __getstate__(self):
+        # compiled check is a generated function, that can not be pickled,
+        # it gets compiled again on the first call anyway
+        state = self.__dict__.copy()
+        state.pop("_check", None)
+        return state
 
     def __set__(self, passed_instance, value):
         if passed_instance.keep_eye_on_me:
-            if self.predicate(value):
+            if self._check(value):
                 super().__set__(passed_instance, value)
             else:
                 passed_instance.complain(self.field_name, value)
         else:
             super().__set__(passed_instance, value)
 
+    def _set_adopted(self, passed_instance, value):
+        """Same as __set__, but the value gets adopted on its way into the
+        field. The value is validated as is, before it is wrapped.
+        """
+        if passed_instance.keep_eye_on_me and not self._check(value):
+            passed_instance.complain(self.field_name, value)
+        else:
+            self._store(passed_instance, self._adopt(passed_instance, value))
+
+    def _adopt(self, passed_instance, value, field_name=None):
+        """Returns the value, that is going to be actually stored in the
+        field, e.g. proxy of the value. Wrapping validators pass the name of
+        their field down to the wrapped one, that is not bound to any field.
+        """
+        return value
+
+    def locate_failure(self, value):
+        """Returns (path, part) pair, where 'part' is the piece of the value,
+        that fails the validator, and 'path' is a tuple of indices and keys
+        leading to it. Only called once validation has already failed.
+        """
+        return (), value
+
+    def _store(self, passed_instance, value):
+        """Stores the value into the field with no validation whatsoever.
+        """
+        super().__set__(passed_instance, value)
+
     def __call__(self):
         return self
 
 
+class ValidationError(AttributeError):
+    """Raised by WatchMe.complain. Carries the instance, the name of the
+    field, its validator and the rejected value. Both the message and the
+    path to the failing part of the value are only figured out when asked
+    for, so that errors, which get caught and dropped, cost next to nothing.
+    When the value is a single item of the field's container, validator is
+    the items' one and prefix leads to the item, None if that is not known.
+    """
+
+    def __init__(
+        self, instance, field_name, value, validator=None, prefix=()
+    ):
+        super().__init__()
+        self.instance = instance
+        self.field_name = field_name
+        self.value = value
+        self.validator = validator
+        self.prefix = prefix
+        self.located = None
+
+    def __reduce__(self):
+        return type(self), (
+            self.instance, self.field_name, self.value, self.validator,
+            self.prefix
+        )
+
+    def locate(self):
+        if self.located is None:
+            self.located = (), self.value
+            if self.validator is not None and self.prefix is not None:
+                try:
+                    path, part = self.validator.locate_failure(self.value)
+                    self.located = self.prefix + tuple(path), part
+                except Exception:
+                    # the error is to be reported anyway
+                    pass
+        return self.located
+
+    @property
+    def path(self):
+        """Indices and keys leading to the failing part of the value, empty
+        when the value fails as a whole, e.g. (1023, 'count').
+        """
+        return self.locate()[0]
+
+    @property
+    def part(self):
+        return self.locate()[1]
+
+    @property
+    def args(self):
+        # the message is only built when asked for, like in __str__
+        return (str(self),)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, str(self))
+
+    def __str__(self):
+        message = self.instance.generate_error_message(
+            self.field_name, self.value
+        )
+        path, part = self.locate()
+        if path:
+            message += " Failed at %s%s, which is %s." % (
+                self.field_name,
+                "".join("[%s]" % reprlib.repr(step) for step in path),
+                reprlib.repr(part)
+            )
+        return message
+
+
+# what complain_about_item is currently complaining about
+COMPLAINT = threading.local()
+
+
+def complain_about_item(instance, field_name, item, validator, prefix):
+    """Makes the instance complain about a single item of the container in
+    its field, e.g. one being appended to a proxy. The error raised by the
+    default complain is then located with the items' validator, prefix leads
+    to the item within the container, None if its position is not known.
+    """
+    COMPLAINT.current = validator, prefix
+    try:
+        instance.complain(field_name, item)
+    finally:
+        COMPLAINT.current = None
+
+
+class Storage(AttributeDescriptor):
+    """Base for alternative ways to store values of the fields. The metaclass
+    switches the field's descriptor to a subtype of its validator type mixed
+    with a storage, see 'with_storage'. Attributes listed in 'bindings' are
+    specific to the class the field is bound to.
+    """
+
+    bindings = ()
+
+    def __deepcopy__(self, memo):
+        # the copy is going to be bound to some other field, so it gets back
+        # to the regular storage
+        clone = copy.copy(self)
+        for name in self.bindings:
+            del clone.__dict__[name]
+        for name in DERIVED:
+            clone.__dict__.pop(name, None)
+        clone.__class__ = validator_type(self)
+        clone.__dict__.update(copy.deepcopy(clone.__dict__, memo))
+        return clone
+
+
+class SlotStorage(Storage):
+    """Storage for classes with slots=True: values live in the slot, which
+    has the same name as the field, while the field's descriptor takes the
+    slot member's place in the class and delegates to it. That saves memory,
+    not time: reads cost a bit more than with __dict__, see native_reads for
+    reading the slots directly.
+    """
+
+    bindings = ("slot", "slot_get", "slot_set")
+
+    def __get__(self, passed_instance, passed_type=None):
+        if passed_instance is None:
+            return self
+        return self.slot_get(passed_instance)
+
+    def __set__(self, passed_instance, value):
+        self.slot_set(passed_instance, value)
+
+    def bind_slot(self, slot):
+        self.slot = slot
+        self.slot_get = slot.__get__
+        self.slot_set = slot.__set__
+
+
+class SetattrStorage(Storage):
+    """Storage for classes with native_reads=True: the field is not put into
+    the class at all, so values are read as plain attributes. Writes are
+    routed to the field by the generated __setattr__, and the field hands
+    the value over to the next __setattr__ in the MRO of the instance's type,
+    so that mixins see writes to inherited fields too.
+    """
+
+    def __set__(self, passed_instance, value):
+        super(
+            type(passed_instance).__watch_setattr_owner__, passed_instance
+        ).__setattr__(self.field_name, value)
+
+
+STORAGE_TYPES = {}
+
+
+def with_storage(descriptor_type, storage_type):
+    """Returns a subtype of descriptor_type, that keeps values in a storage
+    of the given type.
+    """
+    key = (descriptor_type, storage_type)
+    if key not in STORAGE_TYPES:
+        STORAGE_TYPES[key] = type(descriptor_type)(
+            descriptor_type.__name__,
+            (descriptor_type, storage_type),
+            {
+                "__module__": descriptor_type.__module__,
+                "__qualname__": descriptor_type.__qualname__,
+            }
+        )
+    return STORAGE_TYPES[key]
+
+
+def validator_type(node):
+    """Returns type of the validator, seeing variants made by 'with_storage'
+    as their original types.
+    """
+    node_type = type(node)
+    if issubclass(node_type, Storage):
+        return node_type.__bases__[0]
+    return node_type
+
+
+def make_setattr(watched_type, fields):
+    def __setattr__(self, name, value):
+        field = fields.get(name)
+        if field is None or (
+            type(self).__watch_setattr_owner__ is not watched_type
+        ):
+            # __setattr__ of a subclass has already validated the value,
+            # which is now on its way down the MRO
+            super(watched_type, self).__setattr__(name, value)
+        else:
+            field.__set__(self, value)
+    return __setattr__
+
+
+def make_init(fields, validate=True):
+    """Generates dataclass like __init__, that takes values of all the
+    fields, validates them and only then stores them all at once.
+    """
+    names = list(fields)
+    namespace = {}
+    checks = []
+    stores = []
+    in_dict = []
+    for position, (name, field) in enumerate(fields.items()):
+        field_ref = "_field%d" % position
+        namespace[field_ref] = field
+        checks.extend([
+            "        if not %s._check(%s):" % (field_ref, name),
+            "            self.complain(%r, %s)" % (name, name),
+            "            return",
+        ])
+        if validate and type(field)._adopt is not PredicateController._adopt:
+            # no proxies for disabled classes, they behave like plain ones
+            stores.append(
+                "    %s = %s._adopt(self, %s)" % (name, field_ref, name)
+            )
+        if isinstance(field, Storage):
+            stores.append("    %s._store(self, %s)" % (field_ref, name))
+        else:
+            # regular storage is the instance dict, fill it in one go
+            in_dict.append("%r: %s" % (name, name))
+    if in_dict:
+        stores.append("    self.__dict__.update({%s})" % ", ".join(in_dict))
+
+    if validate:
+        checks.insert(0, "    if self.keep_eye_on_me:")
+    else:
+        checks = []
+    source = "\n".join(
+        ["def __init__(self, %s):" % ", ".join(names)] + checks + stores
+    )
+    exec(source, namespace)
+    return namespace["__init__"]
+
+
+def own_fields(watched_type):
+    return {
+        name: field for name, field in watched_type.__watched__.items()
+        if all(
+            getattr(base, "__watched__", {}).get(name) is not field
+            for base in watched_type.__bases__
+        )
+    }
+
+
+def strip(watched_type):
+    """Takes validation out of the class: fields' descriptors get removed
+    from the class, so that it behaves exactly like a plain one.
+    """
+    if vars(watched_type).get("__watch_disabled__"):
+        return
+    for name, field in own_fields(watched_type).items():
+        if vars(watched_type).get(name) is not field:
+            continue
+        if isinstance(field, SlotStorage):
+            type.__setattr__(watched_type, name, field.slot)
+        else:
+            # the value lives in instance __dict__ under the field's name
+            type.__delattr__(watched_type, name)
+    for name, (enabled, disabled) in watched_type.__watch_generated__.items():
+        if disabled is None:
+            type.__delattr__(watched_type, name)
+        else:
+            type.__setattr__(watched_type, name, disabled)
+    type.__setattr__(watched_type, "__watch_disabled__", True)
+
+
+def restore(watched_type):
+    """Puts back everything taken by 'strip'.
+    """
+    if not vars(watched_type).get("__watch_disabled__"):
+        return
+    for name, field in own_fields(watched_type).items():
+        if not isinstance(field, SetattrStorage):
+            type.__setattr__(watched_type, name, field)
+    for name, (enabled, disabled) in watched_type.__watch_generated__.items():
+        type.__setattr__(watched_type, name, enabled)
+    type.__setattr__(watched_type, "__watch_disabled__", False)
+
+
+def subtypes(watched_type):
+    yield watched_type
+    for subtype in type.__subclasses__(watched_type):
+        yield from subtypes(subtype)
+
+
+def disable(watched_type=None):
+    """Turns validation off for the class and all of its subclasses (or
+    everything, when called with no arguments) by taking the descriptors
+    out of the classes. Unlike keep_eye_on_me this costs nothing at all.
+    """
+    for subtype in subtypes(watched_type or WatchMe):
+        strip(subtype)
+
+
+def enable(watched_type=None):
+    """Undoes 'disable' for the class and all of its subclasses.
+    """
+    for subtype in subtypes(watched_type or WatchMe):
+        restore(subtype)
+
+
+# validation could be switched off for the whole process, e.g. in production
+DISABLED = os.environ.get("WATCH_DISABLE", "") not in ("", "0")
+
+
+def inherited_option(bases, name, value):
+    if value is None:
+        return any(getattr(base, name, False) for base in bases)
+    return value
+
+
 class AttributeControllerMeta(type):
     """Basic meta for watch.WatchMe. Its main concern is to bind descriptors
-    to actual attributes in class.
+    to actual attributes in class. All the fields of a class, including the
+    inherited ones, are listed in its __watched__ mapping.
+
+    Class keywords (all of them are inherited):
+        slots=True keeps the fields in __slots__ instead of the instance
+        __dict__;
+        native_reads=True leaves the fields out of the class and validates
+        writes in generated __setattr__, so that reading a field costs the
+        same as reading a plain attribute;
+        init=True generates __init__, that takes all the fields in order of
+        declaration and sets them all or none, see make_init.
     """
 
     def __setattr__(self, attr_name, value):
         if isinstance(value, PredicateController):
-            value.field_name = attr_name
+            value = value._bound(attr_name)
+            self.__watched__[attr_name] = value
         super().__setattr__(attr_name, value)
 
-    def __new__(cls, class_name, bases, attributes):
+    def __new__(
+        cls, class_name, bases, attributes,
+        slots=None, native_reads=None, init=None
+    ):
+        slots = inherited_option(bases, "__watch_slots__", slots)
+        native_reads = inherited_option(
+            bases, "__watch_native_reads__", native_reads
+        )
+        init = inherited_option(bases, "__watch_init__", init)
+
+        fields = {}
         for name, value in attributes.items():
             is_value_descriptor = (
                 isinstance(value, AttributeDescriptor) or
@@ -108,19 +537,93 @@ class AttributeControllerMeta(type):
                 )
             )
             if is_value_descriptor:
-                # each watched typed receives its own copy of
+                # each watched type receives its own binding of the
                 # descriptor instance
-                value_snapshot = copy.deepcopy(value())
-                value_snapshot.field_name = name
-                attributes[name] = value_snapshot
+                fields[name] = value()._bound(name)
+        attributes.update(fields)
+
+        watched = {}
+        for base in reversed(bases):
+            watched.update(getattr(base, "__watched__", {}))
+        watched.update(fields)
+        attributes["__watched__"] = watched
+
+        if slots or native_reads:
+            for name in fields:
+                del attributes[name]
+        if slots:
+            # slots are created under the names of the fields, then swapped
+            # with the fields' descriptors, see SlotStorage
+            declared_slots = attributes.get("__slots__", ())
+            if isinstance(declared_slots, str):
+                declared_slots = (declared_slots,)
+            attributes["__slots__"] = tuple(declared_slots) + tuple(fields)
+            attributes["__watch_slots__"] = True
+        if native_reads:
+            if "__setattr__" in attributes:
+                raise TypeError(
+                    "%s defines its own __setattr__, thus can not have "
+                    "native_reads, use a mixin instead." % class_name
+                )
+            attributes["__watch_native_reads__"] = True
+        if init:
+            attributes["__watch_init__"] = True
+
+        # generated methods: name -> (enabled version, disabled version)
+        generated = attributes["__watch_generated__"] = {}
+
+        watched_type = super().__new__(cls, class_name, bases, attributes)
+        for name, descriptor in fields.items():
+            if native_reads:
+                descriptor.__class__ = with_storage(
+                    type(descriptor), SetattrStorage
+                )
+            elif slots:
+                descriptor.__class__ = with_storage(
+                    type(descriptor), SlotStorage
+                )
+                descriptor.bind_slot(watched_type.__dict__[name])
+                type.__setattr__(watched_type, name, descriptor)
+        if native_reads:
+            generated["__setattr__"] = (
+                make_setattr(
+                    watched_type,
+                    {
+                        name: field for name, field in watched.items()
+                        if isinstance(field, SetattrStorage)
+                    }
+                ),
+                None
+            )
+            # the class, whose __setattr__ validates writes to its instances
+            type.__setattr__(
+                watched_type, "__watch_setattr_owner__", watched_type
+            )
+        if init and watched and "__init__" not in attributes:
+            # storages of the fields are known by now
+            generated["__init__"] = (
+                make_init(watched), make_init(watched, validate=False)
+            )
+        for name, (enabled, disabled) in generated.items():
+            type.__setattr__(watched_type, name, enabled)
+
+        if DISABLED or any(
+            getattr(base, "__watch_disabled__", False) for base in bases
+        ):
+            strip(watched_type)
+        return watched_type
 
-        return super().__new__(cls, class_name, bases, attributes)
+    def __init__(self, class_name, bases, attributes, **options):
+        super().__init__(class_name, bases, attributes)
 
 
 class WatchMe(metaclass=AttributeControllerMeta):
     """Inherit this class to make your class controlled by watch.
     """
 
+    # so that subclasses with slots=True do not get __dict__
+    __slots__ = ()
+
     # global validation flag, override it for any child type or even certain
     # instance to disable validation
     keep_eye_on_me = True
@@ -129,15 +632,43 @@ class WatchMe(metaclass=AttributeControllerMeta):
         return (
             "watch: Failed to set attribute '%s' of object %s to be %s." %
             (
-                field_name, object.__repr__(self), value
+                field_name, object.__repr__(self), reprlib.repr(value)
             )
         )
 
+    def update(self, **fields):
+        """Sets a bunch of attributes at once. Values of all watched fields
+        are validated before anything is set, so either all of the
+        attributes get updated or none of them.
+        """
+        if getattr(type(self), "__watch_disabled__", False):
+            # the descriptors are gone, see 'strip'
+            for name, value in fields.items():
+                setattr(self, name, value)
+            return
+        watched = type(self).__watched__
+        if self.keep_eye_on_me:
+            for name, value in fields.items():
+                field = watched.get(name)
+                if field is not None and not field._check(value):
+                    self.complain(name, value)
+                    return
+        for name, value in fields.items():
+            field = watched.get(name)
+            if field is None:
+                setattr(self, name, value)
+            else:
+                field._store(self, field._adopt(self, value))
+
     def complain(self, field_name, value):
         """This method is invoked on setattr validation failure.
         It is up to the class to decide how to handle validation error.
         """
-        raise AttributeError(
-            self.generate_error_message(field_name, value)
+        complaint = getattr(COMPLAINT, "current", None)
+        if complaint is not None:
+            COMPLAINT.current = None
+            raise ValidationError(self, field_name, value, *complaint)
+        raise ValidationError(
+            self, field_name, value, type(self).__watched__.get(field_name)
         )
 
@@ -0,0 +1,136 @@
+"""Background validation for the Deferred validator.
+
+Deferred fields store values right away and queue them up, a single daemon
+thread picks values from the queue in batches and runs the checks. Failures
+can not be raised at the caller anymore, so they go to a failure handler
+instead of WatchMe.complain. The queue is bounded: once it is full, setting
+a deferred field blocks until the worker catches up. Up to a batch of
+values could be taken off the queue and still be waiting for their checks.
+Both the queue and logging are only imported once something gets deferred.
+"""
+
+import threading
+import time
+
+
+from .core import ValidationError
+
+
+def logger():
+    import logging
+    return logging.getLogger("watch")
+
+
+def log_failure(instance, field_name, value):
+    """Default failure handler, logs the same message complain would raise.
+    """
+    logger().error("%s", ValidationError(
+        instance, field_name, value, type(instance).__watched__.get(field_name)
+    ))
+
+
+class Worker:
+    """Owns the queue and the thread that drains it. Both are created on the
+    first submit.
+    """
+
+    def __init__(self, maxsize=10000, batch_size=256):
+        self.maxsize = maxsize
+        self.queue = None
+        self.batch_size = batch_size
+        self.thread = None
+        self.lock = threading.Lock()
+        self.checked = 0
+        self.failures = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    def start(self):
+        import queue
+
+        with self.lock:
+            if self.queue is None:
+                self.queue = queue.Queue(self.maxsize)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="watch-deferred", daemon=True
+                )
+                self.thread.start()
+
+    def submit(self, validator, instance, value):
+        if self.thread is None or not self.thread.is_alive():
+            self.start()
+        # blocks while the queue is full, which is the backpressure
+        self.queue.put((validator, instance, value, time.monotonic()))
+
+    def batch(self):
+        batch = [self.queue.get()]
+        # this thread is the only one taking values off the queue, so it is
+        # not going to get empty in between
+        while len(batch) < self.batch_size and self.queue.qsize():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    def run(self):
+        while True:
+            batch = self.batch()
+            try:
+                for validator, instance, value, queued_at in batch:
+                    self.process(validator, instance, value)
+                    self.lag = time.monotonic() - queued_at
+                    self.max_lag = max(self.max_lag, self.lag)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def process(self, validator, instance, value):
+        try:
+            verdict = validator.inner_checker._check(value)
+            self.checked += 1
+            if not verdict:
+                self.failures += 1
+                validator.on_failure(instance, validator.field_name, value)
+        except Exception:
+            # nobody up the stack is going to catch this, so it gets logged
+            # and the worker goes on
+            logger().exception(
+                "watch: deferred check of %r failed", validator.field_name
+            )
+
+    def flush(self, timeout=None):
+        """Waits until every value queued so far is checked, returns False
+        if that did not happen within the timeout.
+        """
+        if self.queue is None:
+            return True
+        condition = self.queue.all_tasks_done
+        with condition:
+            return condition.wait_for(
+                lambda: not self.queue.unfinished_tasks, timeout
+            )
+
+    def metrics(self):
+        return {
+            "depth": self.queue.qsize() if self.queue is not None else 0,
+            "maxsize": self.maxsize,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "checked": self.checked,
+            "failures": self.failures,
+        }
+
+
+worker = Worker()
+
+
+def flush(timeout=None):
+    """Waits for pending deferred checks, see Worker.flush.
+    """
+    return worker.flush(timeout)
+
+
+def metrics():
+    """Returns queue depth, lag of the last check in seconds and counters
+    of the deferred checks.
+    """
+    return worker.metrics()
@@ -0,0 +1,144 @@
+"""Type dispatch for wide unions.
+
+Most branches of a union like
+    InstanceOf(int) | Container(InstanceOf(str), container=list) |
+    Mapping(InstanceOf(str))
+start with an isinstance test, so type of the value alone rules most of them
+out. The compiler gives such Or nodes a dispatcher, that maps the type of the
+value to a check of just those branches, that could possibly accept it. The
+map is filled in lazily, by the types actually seen, so issubclass does all
+the work of walking MROs and asking ABCs.
+
+The verdict is the same as of the plain Or. Types with a metaclass of their
+own, that overrides __instancecheck__ or __subclasscheck__, could look at
+the value itself, so branches guarded by such types are never ruled out,
+see watch.typecache.type_based. For the rest, the only two ways for
+isinstance to disagree with issubclass of the type are objects faking their
+__class__ (like mocks) and ABCs getting new registrations. Both are taken
+care of on the failure path, which is the only place a wrong answer could
+show up: successful checks never rule a branch out wrongly, while a failed
+one gets the full check when in doubt.
+"""
+
+from abc import ABCMeta, get_cache_token
+
+from . import builtins
+from .core import validator_type
+from .typecache import type_based
+
+
+# branches with a guard of their own it takes to bother with dispatching
+THRESHOLD = 6
+# the table is dropped once this many types are seen, which should not happen
+# unless types are created on the fly
+TABLE_SIZE = 1024
+
+
+def guard(node):
+    """Returns a tuple of types, that the value has to be an instance of to
+    be accepted by the node, None if there is no such tuple, or if the type
+    of the value alone could not tell that.
+    """
+    types = node_guard(node)
+    if types is None or not type_based(types):
+        return None
+    return types
+
+
+def node_guard(node):
+    node_type = validator_type(node)
+    if node_type is builtins.InstanceOf:
+        return node.types
+    if node_type in (builtins.Container, builtins.Mapping):
+        return (node.container_type,)
+    if node_type is builtins.SubclassOf:
+        return (type,)
+    if node_type is builtins.Cached:
+        return guard(node.inner_checker)
+    if node_type is builtins.And:
+        # every branch has to accept the value, so any guard would do
+        for checker in node.combined_from:
+            types = guard(checker)
+            if types is not None:
+                return types
+    if node_type is builtins.Or:
+        types = []
+        for checker in node.combined_from:
+            checker_types = guard(checker)
+            if checker_types is None:
+                return None
+            types.extend(checker_types)
+        return tuple(types)
+    return None
+
+
+def dispatchable(node):
+    guarded = [
+        checker for checker in node.combined_from
+        if guard(checker) is not None
+    ]
+    return len(guarded) >= THRESHOLD
+
+
+def reject(value):
+    return False
+
+
+def any_of(checks):
+    def check(value):
+        for branch in checks:
+            if branch(value):
+                return True
+        return False
+    return check
+
+
+class Dispatcher:
+    """Keeps the table of type -> check of the branches, that could accept
+    values of the type.
+    """
+
+    def __init__(self, branches):
+        self.guards = [guard(branch) for branch in branches]
+        self.branches = branches
+        self.checks = None
+        self.table = {}
+        # registrations could make a type a subclass of an ABC later on
+        self.abstract = any(
+            isinstance(guard_type, ABCMeta)
+            for types in self.guards if types is not None
+            for guard_type in types
+        )
+        self.token = get_cache_token()
+
+    def branch_checks(self):
+        if self.checks is None:
+            self.checks = [branch._compiled() for branch in self.branches]
+        return self.checks
+
+    def resolve(self, value_type):
+        checks = [
+            check for types, check in zip(self.guards, self.branch_checks())
+            if types is None or issubclass(value_type, types)
+        ]
+        if not checks:
+            check = reject
+        elif len(checks) == 1:
+            check = checks[0]
+        else:
+            check = any_of(checks)
+        if len(self.table) >= TABLE_SIZE:
+            self.table.clear()
+        self.table[value_type] = check
+        return check
+
+    def recheck(self, value):
+        """Called once the dispatched branches reject the value, checks it
+        against all of them, if some of the skipped ones could accept it.
+        """
+        if self.abstract and self.token != get_cache_token():
+            self.token = get_cache_token()
+            self.table.clear()
+        elif value.__class__ is type(value):
+            return False
+        return any_of(self.branch_checks())(value)
@@ -0,0 +1,47 @@
+"""Interning of validator trees.
+
+Validators are immutable and equal whenever they are built the same way,
+so there is no point in keeping many copies of, say, InstanceOf(str) around.
+'intern' resolves every subtree of a validator to a single shared instance.
+The table is keyed by structure, which never refers to the validator itself,
+so shared instances are dropped once nothing else refers to them.
+"""
+
+from threading import RLock
+from weakref import WeakValueDictionary
+
+from .builtins import BaseControlledValidator
+
+
+TABLE = WeakValueDictionary()
+LOCK = RLock()
+
+
+def intern_value(value):
+    if isinstance(value, BaseControlledValidator):
+        return intern(value)
+    if isinstance(value, list):
+        return [intern_value(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(intern_value(item) for item in value)
+    return value
+
+
+def intern(validator):
+    """Returns the shared instance of the validator, its subtrees are
+    interned along the way.
+    """
+    with LOCK:
+        shared = TABLE.get(validator.structure())
+        if shared is not None:
+            return shared
+        # subtrees are swapped with equal ones, so the validator stays the
+        # same as far as anyone could tell
+        state = validator.__dict__
+        for name, value in list(state.items()):
+            state[name] = intern_value(value)
+        # the key is built again, so that it holds the shared subtrees
+        # rather than the swapped ones
+        state.pop("structure_key", None)
+        TABLE[validator.structure()] = validator
+        return validator
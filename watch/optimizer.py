@@ -0,0 +1,285 @@
+"""Algebraic optimizer for validator trees.
+
+Operator overloads and hand written schemas tend to produce trees like
+Or(Or(InstanceOf(int), InstanceOf(str)), Just(1), Just(2)), which cost a
+python call per node on every check. The 'optimize' pass rewrites such a tree
+into an equivalent one with fewer nodes:
+    - nested n-ary nodes of the same kind get flattened;
+    - sibling InstanceOf nodes inside of Or are merged into a single one,
+      same goes for Just nodes;
+    - Whatever and Nothing are folded away, as well as double negations;
+    - duplicate branches of And and Or are removed;
+    - comparators of And are intersected into a single Interval, while
+      intervals in Or, bare or ending Ands, that are the same otherwise,
+      are merged into an IntervalSet, e.g. a 200 ranges allow list
+      Or(InstanceOf(int) & (x >= 0) & (x < 10), ...) turns into
+      And(InstanceOf(int), IntervalSet(...)), which is a binary search.
+      Only real numbers (but nans) are taken for the bounds.
+Adaptive And and Or nodes reorder their branches at runtime, so they are
+left as they are, along with their subtrees.
+Only nodes of the exact builtin types are touched, so anything that
+overrides 'predicate' is left as is.
+"""
+
+from numbers import Real
+
+from . import builtins
+from .core import validator_type
+
+
+def is_whatever(node):
+    return node.predicate is builtins.Whatever.predicate
+
+
+def is_nothing(node):
+    return node.predicate is builtins.Nothing.predicate
+
+
+def unique(nodes):
+    # validators are equal when they are built the same way
+    seen = set()
+    for node in nodes:
+        if node not in seen:
+            seen.add(node)
+            yield node
+
+
+def flatten(node_type, nodes):
+    for node in nodes:
+        if type(node) is node_type and not node.adaptive:
+            yield from node.combined_from
+        else:
+            yield node
+
+
+def is_bound(value):
+    # nans are not equal to themselves and are not ordered either
+    return isinstance(value, Real) and value == value
+
+
+def as_interval(node):
+    """Returns Interval equivalent to the comparator node, None if the node
+    is not a comparator with a bound intervals could deal with.
+    """
+    node_type = type(node)
+    if node_type is builtins.Interval:
+        if all(
+            bound is None or is_bound(bound)
+            for bound in (node.lower, node.upper)
+        ):
+            return node
+        return None
+    if node_type not in (
+        builtins.GtThen, builtins.GtEqThen, builtins.LtThen, builtins.LtEqThen
+    ):
+        return None
+    bound = node.value_to_check_against
+    if not is_bound(bound):
+        return None
+    if node_type is builtins.GtThen:
+        return builtins.Interval(bound, lower_closed=False)
+    if node_type is builtins.GtEqThen:
+        return builtins.Interval(bound)
+    if node_type is builtins.LtThen:
+        return builtins.Interval(upper=bound)
+    return builtins.Interval(upper=bound, upper_closed=True)
+
+
+def intersected(first, second):
+    lower, lower_closed = first.lower, first.lower_closed
+    if lower is None or (
+        second.lower is not None and second.lower > lower
+    ):
+        lower, lower_closed = second.lower, second.lower_closed
+    elif second.lower == lower:
+        lower_closed = lower_closed and second.lower_closed
+    upper, upper_closed = first.upper, first.upper_closed
+    if upper is None or (
+        second.upper is not None and second.upper < upper
+    ):
+        upper, upper_closed = second.upper, second.upper_closed
+    elif second.upper == upper:
+        upper_closed = upper_closed and second.upper_closed
+    return builtins.Interval(lower, upper, lower_closed, upper_closed)
+
+
+def split_interval(node):
+    """Returns (the rest of the And, Interval) pair for intervals and Ands
+    ending with an interval, None for the other nodes.
+    """
+    interval = as_interval(node)
+    if interval is not None:
+        return (), interval
+    if type(node) is builtins.And and not node.adaptive:
+        interval = as_interval(node.combined_from[-1])
+        if interval is not None:
+            return tuple(node.combined_from[:-1]), interval
+    return None
+
+
+def unbounded(union):
+    return len(union.intervals) == 1 and (
+        union.intervals[0].lower is None and union.intervals[0].upper is None
+    )
+
+
+def merge_intervals(children):
+    groups = {}
+    for child in children:
+        split = split_interval(child)
+        if split is not None:
+            groups.setdefault(split[0], []).append(split[1])
+    unions = {}
+    for rest, intervals in groups.items():
+        if len(intervals) < 2:
+            continue
+        union = builtins.IntervalSet(*intervals)
+        # the whole number line would not compare the value at all, while
+        # the comparators reject nans and fail on things like None
+        if not unbounded(union):
+            unions[rest] = union
+
+    merged = []
+    done = set()
+    for child in children:
+        split = split_interval(child)
+        if split is None or split[0] not in unions:
+            merged.append(child)
+            continue
+        rest = split[0]
+        if rest in done:
+            continue
+        # the union takes the place of the first interval of the group
+        done.add(rest)
+        union = unions[rest]
+        if len(union.intervals) == 1:
+            union = union.intervals[0]
+        merged.append(builtins.And(*rest, union) if rest else union)
+    return merged
+
+
+def optimize_or(node, strict):
+    children = []
+    types = []
+    values = []
+    compact = False
+    for child in flatten(builtins.Or, map(optimize, node.combined_from)):
+        if is_whatever(child):
+            return builtins.Whatever
+        if is_nothing(child):
+            continue
+        # merged nodes take the place of the first node of their kind
+        if type(child) is builtins.InstanceOf:
+            if not types:
+                children.append(builtins.InstanceOf)
+            types.extend(child.types)
+        elif type(child) is builtins.Just:
+            if not values:
+                children.append(builtins.Just)
+            values.extend(child.test_against)
+            compact |= isinstance(child.test_against, builtins.SortedArray)
+        else:
+            children.append(child)
+
+    merged = {}
+    if types:
+        merged[builtins.InstanceOf] = builtins.InstanceOf(
+            *dict.fromkeys(types)
+        )
+    if values:
+        merged[builtins.Just] = builtins.Just(*values, compact=compact)
+    children = list(unique(merged.get(child, child) for child in children))
+    children = merge_intervals(children)
+    if not children:
+        return builtins.Nothing
+    if len(children) == 1 and not strict:
+        return children[0]
+    return builtins.Or(*children)
+
+
+def optimize_and(node, strict):
+    children = []
+    for child in flatten(builtins.And, map(optimize, node.combined_from)):
+        if is_nothing(child):
+            return builtins.Nothing
+        if not is_whatever(child):
+            children.append(child)
+
+    children = list(unique(children))
+    intervals = [
+        interval for interval in map(as_interval, children)
+        if interval is not None
+    ]
+    if len(intervals) > 1:
+        # the intersection takes the place of the first comparator
+        first = next(
+            position for position, child in enumerate(children)
+            if as_interval(child) is not None
+        )
+        children = [
+            child for child in children if as_interval(child) is None
+        ]
+        interval = intervals[0]
+        for other in intervals[1:]:
+            interval = intersected(interval, other)
+        children.insert(first, interval)
+    if not children:
+        return builtins.Whatever
+    if len(children) == 1 and not strict:
+        return children[0]
+    return builtins.And(*children)
+
+
+def optimize_xor(node):
+    # xor is evaluated over raw predicate results, so the children are
+    # optimized in the 'strict' mode, that keeps their return values intact
+    children = [
+        child for child in flatten(
+            builtins.Xor,
+            (optimize(child, strict=True) for child in node.combined_from)
+        )
+        if not is_nothing(child)
+    ]
+    if not children:
+        return builtins.Nothing
+    return builtins.Xor(*children)
+
+
+def optimize_not(node, strict):
+    inner = optimize(node.inner_checker)
+    if is_whatever(inner):
+        return builtins.Nothing
+    if is_nothing(inner):
+        return builtins.Whatever
+    if type(inner) is builtins.Not and not strict:
+        return inner.inner_checker
+    return builtins.Not(inner)
+
+
+def optimize(node, strict=False):
+    """Returns optimized equivalent of the validator tree. The 'strict' flag
+    means, that the caller is interested in the exact value returned by
+    predicate rather than in its truthiness.
+    """
+    node_type = validator_type(node)
+    if getattr(node, "adaptive", False):
+        return node
+    if node_type is builtins.Or:
+        return optimize_or(node, strict)
+    if node_type is builtins.And:
+        return optimize_and(node, strict)
+    if node_type is builtins.Xor:
+        return optimize_xor(node)
+    if node_type is builtins.Not:
+        return optimize_not(node, strict)
+    if node_type is builtins.Container:
+        return builtins.Container(
+            optimize(node.items), container=node.container_type,
+            lazy=node.lazy
+        )
+    if node_type is builtins.Mapping:
+        return builtins.Mapping(
+            optimize(node.keys), optimize(node.values),
+            container=node.container_type
+        )
+    return node
@@ -0,0 +1,92 @@
+"""Process pools for the Parallel validator.
+
+Huge containers are cut into chunks, that are checked in worker processes,
+so validators and items get pickled on their way there. Predicate works
+with module level functions, lambdas and closures can not be pickled.
+At most a couple of chunks per worker are in flight at any moment, which
+keeps memory in check and lets the rest of the work be dropped as soon as
+some chunk fails. Pools and multiprocessing are only imported once some
+container is large enough to be checked in parallel.
+"""
+
+from itertools import islice
+import os
+from threading import Lock
+
+
+EXECUTORS = {}
+LOCK = Lock()
+
+
+def executor(workers=None):
+    """Returns process pool with the given number of workers, pools are
+    created once and shared by all the validators.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with LOCK:
+        pool = EXECUTORS.get(workers)
+        if pool is None:
+            pool = EXECUTORS[workers] = ProcessPoolExecutor(workers)
+        return pool
+
+
+def shutdown():
+    """Shuts all the pools down, they are created again when needed.
+    """
+    with LOCK:
+        pools = list(EXECUTORS.values())
+        EXECUTORS.clear()
+    for pool in pools:
+        pool.shutdown(cancel_futures=True)
+
+
+def check_items(items, chunk):
+    return all(map(items._compiled(), chunk))
+
+
+def check_rows(keys, values, chunk):
+    keys, values = keys._compiled(), values._compiled()
+    return all(keys(key) and values(value) for key, value in chunk)
+
+
+def chunked(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def settle(pending, limit):
+    """Waits until fewer than 'limit' futures are pending, tells whether
+    all the chunks checked meanwhile are fine.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    while len(pending) >= limit:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        pending.difference_update(done)
+        if not all(future.result() for future in done):
+            return False
+    return True
+
+
+def run(function, validators, chunks, workers=None):
+    """Checks chunks with function(*validators, chunk) in the pool, returns
+    False as soon as any of the chunks fails.
+    """
+    pool = executor(workers)
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending = set()
+    try:
+        for chunk in chunks:
+            pending.add(pool.submit(function, *validators, chunk))
+            if not settle(pending, window):
+                return False
+        return settle(pending, 1)
+    finally:
+        # whatever is not started yet, is not needed anymore
+        for future in pending:
+            future.cancel()
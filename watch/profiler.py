@@ -0,0 +1,314 @@
+"""Validation profiler.
+
+    import watch.profiler
+    watch.profiler.enable()
+    ...
+    print(watch.profiler.report())
+
+While enabled, __set__ of the fields and 'predicate' of the builtin
+validators are wrapped into timers. Numbers are kept per field (class and
+field name) and per node of the field's validator tree, named by the path
+from the root, like 'Record.tags: Container > InstanceOf'. Container and
+Mapping nodes also record sizes of the values they see. Validator trees are
+not compiled while profiling, so that every node could be timed, which makes
+validation itself slower, but the proportions stay.
+
+Disabling puts the original methods back, so there is no overhead at all
+when the profiler is off.
+"""
+
+from collections import abc
+import random
+import threading
+import time
+
+from . import builtins
+from .core import PredicateController, WatchMe, subtypes, validator_type
+
+
+SAMPLES = 1000
+
+LOCK = threading.Lock()
+LOCAL = threading.local()
+ORIGINALS = {}
+FIELDS = {}
+NODES = {}
+# id of a field -> (field, its name), for checks made outside of __set__,
+# like the ones of update() and generated __init__
+OWNERS = {}
+
+
+class Timings:
+    """Counters of a single field or node. Percentiles are computed over a
+    bounded random sample of the timings.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.passed = 0
+        self.failed = 0
+        self.total = 0.0
+        self.samples = []
+        self.sizes = 0
+        self.sized = 0
+        self.max_size = 0
+        self.random = random.Random(0)
+
+    def add(self, elapsed, passed, size=None):
+        self.calls += 1
+        if passed:
+            self.passed += 1
+        else:
+            self.failed += 1
+        self.total += elapsed
+        if len(self.samples) < SAMPLES:
+            self.samples.append(elapsed)
+        else:
+            # reservoir sampling keeps every call equally likely to be in
+            position = self.random.randrange(self.calls)
+            if position < SAMPLES:
+                self.samples[position] = elapsed
+        if size is not None:
+            self.sized += 1
+            self.sizes += size
+            self.max_size = max(self.max_size, size)
+
+    def percentile(self, samples, fraction):
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+    def snapshot(self):
+        samples = sorted(self.samples)
+        result = {
+            "calls": self.calls,
+            "passed": self.passed,
+            "failed": self.failed,
+            "total": self.total,
+            "mean": self.total / self.calls,
+            "p50": self.percentile(samples, 0.5),
+            "p90": self.percentile(samples, 0.9),
+            "p99": self.percentile(samples, 0.99),
+        }
+        if self.sized:
+            result["sizes"] = {
+                "mean": self.sizes / self.sized, "max": self.max_size
+            }
+        return result
+
+
+def record(table, key, elapsed, passed, size=None):
+    with LOCK:
+        timings = table.get(key)
+        if timings is None:
+            timings = table[key] = Timings()
+        timings.add(elapsed, passed, size)
+
+
+def timed_set(original):
+    def __set__(self, passed_instance, value):
+        if getattr(LOCAL, "field", None) is not None:
+            # super().__set__ of the field being timed already
+            return original(self, passed_instance, value)
+        field = "%s.%s" % (
+            type(passed_instance).__qualname__, self.field_name
+        )
+        LOCAL.field = field
+        LOCAL.verdict = None
+        started = time.perf_counter()
+        passed = False
+        try:
+            original(self, passed_instance, value)
+            # complain does not have to raise, so the root node tells
+            passed = LOCAL.verdict is None or bool(LOCAL.verdict)
+        finally:
+            elapsed = time.perf_counter() - started
+            LOCAL.field = None
+            record(FIELDS, field, elapsed, passed)
+    return __set__
+
+
+def timed_predicate(original, sized):
+    def predicate(self, value):
+        path = getattr(LOCAL, "path", None)
+        if path is None:
+            path = LOCAL.path = []
+        path.append(validator_type(self).__name__)
+        key = "%s: %s" % (
+            getattr(LOCAL, "field", None) or "-", " > ".join(path)
+        )
+        started = time.perf_counter()
+        try:
+            verdict = original(self, value)
+        finally:
+            elapsed = time.perf_counter() - started
+            path.pop()
+        size = None
+        if sized and isinstance(value, abc.Sized):
+            size = len(value)
+        record(NODES, key, elapsed, verdict, size)
+        if not path:
+            LOCAL.verdict = verdict
+        return verdict
+    return predicate
+
+
+def timed_check(original):
+    def _check(self, value):
+        if getattr(LOCAL, "field", None) is not None:
+            return original(self, value)
+        owner = OWNERS.get(id(self))
+        if owner is None or owner[0] is not self:
+            return original(self, value)
+        LOCAL.field = owner[1]
+        try:
+            return original(self, value)
+        finally:
+            LOCAL.field = None
+    return _check
+
+
+def not_compiled(self):
+    return self.predicate
+
+
+def patch(owner, name, replacement):
+    ORIGINALS[owner, name] = owner.__dict__[name]
+    type.__setattr__(owner, name, replacement)
+
+
+def forget_compiled():
+    """Drops compiled checks all over the fields' trees, so that they are
+    taken anew, compiled or not, depending on whether profiling is on.
+    """
+    stack = [
+        field for watched_type in subtypes(WatchMe)
+        for field in watched_type.__watched__.values()
+    ]
+    nodes = {}
+    while stack:
+        node = stack.pop()
+        if id(node) in nodes:
+            continue
+        nodes[id(node)] = node
+        for value in node.__dict__.values():
+            if not isinstance(value, (tuple, list)):
+                value = (value,)
+            stack.extend(
+                child for child in value
+                if isinstance(child, PredicateController)
+            )
+    for node in nodes.values():
+        node.__dict__.pop("_check", None)
+    # rankings hold checks of their branches, those are taken again once
+    # all of them are dropped
+    for node in nodes.values():
+        ranking = node.__dict__.get("ranking")
+        if ranking is not None:
+            ranking.recompile()
+
+
+def enable():
+    """Starts profiling, counters collected so far are kept.
+    """
+    if ORIGINALS:
+        return
+    # only imported once profiling is on, as are the rest of the optional
+    # features, so that they do not add up to the startup time of 'watch'
+    import inspect
+    patch(PredicateController, "_compiled", not_compiled)
+    patch(
+        PredicateController, "_check",
+        timed_check(PredicateController.__dict__["_check"])
+    )
+    validator_types = [PredicateController] + [
+        value for value in vars(builtins).values()
+        if isinstance(value, type) and
+        issubclass(value, PredicateController) and
+        value.__module__ == builtins.__name__
+    ]
+    for node_type in validator_types:
+        attributes = node_type.__dict__
+        if inspect.isfunction(attributes.get("predicate")):
+            sized = node_type in (builtins.Container, builtins.Mapping)
+            patch(
+                node_type, "predicate",
+                timed_predicate(attributes["predicate"], sized)
+            )
+        if "__set__" in attributes:
+            patch(node_type, "__set__", timed_set(attributes["__set__"]))
+    for watched_type in subtypes(WatchMe):
+        for name, field in watched_type.__watched__.items():
+            OWNERS[id(field)] = (
+                field, "%s.%s" % (watched_type.__qualname__, name)
+            )
+    # fields are compiled on demand, so dropping them is enough
+    forget_compiled()
+
+
+def disable():
+    """Stops profiling and puts everything back the way it was.
+    """
+    for (owner, name), original in ORIGINALS.items():
+        type.__setattr__(owner, name, original)
+    ORIGINALS.clear()
+    OWNERS.clear()
+    # checks taken while profiling are timed ones
+    forget_compiled()
+
+
+def enabled():
+    return bool(ORIGINALS)
+
+
+def reset():
+    with LOCK:
+        FIELDS.clear()
+        NODES.clear()
+
+
+def stats():
+    """Returns snapshot of the counters: {'fields': {...}, 'nodes': {...}},
+    times are in seconds.
+    """
+    with LOCK:
+        return {
+            "fields": {
+                key: timings.snapshot() for key, timings in FIELDS.items()
+            },
+            "nodes": {
+                key: timings.snapshot() for key, timings in NODES.items()
+            },
+        }
+
+
+def report(format="text"):
+    """Renders stats() as a text table (the slowest first) or as JSON.
+    """
+    snapshot = stats()
+    if format == "json":
+        import json
+        return json.dumps(snapshot, indent=2, sort_keys=True)
+    if format != "text":
+        raise ValueError("unknown report format %r" % format)
+
+    lines = []
+    for table in ("fields", "nodes"):
+        rows = sorted(
+            snapshot[table].items(), key=lambda item: -item[1]["total"]
+        )
+        lines.append(
+            "%-50s %9s %9s %11s %9s %9s %9s %9s" % (
+                table, "calls", "failed", "total ms",
+                "mean us", "p50 us", "p99 us", "size"
+            )
+        )
+        for name, row in rows:
+            size = row.get("sizes")
+            lines.append(
+                "%-50s %9d %9d %11.3f %9.2f %9.2f %9.2f %9s" % (
+                    name, row["calls"], row["failed"], row["total"] * 1e3,
+                    row["mean"] * 1e6, row["p50"] * 1e6, row["p99"] * 1e6,
+                    "%.0f" % size["mean"] if size else "-",
+                )
+            )
+        lines.append("")
+    return "\n".join(lines)
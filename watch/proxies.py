@@ -0,0 +1,208 @@
+"""Incrementally validated containers.
+
+Container(..., proxy=True) and Mapping(..., proxy=True) fields wrap lists,
+sets and dicts assigned to them into the proxies below. Proxies are plain
+subclasses of the builtin containers, so reads cost the same, while every
+mutation validates just the new items against the field's validator, instead
+of revalidating the whole thing on reassignment.
+"""
+
+from .core import complain_about_item
+
+
+# position of items, which are not going to take a particular index or key
+UNKNOWN = object()
+
+
+class Watched:
+    """Common bits of the proxies. 'owner' is the instance that holds the
+    proxy in its field 'field_name', which is controlled by 'validator'.
+    """
+
+    owner = None
+    validator = None
+    field_name = None
+    plain_type = None
+
+    def __reduce_ex__(self, protocol):
+        # copies are not bound to any field, so they are just plain containers
+        return self.plain_type, (self.plain_type(self),)
+
+    def admits(self, rows, positions=()):
+        """Checks each row of items against corresponding item validators,
+        rows are like [(item,), ...] or [(key, value), ...]. Positions are
+        the indices or keys the rows are going to take, if known, those are
+        only reported for the last item of the row.
+        """
+        owner = self.owner
+        if owner is None or not owner.keep_eye_on_me:
+            return True
+        validators = self.item_validators()
+        checks = [validator._compiled() for validator in validators]
+        positions = iter(positions)
+        for row in rows:
+            position = next(positions, UNKNOWN)
+            last = len(row) - 1
+            for column, item in enumerate(row):
+                if not checks[column](item):
+                    complain_about_item(
+                        owner, self.field_name, item, validators[column],
+                        None if column < last or position is UNKNOWN
+                        else (position,)
+                    )
+                    return False
+        return True
+
+    def item_validators(self):
+        return (self.validator.items,)
+
+
+class WatchedList(Watched, list):
+    plain_type = list
+
+    def insert_position(self, index):
+        # where list.insert and friends actually put the item
+        size = len(self)
+        if index < 0:
+            index = max(index + size, 0)
+        return min(index, size)
+
+    def append(self, item):
+        if self.admits([(item,)], [len(self)]):
+            super().append(item)
+
+    def extend(self, items):
+        items = list(items)
+        if self.admits(zip(items), range(len(self), len(self) + len(items))):
+            super().extend(items)
+
+    def insert(self, index, item):
+        if self.admits([(item,)], [self.insert_position(index)]):
+            super().insert(index, item)
+
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            item = list(item)
+            rows = zip(item)
+            positions = ()
+        else:
+            rows = [(item,)]
+            positions = [index + len(self) if index < 0 else index]
+        if self.admits(rows, positions):
+            super().__setitem__(index, item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+
+class WatchedSet(Watched, set):
+    plain_type = set
+
+    def add(self, item):
+        if self.admits([(item,)]):
+            super().add(item)
+
+    def update(self, *others):
+        items = [item for other in others for item in other]
+        if self.admits(zip(items)):
+            super().update(items)
+
+    def symmetric_difference_update(self, other):
+        other = set(other)
+        if self.admits(zip(other)):
+            super().symmetric_difference_update(other)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+
+class WatchedDict(Watched, dict):
+    plain_type = dict
+
+    def item_validators(self):
+        return self.validator.keys, self.validator.values
+
+    def __setitem__(self, key, value):
+        if self.admits([(key, value)], [key]):
+            super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs):
+        items = dict(*args, **kwargs)
+        if self.admits(items.items(), items):
+            super().update(items)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self.get(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+class WatchedIterator:
+    """Iterator, that checks items of the wrapped one as they are pulled,
+    see Container(..., lazy=True). Items are checked only once, so the
+    memory footprint stays the same no matter how long the stream is.
+    If complain does not raise, the bad item is skipped.
+    """
+
+    def __init__(self, iterator, owner, validator, field_name):
+        self.iterator = iterator
+        self.owner = owner
+        self.validator = validator
+        self.field_name = field_name
+        self.check = validator.items._compiled()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            item = next(self.iterator)
+            owner = self.owner
+            if not owner.keep_eye_on_me or self.check(item):
+                return item
+            # the position within the stream is of no use, so the error only
+            # tells what is wrong with the item
+            complain_about_item(
+                owner, self.field_name, item, self.validator.items, None
+            )
+
+
+CONTAINER_PROXIES = {
+    list: WatchedList, WatchedList: WatchedList,
+    set: WatchedSet, WatchedSet: WatchedSet,
+}
+
+
+MAPPING_PROXIES = {
+    dict: WatchedDict, WatchedDict: WatchedDict,
+}
+
+
+def watched(value, owner, validator, field_name, proxy_types):
+    """Wraps value into a proxy bound to the owner's field, values of types
+    without a proxy are returned as is.
+    """
+    proxy_type = proxy_types.get(type(value))
+    if proxy_type is None:
+        return value
+    if value.__class__ is proxy_type:
+        if (
+            value.owner is owner and value.validator is validator and
+            value.field_name == field_name
+        ):
+            return value
+    proxy = proxy_type(value)
+    proxy.owner = owner
+    proxy.validator = validator
+    proxy.field_name = field_name
+    return proxy
@@ -0,0 +1,122 @@
+"""Sampling policy for the Sampled validator.
+
+Checking every item of a huge container on every assignment is not always
+affordable. A policy lets a validator check only a part of the work:
+    - 'every' checks only one of N values at all, the rest pass unchecked;
+    - 'head' and 'sample' check first 'head' items of a container plus
+      'sample' randomly chosen items out of the rest.
+Random choices come from a seeded generator, so a failure could be
+reproduced by replaying the same sequence of values.
+"""
+
+from collections import abc
+from itertools import islice
+from random import Random
+from threading import Lock
+
+
+def indexable(value):
+    """Tells whether items could be reached by position, like in lists,
+    tuples or numpy arrays.
+    """
+    if isinstance(value, abc.Sequence):
+        return True
+    if isinstance(value, (abc.Set, abc.Mapping)):
+        return False
+    return hasattr(type(value), "__getitem__")
+
+
+def picked(iterable, positions):
+    """Yields items at the sorted positions, walking the iterable once.
+    """
+    iterator = iter(iterable)
+    current = 0
+    for position in positions:
+        yield next(islice(iterator, position - current, None))
+        current = position + 1
+
+
+class Sampler:
+    """Picks what to check and keeps track of how much was checked.
+    """
+
+    def __init__(self, head=None, sample=0, every=1, seed=0):
+        self.head = head
+        self.sample = sample
+        self.every = every
+        self.seed = seed
+        self.random = Random(seed)
+        self.lock = Lock()
+        self.checks = 0
+        self.skipped = 0
+        self.partial = 0
+        self.failures = 0
+
+    def __reduce__(self):
+        # copies start from scratch, locks are not copyable anyway
+        return type(self), (self.head, self.sample, self.every, self.seed)
+
+    def skip(self):
+        """Tells whether the current value should not be checked at all.
+        """
+        with self.lock:
+            self.checks += 1
+            if (self.checks - 1) % self.every:
+                self.skipped += 1
+                return True
+            return False
+
+    def rows(self, value, mapping):
+        """Returns items of the container to be checked, the items are
+        (key, value) pairs for mappings. None means all of them.
+        """
+        if self.head is None and not self.sample:
+            return None
+        head = self.head or 0
+        try:
+            size = len(value)
+        except TypeError:
+            # iterators lose every item pulled out of them, so they are left
+            # to the validator as is, e.g. lazy containers check items on
+            # their way out anyway
+            return None
+        if size <= head + self.sample:
+            return None
+
+        with self.lock:
+            self.partial += 1
+            if mapping:
+                rows = list(islice(value.items(), head))
+            else:
+                rows = list(islice(value, head))
+            if self.sample:
+                positions = self.random.sample(range(head, size), self.sample)
+                if indexable(value):
+                    rows.extend(value[position] for position in positions)
+                else:
+                    # sets and mappings could only be walked up to the last
+                    # picked item, which is still nothing next to checking,
+                    # and nothing gets copied on the way
+                    items = picked(value, sorted(positions))
+                    if mapping:
+                        items = ((key, value[key]) for key in items)
+                    rows.extend(items)
+        return rows
+
+    def failed(self):
+        with self.lock:
+            self.failures += 1
+
+    def statistics(self):
+        return {
+            "policy": {
+                "head": self.head,
+                "sample": self.sample,
+                "every": self.every,
+                "seed": self.seed,
+            },
+            "checks": self.checks,
+            "skipped": self.skipped,
+            "partial": self.partial,
+            "failures": self.failures,
+        }
@@ -0,0 +1,132 @@
+"""Verdict caches for type checks.
+
+isinstance against an ABC (like abc.Iterable, the default container type
+of Container) or a tuple of types costs several times more than a dict
+lookup, and it is run for every item of a container. Yet, the verdict only
+depends on the type of the value, so it is remembered per type:
+    - positive verdicts are kept for good, since ABCs could only gain
+      subclasses, registrations are never taken back;
+    - negative verdicts are kept along with abc.get_cache_token() of the
+      time they were given, and are dropped once some ABC registers a new
+      subclass.
+Caches are shared by checks against the same types and dropped once they
+grow over SIZE entries. Types with a metaclass of their own, which could
+look at the value itself in __instancecheck__ (like runtime checkable
+protocols), are not cached at all, as well as objects faking their
+__class__. SubclassOf is cached in the same way, keyed by the class itself.
+
+Items of containers are mostly of one or two types, so Container(InstanceOf(T))
+and Mapping(InstanceOf(K), InstanceOf(V)) first collect the set of types of
+the items in a single pass of C code, see all_of_types, and only look at
+the items one by one if some of the types do not fit.
+"""
+
+from abc import ABCMeta, get_cache_token
+from collections import Counter, OrderedDict, defaultdict, deque
+from threading import Lock
+
+
+SIZE = 1024
+CACHES = {}
+LOCK = Lock()
+
+# containers, that are iterated over in C and give the same items each time
+HOMOGENEOUS_CONTAINERS = frozenset([list, tuple, set, frozenset, dict, deque])
+HOMOGENEOUS_MAPPINGS = frozenset([dict, OrderedDict, defaultdict, Counter])
+# smaller containers are checked item by item faster
+HOMOGENEOUS_SIZE = 32
+
+
+def type_based(types):
+    """Tells whether isinstance against the types is decided by the type of
+    the value alone.
+    """
+    return all(
+        type(checked).__instancecheck__ in (
+            type.__instancecheck__, ABCMeta.__instancecheck__
+        ) and
+        type(checked).__subclasscheck__ in (
+            type.__subclasscheck__, ABCMeta.__subclasscheck__
+        )
+        for checked in types
+    )
+
+
+def worth_caching(types):
+    """Single concrete type is checked by isinstance faster than by a dict
+    lookup, it is tuples and ABCs that are worth caching.
+    """
+    return type_based(types) and (
+        len(types) > 1 or
+        any(isinstance(checked, ABCMeta) for checked in types)
+    )
+
+
+class TypeVerdicts:
+    """Remembers which types pass the check. 'accepted' holds the types,
+    that do, so that compiled code could look them up on its own, misses
+    and negative verdicts go through 'check'. With subclass=True the values
+    are classes themselves, checked with issubclass, 'check' does it all.
+    """
+
+    def __init__(self, types, subclass=False):
+        self.types = types
+        self.subclass = subclass
+        self.accepted = {}
+        self.rejected = (get_cache_token(), {})
+
+    def check(self, value):
+        if self.subclass:
+            try:
+                if value in self.accepted:
+                    return True
+            except TypeError:
+                # classes with a metaclass, that is not hashable
+                return issubclass(value, self.types)
+            key = value
+        else:
+            key = type(value)
+        # negative verdicts are kept in a dict that belongs to the token,
+        # so they are never mixed up with verdicts given after registration
+        token = get_cache_token()
+        rejected_token, rejected = self.rejected
+        if rejected_token != token:
+            rejected = {}
+            self.rejected = token, rejected
+        elif key in rejected:
+            return False
+
+        if self.subclass:
+            verdict = issubclass(value, self.types)
+        else:
+            verdict = isinstance(value, self.types)
+            if value.__class__ is not key:
+                return verdict
+        known = self.accepted if verdict else rejected
+        if len(known) >= SIZE:
+            known.clear()
+        known[key] = True
+        return verdict
+
+
+def verdicts(types, subclass=False):
+    """Returns the cache for the types, shared by all the checks against
+    the same types.
+    """
+    key = types, subclass
+    with LOCK:
+        cache = CACHES.get(key)
+        if cache is None:
+            cache = CACHES[key] = TypeVerdicts(types, subclass)
+        return cache
+
+
+def all_of_types(items, types):
+    """Tells whether all the items are instances of the types, looking at
+    each distinct type of the items just once. False means, that it is up
+    to the item by item check to tell, since objects could fake __class__.
+    """
+    for item_type in set(map(type, items)):
+        if not issubclass(item_type, types):
+            return False
+    return True